@@ -19,7 +19,8 @@ from pathlib import Path
 import websockets
 
 from shared.singleton_guard import ensure_single_instance
-from shared.base_service import init_v9
+from shared.http_session import HttpSessionMixin
+from shared.base_service import init_v9, json_loads
 
 log = logging.getLogger("camera_service")
 logging.basicConfig(level=logging.INFO,
@@ -32,7 +33,7 @@ EZVIZ_APP_SECRET = os.getenv("EXO_EZVIZ_APP_SECRET", "")
 EZVIZ_ACCESS_TOKEN = os.getenv("EXO_EZVIZ_TOKEN", "")
 
 
-class CameraService:
+class CameraService(HttpSessionMixin):
     """Connecteur caméras EZVIZ."""
 
     def __init__(self) -> None:
@@ -54,15 +55,15 @@ class CameraService:
             form_data = {"accessToken": self._access_token}
             if data:
                 form_data.update(data)
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data=form_data,
-                                        timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                    if resp.status == 200:
-                        result = await resp.json()
-                        if result.get("code") == "200":
-                            return result.get("data")
-                    log.warning("EZVIZ %s → %d", endpoint, resp.status)
-                    return None
+            session = await self._get_session()
+            async with session.post(url, data=form_data,
+                                    timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                if resp.status == 200:
+                    result = await resp.json(loads=json_loads)
+                    if result.get("code") == "200":
+                        return result.get("data")
+                log.warning("EZVIZ %s → %d", endpoint, resp.status)
+                return None
         except Exception as e:
             log.error("EZVIZ error: %s", e)
             return None
@@ -219,7 +220,10 @@ async def main() -> None:
         ping_interval=None, ping_timeout=None,
     )
     log.info("CameraService on ws://%s:%d", args.host, args.port)
-    await asyncio.Future()
+    try:
+        await asyncio.Future()
+    finally:
+        await svc.close()
 
 
 if __name__ == "__main__":
@@ -22,7 +22,8 @@ import aiohttp
 import websockets
 
 from shared.singleton_guard import ensure_single_instance
-from shared.base_service import init_v9
+from shared.http_session import HttpSessionMixin
+from shared.base_service import init_v9, json_loads
 
 log = logging.getLogger("domotic_service")
 logging.basicConfig(level=logging.INFO,
@@ -34,8 +35,60 @@ PORT = 8785
 HA_URL = os.getenv("EXO_HA_URL", "")         # e.g. http://homeassistant.local:8123
 HA_TOKEN = os.getenv("EXO_HA_TOKEN", "")      # Long-lived access token
 
+# Domaine HA → type EXO. Table de module : _ha_entity_to_device() est appelé
+# pour chaque entité de /api/states, inutile de reconstruire le dict à chaque fois.
+_HA_DOMAIN_TO_TYPE = {
+    "light": "light",
+    "switch": "plug",
+    "camera": "camera",
+    "media_player": "speaker",
+    "climate": "heater",
+    "sensor": "sensor",
+    "cover": "unknown",
+}
+
+# Vocabulaire appareil de la NLU regex (nlu_server._DEVICES) → domaine HA.
+# Seuls les domaines pilotables par turn_on/turn_off sont listés.
+_NLU_DEVICE_TO_DOMAIN = {
+    "lumière": "light",
+    "lampe": "light",
+    "chauffage": "climate",
+    "climatisation": "climate",
+    "clim": "climate",
+    "télé": "media_player",
+    "tv": "media_player",
+}
+
+# Seuls ces verbes (toutes formes : allume, allumer, allumez, éteins,
+# éteindre…) déclenchent une action sans LLM ; « baisse », « monte »,
+# « active »… restent au LLM (variation, ambiguïté sur l'appareil).
+_EXPLICIT_VERB_PREFIXES = (("allum", "on"), ("étein", "off"), ("éteign", "off"))
+
+
+def _explicit_action(verb: str) -> str | None:
+    for prefix, action in _EXPLICIT_VERB_PREFIXES:
+        if verb.startswith(prefix):
+            return action
+    return None
+
+# Alias explicites "pièce/appareil" → entity_id (JSON), prioritaires sur la
+# recherche par friendly_name. Ex. {"cuisine/lumière": "light.kitchen_main"}
+ALIASES_FILE = os.getenv("EXO_DOMOTIC_ALIASES", "")
+
+
+def _load_aliases(path: str) -> dict[str, str]:
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        log.warning("Alias domotique illisibles (%s) : %s", path, e)
+        return {}
+    return {str(k).lower(): str(v) for k, v in data.items()}
+
 
-class DomoticService:
+class DomoticService(HttpSessionMixin):
     """Couche d'abstraction domotique (Home Assistant ou direct)."""
 
     def __init__(self) -> None:
@@ -43,19 +96,8 @@ class DomoticService:
         self._ha_token = HA_TOKEN
         self._cache: dict[str, dict] = {}  # entity_id → state dict
         self._areas: list[dict] = []
-        self._session: aiohttp.ClientSession | None = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Return persistent HTTP session, creating it on first use."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
-
-    async def close(self) -> None:
-        """Release HTTP session resources."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        self._aliases = _load_aliases(ALIASES_FILE)
+        self._resolved: dict[str, str] = {}  # "pièce/appareil" → entity_id
 
     @property
     def has_ha(self) -> bool:
@@ -75,7 +117,7 @@ class DomoticService:
             session = await self._get_session()
             async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await resp.json(loads=json_loads)
                 log.warning("HA GET %s → %d", endpoint, resp.status)
                 return None
         except Exception as e:
@@ -95,7 +137,7 @@ class DomoticService:
             async with session.post(url, headers=headers, json=data,
                                     timeout=aiohttp.ClientTimeout(total=10)) as resp:
                 if resp.status in (200, 201):
-                    return await resp.json()
+                    return await resp.json(loads=json_loads)
                 log.warning("HA POST %s → %d", endpoint, resp.status)
                 return None
         except Exception as e:
@@ -121,16 +163,7 @@ class DomoticService:
 
         # Determine type
         domain = eid.split(".")[0] if "." in eid else ""
-        type_map = {
-            "light": "light",
-            "switch": "plug",
-            "camera": "camera",
-            "media_player": "speaker",
-            "climate": "heater",
-            "sensor": "sensor",
-            "cover": "unknown",
-        }
-        dtype = type_map.get(domain, "unknown")
+        dtype = _HA_DOMAIN_TO_TYPE.get(domain, "unknown")
 
         # Capabilities
         caps = ["on_off"]
@@ -183,6 +216,7 @@ class DomoticService:
         if self.has_ha:
             states = await self._ha_get("states")
             if states:
+                self._resolved.clear()
                 devices = []
                 for entity in states:
                     eid = entity.get("entity_id", "")
@@ -262,12 +296,61 @@ class DomoticService:
         payload = cmd_map.get(command, params)
         return await self.set_state(device_id, payload)
 
+    async def resolve_device(self, room: str, device: str) -> str | None:
+        """Résout les entités NLU (pièce, appareil) en entity_id HA.
+
+        Permet d'exécuter « allume la lumière de la cuisine » directement
+        depuis la sortie de la NLU regex, sans aller-retour LLM.
+        """
+        key = f"{room}/{device}".lower()
+        if key in self._aliases:
+            return self._aliases[key]
+        if key in self._resolved:
+            return self._resolved[key]
+        domain = _NLU_DEVICE_TO_DOMAIN.get(device.lower())
+        if not domain:
+            return None
+        if not self._cache:
+            await self.list_devices()
+        room_l = room.lower()
+        matches = []
+        for eid, entity in self._cache.items():
+            if not eid.startswith(domain + "."):
+                continue
+            attrs = entity.get("attributes", {})
+            name = attrs.get("friendly_name", "").lower()
+            if not room_l or room_l in name or room_l in eid.lower() \
+                    or room_l == str(attrs.get("area_id", "")).lower():
+                matches.append(eid)
+        # Ambiguïté (plusieurs lampes dans la pièce, ou pas de pièce) :
+        # on laisse le LLM trancher.
+        if len(matches) != 1:
+            return None
+        self._resolved[key] = matches[0]
+        return matches[0]
+
+    async def apply_intent(self, entities: dict) -> dict:
+        """Applique une intention home_control (entités de la NLU regex).
+
+        N'agit que sur un « allume »/« éteins » explicite ; sinon renvoie
+        handled=False et l'appelant laisse le LLM décider.
+        """
+        action = _explicit_action(entities.get("verb", ""))
+        if action is None or action != entities.get("action"):
+            return {"ok": False, "handled": False, "error": "Action non gérée localement"}
+        eid = await self.resolve_device(entities.get("room", ""),
+                                        entities.get("device", ""))
+        if not eid:
+            return {"ok": False, "handled": False, "error": "Appareil introuvable"}
+        result = await self.apply_command(eid, f"turn_{action}")
+        return {**result, "handled": True, "device_id": f"ha:{eid}"}
+
     # ── v2 additions ──────────────────────────────────
 
     def capabilities(self) -> list[str]:
         """Capacités du service."""
         return ["list_devices", "get_state", "set_state", "apply_command",
-                "list_areas", "capabilities", "metadata"]
+                "apply_intent", "list_areas", "capabilities", "metadata"]
 
     def metadata(self) -> dict:
         """Métadonnées du service."""
@@ -326,6 +409,10 @@ async def handle_client(ws, svc: DomoticService) -> None:
                 )
                 await ws.send(json.dumps(result))
 
+            elif action == "apply_intent":
+                result = await svc.apply_intent(params.get("entities", {}))
+                await ws.send(json.dumps(result))
+
             elif action == "list_areas":
                 areas = await svc.list_areas()
                 await ws.send(json.dumps({"ok": True, "data": {"rooms": areas}}))
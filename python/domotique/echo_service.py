@@ -20,6 +20,7 @@ from pathlib import Path
 import websockets
 
 from shared.singleton_guard import ensure_single_instance
+from shared.http_session import HttpSessionMixin
 from shared.base_service import init_v9
 
 log = logging.getLogger("echo_service")
@@ -35,7 +36,7 @@ ECHO_DEVICES_FILE = os.getenv(
 )
 
 
-class EchoService:
+class EchoService(HttpSessionMixin):
     """Connecteur enceintes Amazon Echo / Alexa."""
 
     def __init__(self) -> None:
@@ -96,15 +97,15 @@ class EchoService:
         try:
             import aiohttp
             url = f"http://{ip}:8091/alexa/tts"
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json={"text": text, "lang": lang},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        return {"ok": True, "spoken": text}
-                    return {"ok": False, "error": f"HTTP {resp.status}"}
+            session = await self._get_session()
+            async with session.post(
+                url,
+                json={"text": text, "lang": lang},
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status == 200:
+                    return {"ok": True, "spoken": text}
+                return {"ok": False, "error": f"HTTP {resp.status}"}
         except Exception as e:
             log.warning("Echo TTS fallback (no local API): %s", e)
             return {"ok": False, "error": "Impossible de contacter l'API locale Echo"}
@@ -241,7 +242,10 @@ async def main() -> None:
         ping_interval=None, ping_timeout=None,
     )
     log.info("EchoService on ws://%s:%d", args.host, args.port)
-    await asyncio.Future()
+    try:
+        await asyncio.Future()
+    finally:
+        await svc.close()
 
 
 if __name__ == "__main__":
@@ -38,6 +38,9 @@ class EventManager:
         self._running = False
         self._poll_task: asyncio.Task | None = None
         self._poll_fn: Callable[[str], Awaitable[dict | None]] | None = None
+        # Réveille la boucle de polling quand un intervalle change (sinon
+        # elle dort jusqu'à la prochaine échéance calculée).
+        self._poll_wakeup = asyncio.Event()
         self._event_count = 0
         self._last_events: list[dict] = []
         self._max_history = 200
@@ -123,6 +126,7 @@ class EventManager:
             self._min_poll_interval,
             min(self._max_poll_interval, interval),
         )
+        self._poll_wakeup.set()
 
     async def start_polling(self, device_ids: list[str] | None = None) -> None:
         """Démarrer le polling intelligent."""
@@ -172,7 +176,22 @@ class EventManager:
                     except Exception as e:
                         log.warning("Poll error for %s: %s", device_id, e)
 
-            await asyncio.sleep(1.0)
+            # Sommeil jusqu'à la prochaine échéance (ou un changement
+            # d'intervalle) au lieu d'un réveil fixe chaque seconde : les
+            # intervalles vont de 5 à 60 s.
+            now = time.monotonic()
+            delay = min(
+                (last_poll.get(did, 0) + iv - now
+                 for did, iv in self._poll_intervals.items()),
+                default=None,
+            )
+            self._poll_wakeup.clear()
+            if delay is not None and delay <= 0:
+                continue
+            try:
+                await asyncio.wait_for(self._poll_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
 
     def _adapt_poll_interval(self, device_id: str, *, changed: bool) -> None:
         """Adapter l'intervalle de polling selon l'activité."""
@@ -184,6 +203,7 @@ class EventManager:
             # Device calme → polling plus lent
             new = min(self._max_poll_interval, current * 1.2)
         self._poll_intervals[device_id] = new
+        self._poll_wakeup.set()
 
     # ── API ───────────────────────────────────────────
 
@@ -60,6 +60,7 @@ class HomeGraphManager:
             "echo":     os.getenv("EXO_ECHO_URL", "ws://localhost:8789"),
             "network":  os.getenv("EXO_NETWORK_URL", "ws://localhost:8790"),
         }
+        self._nlu_url = os.getenv("EXO_NLU_URL", "ws://localhost:8772")
         # v2 modules
         self._cache = DomoticCache(default_ttl=30.0)
         self._events = EventManager()
@@ -380,22 +381,51 @@ class HomeGraphManager:
         url = self._connector_urls.get(name)
         if not url:
             return None
+        msg = {"action": action}
+        if params:
+            msg["params"] = params
         try:
-            async with websockets.connect(
-                url, open_timeout=CONNECTOR_TIMEOUT
-            ) as ws:
-                # Consume ready message
-                await asyncio.wait_for(ws.recv(), timeout=5)
-                msg = {"action": action}
-                if params:
-                    msg["params"] = params
-                await ws.send(json.dumps(msg))
-                raw = await asyncio.wait_for(ws.recv(), timeout=CONNECTOR_TIMEOUT)
-                return json.loads(raw)
+            return await self._ws_request(url, msg)
         except Exception as e:
             log.warning("Connector %s (%s) unreachable: %s", name, action, e)
             return None
 
+    async def _ws_request(self, url: str, msg: dict) -> dict:
+        """Un aller-retour WebSocket (message ready consommé)."""
+        async with websockets.connect(
+            url, open_timeout=CONNECTOR_TIMEOUT
+        ) as ws:
+            # Consume ready message
+            await asyncio.wait_for(ws.recv(), timeout=5)
+            await ws.send(json.dumps(msg))
+            raw = await asyncio.wait_for(ws.recv(), timeout=CONNECTOR_TIMEOUT)
+            return json.loads(raw)
+
+    async def _classify_text(self, text: str) -> dict | None:
+        """Classification regex par le service NLU (texte brut du fast-path)."""
+        try:
+            return await self._ws_request(
+                self._nlu_url, {"action": "classify", "text": text})
+        except Exception as e:
+            log.warning("NLU unreachable: %s", e)
+            return None
+
+    async def apply_text_intent(self, text: str) -> dict | None:
+        """Exécute « allume la lumière de la cuisine » sans passer par le LLM.
+
+        NLU regex -> apply_intent du service domotique. Retourne None si
+        l'intention n'est pas home_control ou si le service ne la gère pas
+        (handled=False) : l'appelant garde alors son chemin habituel.
+        """
+        nlu = await self._classify_text(text)
+        if not nlu or nlu.get("intent") != "home_control":
+            return None
+        resp = await self._query_connector(
+            "domotic", "apply_intent", {"entities": nlu.get("entities", {})})
+        if not resp or not resp.get("handled"):
+            return None
+        return resp
+
     async def refresh_all(self) -> dict:
         """Refresh from all connectors in parallel."""
         results = {}
@@ -555,6 +585,18 @@ async def handle_client(ws, hg: HomeGraphManager) -> None:
                 await ws.send(json.dumps({"ok": True, "data": {"links": links}}))
 
             elif action == "domotic_action":
+                # Fast-path vocal : texte brut -> NLU -> apply_intent, puis
+                # résolution par cible si le service ne l'a pas géré.
+                text = params.get("text", "")
+                fast = await hg.apply_text_intent(text) if text else None
+                if fast is not None:
+                    await ws.send(json.dumps({
+                        "ok": bool(fast.get("ok")),
+                        "data": {"results": [{"device": fast.get("device_id", ""), **fast}],
+                                 "count": 1},
+                    }))
+                    continue
+
                 # Agent integration: unified action endpoint
                 target = params.get("target", "")
                 cmd = params.get("command", params.get("action", ""))
@@ -568,10 +610,12 @@ async def handle_client(ws, hg: HomeGraphManager) -> None:
                     found = hg.find_device_by_name(target)
                     devices = [d["id_exo"] for d in found]
 
-                results = []
-                for did in devices:
-                    r = await hg.apply_command(did, cmd, cmd_params)
-                    results.append({"device": did, **r})
+                # Une connexion connecteur par device : on les pilote en
+                # parallèle ("éteins le salon" -> N lampes en ~1 RTT).
+                responses = await asyncio.gather(
+                    *(hg.apply_command(did, cmd, cmd_params) for did in devices)
+                )
+                results = [{"device": did, **r} for did, r in zip(devices, responses)]
                 await ws.send(json.dumps({
                     "ok": len(results) > 0,
                     "data": {"results": results, "count": len(results)},
@@ -20,7 +20,8 @@ from pathlib import Path
 import websockets
 
 from shared.singleton_guard import ensure_single_instance
-from shared.base_service import init_v9
+from shared.http_session import HttpSessionMixin
+from shared.base_service import init_v9, json_loads
 
 log = logging.getLogger("samsung_service")
 logging.basicConfig(level=logging.INFO,
@@ -33,7 +34,7 @@ ST_TOKEN = os.getenv("EXO_SMARTTHINGS_TOKEN", "")
 ST_API = "https://api.smartthings.com/v1"
 
 
-class SamsungService:
+class SamsungService(HttpSessionMixin):
     """Connecteur appareils Samsung (TV, soundbar, etc.)."""
 
     def __init__(self) -> None:
@@ -51,12 +52,12 @@ class SamsungService:
             import aiohttp
             url = f"{ST_API}/{endpoint}"
             headers = {"Authorization": f"Bearer {self._token}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers,
-                                       timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    return None
+            session = await self._get_session()
+            async with session.get(url, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status == 200:
+                    return await resp.json(loads=json_loads)
+                return None
         except Exception as e:
             log.error("SmartThings error: %s", e)
             return None
@@ -71,12 +72,12 @@ class SamsungService:
                 "Authorization": f"Bearer {self._token}",
                 "Content-Type": "application/json",
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=data,
-                                        timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status in (200, 201):
-                        return await resp.json()
-                    return None
+            session = await self._get_session()
+            async with session.post(url, headers=headers, json=data,
+                                    timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status in (200, 201):
+                    return await resp.json(loads=json_loads)
+                return None
         except Exception as e:
             log.error("SmartThings POST error: %s", e)
             return None
@@ -286,7 +287,10 @@ async def main() -> None:
         ping_interval=None, ping_timeout=None,
     )
     log.info("SamsungService on ws://%s:%d", args.host, args.port)
-    await asyncio.Future()
+    try:
+        await asyncio.Future()
+    finally:
+        await svc.close()
 
 
 if __name__ == "__main__":
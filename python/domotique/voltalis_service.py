@@ -24,7 +24,8 @@ from pathlib import Path
 import websockets
 
 from shared.singleton_guard import ensure_single_instance
-from shared.base_service import init_v9
+from shared.http_session import HttpSessionMixin
+from shared.base_service import init_v9, json_loads
 
 log = logging.getLogger("voltalis_service")
 logging.basicConfig(level=logging.INFO,
@@ -37,7 +38,7 @@ VOLTALIS_PASS = os.getenv("EXO_VOLTALIS_PASS", "")
 VOLTALIS_API = "https://api.voltalis.com"
 
 
-class VoltalisService:
+class VoltalisService(HttpSessionMixin):
     """Connecteur radiateurs Voltalis éco-pilotés."""
 
     def __init__(self) -> None:
@@ -59,17 +60,17 @@ class VoltalisService:
             return None
         try:
             import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{VOLTALIS_API}/auth/login",
-                    json={"email": self._email, "password": self._password},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        self._token = data.get("token", "")
-                        self._token_expiry = time.time() + 3500
-                        return self._token
+            session = await self._get_session()
+            async with session.post(
+                f"{VOLTALIS_API}/auth/login",
+                json={"email": self._email, "password": self._password},
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json(loads=json_loads)
+                    self._token = data.get("token", "")
+                    self._token_expiry = time.time() + 3500
+                    return self._token
         except Exception as e:
             log.error("Voltalis auth error: %s", e)
         return None
@@ -81,14 +82,14 @@ class VoltalisService:
         try:
             import aiohttp
             headers = {"Authorization": f"Bearer {token}"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{VOLTALIS_API}/{endpoint}",
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
+            session = await self._get_session()
+            async with session.get(
+                f"{VOLTALIS_API}/{endpoint}",
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status == 200:
+                    return await resp.json(loads=json_loads)
         except Exception as e:
             log.error("Voltalis GET error: %s", e)
         return None
@@ -103,15 +104,15 @@ class VoltalisService:
                 "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json",
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{VOLTALIS_API}/{endpoint}",
-                    headers=headers,
-                    json=data,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status in (200, 201):
-                        return await resp.json()
+            session = await self._get_session()
+            async with session.post(
+                f"{VOLTALIS_API}/{endpoint}",
+                headers=headers,
+                json=data,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status in (200, 201):
+                    return await resp.json(loads=json_loads)
         except Exception as e:
             log.error("Voltalis POST error: %s", e)
         return None
@@ -298,7 +299,10 @@ async def main() -> None:
         ping_interval=None, ping_timeout=None,
     )
     log.info("VoltalisService on ws://%s:%d", args.host, args.port)
-    await asyncio.Future()
+    try:
+        await asyncio.Future()
+    finally:
+        await svc.close()
 
 
 if __name__ == "__main__":
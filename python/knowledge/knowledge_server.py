@@ -35,7 +35,7 @@ except ImportError:
 
 # Singleton guard
 from shared.singleton_guard import ensure_single_instance
-from shared.base_service import init_v9
+from shared.base_service import init_v9, json_loads
 
 
 # --- Logging EXO centralisé (identique C++) ---
@@ -73,6 +73,10 @@ HEADERS = {
     "Accept": "application/json",
 }
 
+# Session HTTP partagée (créée dans main) : les requêtes Wikipedia
+# réutilisent la connexion TLS keep-alive au lieu d'un handshake par appel.
+_http_session: aiohttp.ClientSession | None = None
+
 
 async def wikipedia_search(
     session: aiohttp.ClientSession,
@@ -92,7 +96,7 @@ async def wikipedia_search(
         async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=8)) as resp:
             if resp.status != 200:
                 return None
-            data = await resp.json()
+            data = await resp.json(loads=json_loads)
             results = data.get("query", {}).get("search", [])
             if results:
                 return results[0]["title"]
@@ -115,7 +119,7 @@ async def wikipedia_summary(
             if resp.status != 200:
                 log.warning("Wikipedia API HTTP %d pour %s", resp.status, title)
                 return None
-            data = await resp.json()
+            data = await resp.json(loads=json_loads)
     except (asyncio.TimeoutError, aiohttp.ClientError) as exc:
         log.warning("Wikipedia API error: %s", exc)
         return None
@@ -135,28 +139,38 @@ async def wikipedia_summary(
 
 async def get_summary(topic: str, lang: str = "fr") -> dict[str, Any]:
     """Point d'entrée : recherche + résumé Wikipedia."""
+    if _http_session is not None:
+        return await _get_summary(_http_session, topic, lang)
     async with aiohttp.ClientSession(headers=HEADERS) as session:
-        # D'abord essayer directement le titre
-        result = await wikipedia_summary(session, topic, lang)
+        return await _get_summary(session, topic, lang)
+
+
+async def _get_summary(
+    session: aiohttp.ClientSession,
+    topic: str,
+    lang: str,
+) -> dict[str, Any]:
+    # D'abord essayer directement le titre
+    result = await wikipedia_summary(session, topic, lang)
+    if result:
+        return result
+
+    # Sinon, rechercher le bon titre
+    title = await wikipedia_search(session, topic, lang)
+    if title:
+        result = await wikipedia_summary(session, title, lang)
         if result:
             return result
 
-        # Sinon, rechercher le bon titre
-        title = await wikipedia_search(session, topic, lang)
+    # Fallback en anglais si le français ne donne rien
+    if lang != "en":
+        title = await wikipedia_search(session, topic, "en")
         if title:
-            result = await wikipedia_summary(session, title, lang)
+            result = await wikipedia_summary(session, title, "en")
             if result:
+                result["note"] = "Résultat en anglais (article français non trouvé)"
                 return result
 
-        # Fallback en anglais si le français ne donne rien
-        if lang != "en":
-            title = await wikipedia_search(session, topic, "en")
-            if title:
-                result = await wikipedia_summary(session, title, "en")
-                if result:
-                    result["note"] = "Résultat en anglais (article français non trouvé)"
-                    return result
-
     return {"title": topic, "summary": f"Aucun article trouvé pour « {topic} ».", "url": ""}
 
 
@@ -213,15 +227,19 @@ async def handle_client(ws: Any) -> None:
 
 
 async def main() -> None:
-    global _v9
+    global _http_session, _v9
     ensure_single_instance(PORT, "knowledge_server")
     _v9 = init_v9("knowledge_server", PORT)
     log.info("Démarrage Knowledge Server sur le port %d", PORT)
 
-    async with websockets.serve(handle_client, "localhost", PORT,
-                                **_v9.ws_serve_kwargs()):
-        log.info("Knowledge Server prêt — ws://localhost:%d", PORT)
-        await asyncio.Future()
+    _http_session = aiohttp.ClientSession(headers=HEADERS)
+    try:
+        async with websockets.serve(handle_client, "localhost", PORT,
+                                    **_v9.ws_serve_kwargs()):
+            log.info("Knowledge Server prêt — ws://localhost:%d", PORT)
+            await asyncio.Future()
+    finally:
+        await _http_session.close()
 
 
 if __name__ == "__main__":
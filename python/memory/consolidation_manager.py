@@ -60,13 +60,16 @@ class ConsolidationManager:
         promoted = 0
         stm_entries = self._hierarchy.get_tier("stm")
 
+        moved: list[tuple[str, str]] = []
         for entry in stm_entries:
             if self._should_promote_stm(entry):
                 self._hierarchy.promote(entry.id, "mtm")
-                if self._vector:
-                    self._vector.delete(entry.id)
-                    self._vector.add(entry.id, entry.text, tier="mtm")
+                moved.append((entry.id, entry.text))
                 promoted += 1
+        if self._vector and moved:
+            # Un seul rebuild du tier source et un seul encodage du lot promu
+            self._vector.delete_many([eid for eid, _ in moved])
+            self._vector.add_many(moved, tier="mtm")
 
         self._last_stm_consolidation = time.time()
         self._metrics["stm_promoted"] += promoted
@@ -88,13 +91,16 @@ class ConsolidationManager:
         promoted = 0
         mtm_entries = self._hierarchy.get_tier("mtm")
 
+        moved: list[tuple[str, str]] = []
         for entry in mtm_entries:
             if self._should_promote_mtm(entry):
                 self._hierarchy.promote(entry.id, "ltm")
-                if self._vector:
-                    self._vector.delete(entry.id)
-                    self._vector.add(entry.id, entry.text, tier="ltm")
+                moved.append((entry.id, entry.text))
                 promoted += 1
+        if self._vector and moved:
+            # Un seul rebuild du tier source et un seul encodage du lot promu
+            self._vector.delete_many([eid for eid, _ in moved])
+            self._vector.add_many(moved, tier="ltm")
 
         self._last_mtm_consolidation = time.time()
         self._metrics["mtm_promoted"] += promoted
@@ -191,8 +197,9 @@ class ConsolidationManager:
 
             for entry_id in to_remove:
                 self._hierarchy.remove(entry_id)
-                self._vector.delete(entry_id)
                 merged += 1
+            if to_remove:
+                self._vector.delete_many(to_remove)
 
         self._metrics["merged"] += merged
         log.info("Merged %d similar entries", merged)
@@ -130,13 +130,14 @@ class MemoryManager:
         hierarchy_data = data.get("hierarchy", {})
         self.hierarchy.import_data(hierarchy_data)
 
-        # Reconstruire les index vectoriels
+        # Index vectoriels : réutilise les embeddings persistés si à jour,
+        # sinon ré-encode le tier
         for tier in ("stm", "mtm", "ltm"):
             entries = self.hierarchy.get_tier(tier)
             texts = [e.text for e in entries]
             ids = [e.id for e in entries]
             if texts and self.vector.available:
-                self.vector.rebuild_tier(tier, texts, ids)
+                self.vector.restore_tier(tier, texts, ids)
 
         # Faits
         facts_data = data.get("facts", [])
@@ -213,15 +214,63 @@ class MemoryManager:
             ttl_days: float = 0.0,
             tier: str = "stm") -> MemoryEntry | None:
         """Ajoute un souvenir. Retourne None si doublon."""
-        # Détection de doublon via vectoriel
-        if self.vector.available and self.vector.is_duplicate(text):
+        entry = self._new_entry(text, importance, tags, category, source,
+                                ttl_days, tier)
+        # VectorIndex.add détecte le doublon avec le même embedding que
+        # celui indexé (un seul passage encodeur par ajout)
+        if not self.vector.add(entry.id, text, tier=tier):
             log.info("Duplicate detected: %s", text[:60])
             return None
+        self.hierarchy.add(entry)
+        self._metrics["adds"] += 1
+
+        self.save()
+        log.info("Added [%s/%s]: %s", tier, category, text[:60])
+        return entry
 
-        entry_id = str(uuid.uuid4())
+    def add_many(self, items: list[dict]) -> list[MemoryEntry | None]:
+        """Ajoute plusieurs souvenirs (mêmes clés que ``add``) en un lot.
+
+        Un seul passage encodeur par tier (``VectorIndex.add_many_ids``,
+        doublons filtrés dans le lot et contre l'existant) et une seule
+        sauvegarde, au lieu d'encodage + écriture disque par souvenir.
+        Retourne une entrée par item, None pour un doublon ou un texte vide.
+        """
+        results: list[MemoryEntry | None] = [None] * len(items)
+        by_tier: dict[str, list[tuple[int, MemoryEntry]]] = {}
+        for i, item in enumerate(items):
+            text = item.get("text")
+            if not text:
+                continue
+            entry = self._new_entry(
+                text, item.get("importance", 0.5), item.get("tags"),
+                item.get("category", ""), item.get("source", "user"),
+                item.get("ttl_days", 0.0), item.get("tier", "stm"),
+            )
+            by_tier.setdefault(entry.tier, []).append((i, entry))
+
+        for tier, pending in by_tier.items():
+            accepted = set(self.vector.add_many_ids(
+                [(e.id, e.text) for _, e in pending], tier=tier))
+            for i, entry in pending:
+                if entry.id in accepted:
+                    self.hierarchy.add(entry)
+                    results[i] = entry
+                    self._metrics["adds"] += 1
+
+        added = sum(1 for e in results if e is not None)
+        if added:
+            self.save()
+        log.info("Added batch: %d/%d", added, len(items))
+        return results
+
+    @staticmethod
+    def _new_entry(text: str, importance: float, tags: list[str] | None,
+                   category: str, source: str, ttl_days: float,
+                   tier: str) -> MemoryEntry:
         ttl_seconds = ttl_days * 86400 if ttl_days > 0 else 0
-        entry = MemoryEntry(
-            id=entry_id,
+        return MemoryEntry(
+            id=str(uuid.uuid4()),
             text=text,
             importance=importance,
             tags=tags or [],
@@ -231,14 +280,6 @@ class MemoryManager:
             tier=tier,
         )
 
-        self.hierarchy.add(entry)
-        self.vector.add(entry_id, text, tier=tier)
-        self._metrics["adds"] += 1
-
-        self.save()
-        log.info("Added [%s/%s]: %s", tier, category, text[:60])
-        return entry
-
     def search(self, query: str, top_k: int = 5,
                tiers: list[str] | None = None) -> list[dict]:
         """Recherche sémantique avec scoring dynamique."""
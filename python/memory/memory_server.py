@@ -24,6 +24,7 @@ Port: 8771 (default)
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 try:
     import ujson as json  # v6.0 perf : 3-5x plus rapide que stdlib (audit perf)
 except ImportError:
@@ -39,6 +40,12 @@ from shared.base_service import init_v9, json_loads, json_dumps
 
 from memory.memory_manager import MemoryManager
 
+# Executor dédié : encodages SentenceTransformer et écritures FAISS ne font
+# plus la queue derrière les autres tâches de l'executor par défaut, et un
+# seul worker sérialise l'accès au MemoryManager (hiérarchie non thread-safe).
+_MEMORY_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="memory")
+
 
 # --- Logging EXO centralisé (identique C++) ---
 def _get_exo_logfile():
@@ -142,7 +149,7 @@ class MemorySession:
                     return
                 loop = asyncio.get_running_loop()
                 entry = await loop.run_in_executor(
-                    None,
+                    _MEMORY_EXECUTOR,
                     lambda: self.manager.add(
                         text=text,
                         importance=msg.get("importance", 0.5),
@@ -166,13 +173,33 @@ class MemorySession:
                         "text": text[:80],
                     }))
 
+            elif msg_type == "add_many":
+                # Lot d'ajouts : un passage encodeur + une sauvegarde pour tout
+                # le lot (import, consolidation côté client…)
+                items = [it for it in msg.get("items", []) if isinstance(it, dict)]
+                if not items:
+                    return
+                loop = asyncio.get_running_loop()
+                entries = await loop.run_in_executor(
+                    _MEMORY_EXECUTOR, self.manager.add_many, items
+                )
+                await ws.send(json.dumps({
+                    "type": "added_many",
+                    "results": [
+                        {"id": e.id, "text": e.text, "tier": e.tier}
+                        if e else
+                        {"duplicate": True, "text": (it.get("text") or "")[:80]}
+                        for e, it in zip(entries, items)
+                    ],
+                }))
+
             elif msg_type == "search":
                 query = msg.get("query")
                 if not query:
                     return
                 loop = asyncio.get_running_loop()
                 results = await loop.run_in_executor(
-                    None,
+                    _MEMORY_EXECUTOR,
                     lambda: self.manager.search(
                         query=query,
                         top_k=msg.get("top_k", 5),
@@ -191,7 +218,7 @@ class MemorySession:
                     return
                 loop = asyncio.get_running_loop()
                 success = await loop.run_in_executor(
-                    None, self.manager.remove, entry_id
+                    _MEMORY_EXECUTOR, self.manager.remove, entry_id
                 )
                 await ws.send(json.dumps({
                     "type": "removed",
@@ -214,7 +241,9 @@ class MemorySession:
                 }))
 
             elif msg_type == "clear":
-                self.manager.clear()
+                # clear() reconstruit l'index FAISS et sauvegarde sur disque
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(_MEMORY_EXECUTOR, self.manager.clear)
                 await ws.send(json.dumps({"type": "cleared"}))
 
             elif msg_type == "stats":
@@ -228,7 +257,7 @@ class MemorySession:
             elif msg_type == "consolidate":
                 loop = asyncio.get_running_loop()
                 result = await loop.run_in_executor(
-                    None, self.manager.consolidate
+                    _MEMORY_EXECUTOR, self.manager.consolidate
                 )
                 await ws.send(json.dumps({
                     "type": "consolidated",
@@ -242,7 +271,7 @@ class MemorySession:
                     return
                 loop = asyncio.get_running_loop()
                 summaries = await loop.run_in_executor(
-                    None, self.manager.summarize_text, text
+                    _MEMORY_EXECUTOR, self.manager.summarize_text, text
                 )
                 await ws.send(json.dumps({
                     "type": "summary",
@@ -254,7 +283,10 @@ class MemorySession:
                 if not entry_id:
                     await ws.send(json.dumps({"type": "error", "message": "Champ 'id' manquant"}))
                     return
-                entry = self.manager.reinforce(entry_id, msg.get("boost", 0.1))
+                loop = asyncio.get_running_loop()
+                entry = await loop.run_in_executor(
+                    _MEMORY_EXECUTOR, self.manager.reinforce, entry_id, msg.get("boost", 0.1)
+                )
                 if entry:
                     await ws.send(json.dumps({
                         "type": "reinforced",
@@ -272,7 +304,10 @@ class MemorySession:
                 if not entry_id:
                     await ws.send(json.dumps({"type": "error", "message": "Champ 'id' manquant"}))
                     return
-                entry = self.manager.weaken(entry_id, msg.get("decay", 0.1))
+                loop = asyncio.get_running_loop()
+                entry = await loop.run_in_executor(
+                    _MEMORY_EXECUTOR, self.manager.weaken, entry_id, msg.get("decay", 0.1)
+                )
                 if entry:
                     await ws.send(json.dumps({
                         "type": "weakened",
@@ -290,7 +325,10 @@ class MemorySession:
                 if not text:
                     await ws.send(json.dumps({"type": "error", "message": "Champ 'text' manquant"}))
                     return
-                pairs = self.manager.detect_contradictions(text)
+                loop = asyncio.get_running_loop()
+                pairs = await loop.run_in_executor(
+                    _MEMORY_EXECUTOR, self.manager.detect_contradictions, text
+                )
                 await ws.send(json.dumps({
                     "type": "contradictions",
                     "pairs": pairs,
@@ -311,7 +349,10 @@ class MemorySession:
                 if not entry_id:
                     await ws.send(json.dumps({"type": "error", "message": "Champ 'id' manquant"}))
                     return
-                entry = self.manager.promote(entry_id, msg.get("target_tier", "mtm"))
+                loop = asyncio.get_running_loop()
+                entry = await loop.run_in_executor(
+                    _MEMORY_EXECUTOR, self.manager.promote, entry_id, msg.get("target_tier", "mtm")
+                )
                 if entry:
                     await ws.send(json.dumps({
                         "type": "promoted",
@@ -338,9 +379,13 @@ class MemorySession:
                 if not query:
                     await ws.send(json.dumps({"type": "error", "message": "Champ 'query' manquant"}))
                     return
-                context = self.manager.build_context(
-                    query=query,
-                    max_entries=msg.get("max_entries", 20),
+                loop = asyncio.get_running_loop()
+                context = await loop.run_in_executor(
+                    _MEMORY_EXECUTOR,
+                    lambda: self.manager.build_context(
+                        query=query,
+                        max_entries=msg.get("max_entries", 20),
+                    ),
                 )
                 await ws.send(json.dumps({
                     "type": "context",
@@ -472,9 +517,10 @@ async def main() -> None:
     except KeyboardInterrupt:
         pass
     finally:
-        manager.save()
         server.close()
         await server.wait_closed()
+        _MEMORY_EXECUTOR.shutdown(wait=True)
+        manager.save()
         logger.info("Memory server stopped")
 
 
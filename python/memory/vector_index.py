@@ -13,10 +13,12 @@ Résilience : timeouts 2s, 1 retry, fallback texte.
 
 from __future__ import annotations
 
+import json
 import logging
 import re
 import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -58,6 +60,7 @@ class VectorIndex:
 
     TIMEOUT = 2.0   # secondes
     MAX_RETRIES = 1
+    QUERY_CACHE_SIZE = 256
 
     def __init__(self, model_name: str | None = None,
                  data_dir: str | Path | None = None):
@@ -70,6 +73,13 @@ class VectorIndex:
         self._ids: dict[str, list[str]] = {t: [] for t in self.TIERS}
         self._available = False
         self._lock = threading.Lock()
+        # Ordre des IDs des indices lus sur disque (par tier) — permet de
+        # réutiliser les embeddings persistés au démarrage sans ré-encoder.
+        self._disk_ids: dict[str, list[str]] = {}
+        # Embeddings des requêtes récentes : les recherches de contexte
+        # reviennent souvent sur le même texte, l'encodeur (~10 ms CPU) est
+        # le coût dominant de search() devant la requête HNSW.
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
 
     @property
     def available(self) -> bool:
@@ -89,6 +99,9 @@ class VectorIndex:
             ST = _load_st()
             self._encoder = ST(self._model_name, device=device)
             self._dim = self._encoder.get_sentence_embedding_dimension()
+            # Premier encode à froid (tokenizer, noyaux torch) payé au
+            # démarrage plutôt que par la première recherche utilisateur.
+            self._encoder.encode(["warmup"], normalize_embeddings=True)
 
             faiss = _load_faiss()
             for tier in self.TIERS:
@@ -146,6 +159,19 @@ class VectorIndex:
             raise RuntimeError("Encoder not loaded")
         return self._encoder.encode(texts, normalize_embeddings=True).astype(np.float32)
 
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Encode une requête via le cache LRU (appelé avec lock acquis)."""
+        key = " ".join(query.split())
+        emb = self._query_cache.get(key)
+        if emb is not None:
+            self._query_cache.move_to_end(key)
+            return emb
+        emb = self.encode([key])
+        self._query_cache[key] = emb
+        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return emb
+
     # ── API principale ───────────────────────────────
 
     def add(self, entry_id: str, text: str, tier: str = "stm",
@@ -164,16 +190,71 @@ class VectorIndex:
                 self._ids[tier].append(entry_id)
                 return True
 
-            # Vérifier doublon (sans lock car déjà acquis)
-            if self._is_duplicate_unlocked(text):
+            # Un seul encodage, réutilisé pour le test de doublon et l'ajout
+            embedding = self.encode([text])
+            if self._is_duplicate_emb_unlocked(embedding):
                 return False
 
-            embedding = self.encode([text])
             self._indices[tier].add(embedding)
             self._texts[tier].append(text)
             self._ids[tier].append(entry_id)
             return True
 
+    def add_many(self, entries: list[tuple[str, str]],
+                 tier: str = "stm") -> int:
+        """Ajoute plusieurs (entry_id, text) à un tier en un seul lot.
+
+        Un seul appel encodeur et un seul ``index.add`` pour tout le lot
+        (au lieu d'un passage SentenceTransformer par entrée). Les doublons
+        — contre l'index existant ou à l'intérieur du lot — sont ignorés
+        comme dans ``add``.
+
+        Returns le nombre d'entrées effectivement ajoutées.
+        """
+        return len(self.add_many_ids(entries, tier))
+
+    def add_many_ids(self, entries: list[tuple[str, str]],
+                     tier: str = "stm") -> list[str]:
+        """Comme ``add_many`` mais retourne les IDs effectivement ajoutés."""
+        if tier not in self.TIERS:
+            tier = "stm"
+        if not entries:
+            return []
+
+        with self._lock:
+            if not self._available:
+                for entry_id, text in entries:
+                    self._texts[tier].append(text)
+                    self._ids[tier].append(entry_id)
+                return [entry_id for entry_id, _ in entries]
+
+            embeddings = self.encode([text for _, text in entries])
+
+            # Doublons contre l'existant : une recherche k=1 par tier pour tout le lot
+            keep = np.ones(len(entries), dtype=bool)
+            for t in self.TIERS:
+                idx = self._indices.get(t)
+                if idx and idx.ntotal > 0:
+                    scores, _ = idx.search(embeddings, 1)
+                    keep &= scores[:, 0] < self.DUPLICATE_THRESHOLD
+
+            # Doublons internes au lot (vecteurs normalisés → produit scalaire)
+            accepted: list[int] = []
+            for i in np.flatnonzero(keep):
+                if accepted and float(np.max(
+                        embeddings[accepted] @ embeddings[i])) >= self.DUPLICATE_THRESHOLD:
+                    continue
+                accepted.append(int(i))
+
+            if not accepted:
+                return []
+            self._indices[tier].add(np.ascontiguousarray(embeddings[accepted]))
+            for i in accepted:
+                entry_id, text = entries[i]
+                self._texts[tier].append(text)
+                self._ids[tier].append(entry_id)
+            return [entries[i][0] for i in accepted]
+
     def search(self, query: str, top_k: int = 5,
                tiers: list[str] | None = None) -> list[dict]:
         """Recherche sémantique multi-tier.
@@ -186,7 +267,7 @@ class VectorIndex:
             if not self._available:
                 return self._fallback_search(query, top_k, search_tiers)
 
-            query_emb = self.encode([query])
+            query_emb = self._encode_query(query)
             results = []
 
             # Poids par tier : LTM plus stable → léger boost
@@ -230,6 +311,24 @@ class VectorIndex:
                     return True
             return False
 
+    def delete_many(self, entry_ids) -> int:
+        """Supprime plusieurs IDs, un seul rebuild par tier touché."""
+        wanted = set(entry_ids)
+        removed = 0
+        with self._lock:
+            for tier in self.TIERS:
+                ids = self._ids[tier]
+                keep = [i for i, eid in enumerate(ids) if eid not in wanted]
+                if len(keep) == len(ids):
+                    continue
+                removed += len(ids) - len(keep)
+                texts = self._texts[tier]
+                self._ids[tier] = [ids[i] for i in keep]
+                self._texts[tier] = [texts[i] for i in keep]
+                if self._available:
+                    self._rebuild_tier_unlocked(tier)
+        return removed
+
     def is_duplicate(self, text: str) -> bool:
         """Vérifie si un texte très similaire existe déjà."""
         with self._lock:
@@ -243,7 +342,9 @@ class VectorIndex:
                     return True
             return False
 
-        emb = self.encode([text])
+        return self._is_duplicate_emb_unlocked(self.encode([text]))
+
+    def _is_duplicate_emb_unlocked(self, emb: np.ndarray) -> bool:
         for tier in self.TIERS:
             idx = self._indices.get(tier)
             if idx and idx.ntotal > 0:
@@ -261,6 +362,23 @@ class VectorIndex:
             self._ids[tier] = list(ids)
             self._rebuild_tier_unlocked(tier)
 
+    def restore_tier(self, tier: str, texts: list[str], ids: list[str]) -> None:
+        """Comme ``rebuild_tier`` mais réutilise l'index lu sur disque s'il
+        correspond exactement à ``ids`` (même ordre, même modèle) : aucun
+        passage encodeur au démarrage. Sinon, reconstruction complète.
+        """
+        with self._lock:
+            disk_ids = self._disk_ids.pop(tier, None)
+            self._texts[tier] = list(texts)
+            self._ids[tier] = list(ids)
+            idx = self._indices.get(tier)
+            if (self._available and disk_ids == self._ids[tier]
+                    and idx is not None and idx.ntotal == len(disk_ids)):
+                log.debug("VectorIndex %s: %d embeddings restored from disk",
+                          tier, idx.ntotal)
+                return
+            self._rebuild_tier_unlocked(tier)
+
     def _rebuild_tier(self, tier: str) -> None:
         """Reconstruit l'index FAISS d'un tier (thread-safe)."""
         with self._lock:
@@ -326,6 +444,10 @@ class VectorIndex:
                 if idx and idx.ntotal > 0:
                     faiss.write_index(
                         idx, str(self._data_dir / f"embeddings_{tier}.faiss"))
+                    (self._data_dir / f"embeddings_{tier}.ids.json").write_text(
+                        json.dumps({"model": self._model_name,
+                                    "ids": self._ids[tier]}),
+                        encoding="utf-8")
             log.debug("VectorIndex saved to %s", self._data_dir)
 
     def _load_from_disk(self) -> None:
@@ -339,6 +461,14 @@ class VectorIndex:
                 except Exception as e:
                     log.warning("Failed to load %s index: %s", tier, e)
                     self._indices[tier] = self._create_index()
+                    continue
+                ids_path = self._data_dir / f"embeddings_{tier}.ids.json"
+                try:
+                    meta = json.loads(ids_path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    continue
+                if meta.get("model") == self._model_name:
+                    self._disk_ids[tier] = list(meta.get("ids", []))
 
     # ── Stats ────────────────────────────────────────
 
@@ -30,6 +30,7 @@ import logging
 import re
 import sys
 import argparse
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from pathlib import Path
@@ -144,18 +145,57 @@ INTENTS = {
 #  Regex-based NLU engine (always available fallback)
 # ─────────────────────────────────────────────────────
 
+# Tables d'entités précalculées (v6.0 perf audit) : clés déjà en minuscules,
+# regex compilées une seule fois au chargement du module au lieu d'être
+# reconstruites à chaque appel de _extract_entities().
+_ROOMS = ("salon", "chambre", "cuisine", "bureau", "salle de bain",
+          "garage", "jardin", "terrasse", "entrée", "couloir")
+_DEVICES = ("lumière", "lampe", "volet", "store", "chauffage",
+            "ventilateur", "climatisation", "clim", "télé", "tv")
+_DURATION_RE = re.compile(r"(\d+)\s*(minute|min|seconde|sec|heure|h)\b")
+# Marche/arrêt distincts des variations : « baisse le chauffage » ne doit
+# pas devenir un turn_off. \b initial seulement : « désactive » ne matche
+# plus « activ », et les formes fléchies (allumer, allumez, éteindre…)
+# restent reconnues. Le groupe capture le verbe complet.
+_ACTION_ON_RE = re.compile(r"\b((?:allum|ouvr|activ)\w*)")
+_ACTION_OFF_RE = re.compile(r"\b((?:étein|éteign|ferm|désactiv)\w*)")
+_ACTION_UP_RE = re.compile(r"\b((?:mont(?!r)|augment)\w*)")  # pas « montre »
+_ACTION_DOWN_RE = re.compile(r"\b((?:baiss|diminu)\w*)")
+# Mémo des classifications : les commandes vocales se répètent beaucoup
+# (« allume la lumière du salon »…) -> texte identique, résultat identique.
+_CLASSIFY_MEMO_MAX = 256
+
+
 class RegexNLU:
     """Lightweight regex-based intent classifier for common commands."""
 
     def __init__(self):
         self._compiled = {}
+        # Sans re.IGNORECASE : classify() cherche dans `text.lower()` et tous
+        # les motifs sont en minuscules. Le flag désactivait l'optimisation de
+        # préfixe littéral de sre (~4x plus lent, surtout sur les phrases
+        # inconnues qui testent les 22 motifs). Une union unique "a|b|..." a
+        # été mesurée plus lente que les motifs séparés sous CPython.
         for intent, data in INTENTS.items():
             self._compiled[intent] = [
-                re.compile(p, re.IGNORECASE) for p in data["patterns"]
+                re.compile(p) for p in data["patterns"]
             ]
+        self._memo: OrderedDict[str, dict] = OrderedDict()
 
     def classify(self, text: str) -> dict:
         text_lower = text.lower().strip()
+        hit = self._memo.get(text_lower)
+        if hit is None:
+            hit = self._classify(text_lower)
+            self._memo[text_lower] = hit
+            if len(self._memo) > _CLASSIFY_MEMO_MAX:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(text_lower)
+        # Copie : les appelants ajoutent "type" ou gardent `entities`.
+        return {**hit, "entities": dict(hit["entities"])}
+
+    def _classify(self, text_lower: str) -> dict:
         best_intent = None
         best_score = 0.0
 
@@ -169,6 +209,11 @@ class RegexNLU:
                     if score > best_score:
                         best_score = score
                         best_intent = intent
+            # Score plafond atteint (motif couvrant ~toute la phrase, cas
+            # courant des commandes courtes) : aucun intent suivant ne peut
+            # le dépasser strictement -> inutile de tester les motifs restants.
+            if best_score >= 0.95:
+                break
 
         if best_intent and best_score > 0.4:
             entities = self._extract_entities(text_lower, best_intent)
@@ -192,32 +237,32 @@ class RegexNLU:
         entities = {}
 
         # Duration extraction (for timer/reminder)
-        dur_match = re.search(r"(\d+)\s*(minute|min|seconde|sec|heure|h)\b", text)
+        dur_match = _DURATION_RE.search(text)
         if dur_match:
             entities["duration_value"] = int(dur_match.group(1))
             entities["duration_unit"] = dur_match.group(2)
 
         # Room extraction for home_control
-        rooms = ["salon", "chambre", "cuisine", "bureau", "salle de bain",
-                 "garage", "jardin", "terrasse", "entrée", "couloir"]
-        for room in rooms:
+        for room in _ROOMS:
             if room in text:
                 entities["room"] = room
                 break
 
         # Device extraction for home_control
-        devices = ["lumière", "lampe", "volet", "store", "chauffage",
-                   "ventilateur", "climatisation", "clim", "télé", "tv"]
-        for device in devices:
+        for device in _DEVICES:
             if device in text:
                 entities["device"] = device
                 break
 
-        # Action extraction
-        if re.search(r"(allume|ouvre|monte|active|augmente)", text):
-            entities["action"] = "on"
-        elif re.search(r"(éteins?|ferme|baisse|désactive|diminue)", text):
-            entities["action"] = "off"
+        # Action extraction (+ verbe d'origine pour les consommateurs stricts)
+        for action, action_re in (("on", _ACTION_ON_RE), ("off", _ACTION_OFF_RE),
+                                  ("increase", _ACTION_UP_RE),
+                                  ("decrease", _ACTION_DOWN_RE)):
+            m = action_re.search(text)
+            if m:
+                entities["action"] = action
+                entities["verb"] = m.group(1)
+                break
 
         return entities
 
@@ -68,13 +68,16 @@ class AgentManager:
         self.optimizer = TaskOptimizer()
         self.memory = TaskMemory()
         self._started_at = time.time()
+        # Connexions WS persistantes vers les services v10 (une par service)
+        self._conns: dict[str, Any] = {}
+        self._conn_locks: dict[str, asyncio.Lock] = {}
 
     async def process_intent(self, text: str) -> dict:
         """Run the full cognitive pipeline for a user utterance.
 
         This is the main entry point for agent processing.
         """
-        start = time.time()
+        start = time.perf_counter()
         # AUDIT LATENCE 2026-05-03 : timer haute resolution dedie au profiling.
         t_pipeline = time.monotonic()
         result: dict[str, Any] = {
@@ -85,8 +88,13 @@ class AgentManager:
 
         try:
             # 1. THINKING -- Parse intent via NLU
+            # 2. Build agent context — ne dépend que du texte : lancé en
+            # parallèle de la NLU (deux services distincts), max au lieu de somme
             self.state_machine.set_state(AgentState.THINKING)
-            intent = await self._call_service("nlu", "parse_intent", {"text": text})
+            intent, context = await asyncio.gather(
+                self._call_service("nlu", "parse_intent", {"text": text}),
+                self._call_service("context", "build_agent_context", {"intent": text}),
+            )
             log.info("[Latency] process_intent: NLU done at %.0fms", (time.monotonic() - t_pipeline) * 1000.0)
             result["stages"]["intent"] = intent
             result["intent"] = intent
@@ -96,10 +104,6 @@ class AgentManager:
                 self.state_machine.set_state(AgentState.IDLE)
                 return result
 
-            # 2. Build agent context
-            context = await self._call_service(
-                "context", "build_agent_context", {"intent": text}
-            )
             result["stages"]["context"] = context
 
             # 3. PLANNING — Create plan if needed
@@ -145,7 +149,7 @@ class AgentManager:
                 result["stages"]["execution"] = {"simple": True, "status": "completed"}
                 result["success"] = True
                 self.state_machine.set_state(AgentState.IDLE)
-                result["elapsed_s"] = round(time.time() - start, 3)
+                result["elapsed_s"] = round(time.perf_counter() - start, 3)
                 return result
 
             # 5. VERIFYING
@@ -170,32 +174,38 @@ class AgentManager:
                 result["stages"]["recovery"] = recovery.to_dict()
             self.state_machine.force_state(AgentState.IDLE)
 
-        result["elapsed_s"] = round(time.time() - start, 3)
+        result["elapsed_s"] = round(time.perf_counter() - start, 3)
         result["final_state"] = self.state_machine.get_state()
         self.state_machine.set_state(AgentState.IDLE)
         return result
 
     async def health_check(self) -> dict:
         """Check health of all v10 services."""
-        checks: dict[str, dict] = {}
-
-        for name, port in SERVICE_PORTS.items():
-            start = time.time()
+        async def _probe(name: str, port: int) -> dict:
+            start = time.perf_counter()
             try:
                 pong = await self._call_service(name, "ping", {})
-                latency = round(time.time() - start, 3)
-                checks[name] = {
+                latency = round(time.perf_counter() - start, 3)
+                return {
                     "status": "up",
                     "port": port,
                     "latency_s": latency,
                 }
             except Exception as e:
-                checks[name] = {
+                return {
                     "status": "down",
                     "port": port,
                     "error": str(e),
                 }
 
+        # Pings indépendants (une socket par service) : tous en parallèle,
+        # le health check coûte le service le plus lent et non la somme
+        # (jusqu'à 15 s de timeout par service injoignable).
+        results = await asyncio.gather(
+            *(_probe(name, port) for name, port in SERVICE_PORTS.items())
+        )
+        checks: dict[str, dict] = dict(zip(SERVICE_PORTS, results))
+
         # Local modules (always up)
         for mod_name in ("recovery", "optimizer", "memory", "state_machine"):
             checks[mod_name] = {"status": "up", "type": "local"}
@@ -232,6 +242,37 @@ class AgentManager:
 
     # ── Internal — Service Communication ─────────────
 
+    async def _connect_service(self, name: str, port: int):
+        """Return the persistent WebSocket to a service, (re)connecting if needed."""
+        ws = self._conns.get(name)
+        if ws is not None:
+            return ws
+        ws = await websockets.connect(
+            f"ws://localhost:{port}",
+            ping_interval=None, ping_timeout=None,
+        )
+        try:
+            # Consume ready message
+            await asyncio.wait_for(ws.recv(), timeout=5.0)
+        except BaseException:
+            await ws.close()
+            raise
+        self._conns[name] = ws
+        return ws
+
+    async def _drop_service(self, name: str) -> None:
+        ws = self._conns.pop(name, None)
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+
+    async def close(self) -> None:
+        """Close persistent service connections."""
+        for name in list(self._conns):
+            await self._drop_service(name)
+
     async def _call_service(self, name: str, action: str,
                             params: dict) -> dict | None:
         """Call a microservice via WebSocket."""
@@ -239,42 +280,57 @@ class AgentManager:
         if not port or not websockets:
             return None
 
+        # Backward-compatible payload: some services read fields at root level
+        # while others read the nested "params" object.
+        payload = {"action": action, "params": params}
+        payload.update(params)
+        data = json.dumps(payload)
+
         # AUDIT LATENCE 2026-05-03 : profiling par appel (handshake + send + recv)
         t0 = time.monotonic()
+        lock = self._conn_locks.setdefault(name, asyncio.Lock())
         try:
-            async with websockets.connect(
-                f"ws://localhost:{port}",
-                ping_interval=None, ping_timeout=None,
-            ) as ws:
-                t_conn = time.monotonic()
-                # Consume ready message
-                await asyncio.wait_for(ws.recv(), timeout=5.0)
-
-                # Backward-compatible payload: some services read fields at root level
-                # while others read the nested "params" object.
-                payload = {"action": action, "params": params}
-                payload.update(params)
-                await ws.send(json.dumps(payload))
-                raw = await asyncio.wait_for(ws.recv(), timeout=15.0)
-                response = json.loads(raw)
-                t_done = time.monotonic()
-                log.info(
-                    "[Latency] svc=%s action=%s connect=%.0fms total=%.0fms",
-                    name, action,
-                    (t_conn - t0) * 1000.0, (t_done - t0) * 1000.0,
-                )
+            # Connexion persistante par service (les serveurs v10 bouclent sur
+            # `async for raw in ws`) : le handshake + "ready" n'est payé qu'une
+            # fois, pas à chaque étape NLU/context/planner. Le verrou garde
+            # l'appariement requête/réponse sur la socket partagée.
+            async with lock:
+                for attempt in (0, 1):
+                    reused = name in self._conns
+                    try:
+                        ws = await self._connect_service(name, port)
+                        t_conn = time.monotonic()
+                        await ws.send(data)
+                        raw = await asyncio.wait_for(ws.recv(), timeout=15.0)
+                        break
+                    except BaseException as exc:
+                        # Réponse possiblement en vol : la socket n'est plus fiable.
+                        await self._drop_service(name)
+                        # Socket réutilisée fermée côté serveur (redémarrage) :
+                        # une seule nouvelle tentative sur une connexion fraîche.
+                        if (attempt == 0 and reused
+                                and isinstance(exc, websockets.ConnectionClosed)):
+                            continue
+                        raise
+            response = json.loads(raw)
+            t_done = time.monotonic()
+            log.info(
+                "[Latency] svc=%s action=%s connect=%.0fms total=%.0fms",
+                name, action,
+                (t_conn - t0) * 1000.0, (t_done - t0) * 1000.0,
+            )
 
-                if response.get("type") == "pong":
-                    return {"pong": True}
+            if response.get("type") == "pong":
+                return {"pong": True}
 
-                # v9 envelope format: {"ok": bool, "data": {...}}
-                if "ok" in response:
-                    return response.get("data") if response.get("ok") else None
+            # v9 envelope format: {"ok": bool, "data": {...}}
+            if "ok" in response:
+                return response.get("data") if response.get("ok") else None
 
-                # Legacy/direct format: return payload directly unless explicit error.
-                if response.get("type") == "error":
-                    return None
-                return response
+            # Legacy/direct format: return payload directly unless explicit error.
+            if response.get("type") == "error":
+                return None
+            return response
 
         except asyncio.TimeoutError:
             log.error("Timeout calling %s:%d/%s", name, port, action)
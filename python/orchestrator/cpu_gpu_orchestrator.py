@@ -15,6 +15,8 @@ from __future__ import annotations
 import ctypes
 import logging
 import os
+import shutil
+import subprocess
 import sys
 import threading
 import time
@@ -166,17 +168,28 @@ class CPUGPUOrchestrator:
             "gpu_memory_total_mb": 0,
         }
 
-        # Tester CUDA via torch
-        try:
-            import torch
-            if torch.cuda.is_available():
+        # L'orchestrateur n'exécute aucun modèle : importer torch ici
+        # chargeait une copie de plus (~1-2 s, plusieurs centaines de Mo RSS
+        # + contexte CUDA) en parallèle de celles des services STT/VAD.
+        # torch n'est consulté que s'il est déjà chargé, sinon nvidia-smi.
+        torch = sys.modules.get("torch")
+        if torch is not None:
+            try:
+                if torch.cuda.is_available():
+                    result["cuda_available"] = True
+                    result["gpu_name"] = torch.cuda.get_device_name(0)
+                    mem = torch.cuda.get_device_properties(0).total_memory
+                    result["gpu_memory_total_mb"] = round(mem / 1024 / 1024, 0)
+                    self._gpu_available = True
+            except Exception:
+                log.debug("torch CUDA probe failed", exc_info=True)
+        else:
+            name, total_mb = self._probe_nvidia_smi()
+            if name:
                 result["cuda_available"] = True
-                result["gpu_name"] = torch.cuda.get_device_name(0)
-                mem = torch.cuda.get_device_properties(0).total_mem
-                result["gpu_memory_total_mb"] = round(mem / 1024 / 1024, 0)
+                result["gpu_name"] = name
+                result["gpu_memory_total_mb"] = total_mb
                 self._gpu_available = True
-        except ImportError:
-            pass
 
         # Vulkan est détecté au niveau native (whisper.cpp)
         # On vérifie juste si whispercpp est configuré pour Vulkan
@@ -186,6 +199,23 @@ class CPUGPUOrchestrator:
         log.info(f"GPU probe: {result}")
         return result
 
+    @staticmethod
+    def _probe_nvidia_smi() -> tuple[str, float]:
+        """(nom GPU, mémoire totale Mo) via nvidia-smi, ("", 0) si absent."""
+        smi = shutil.which("nvidia-smi")
+        if not smi:
+            return "", 0.0
+        try:
+            out = subprocess.run(
+                [smi, "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
+                capture_output=True, text=True, timeout=3,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+            ).stdout
+            name, _, mem = out.splitlines()[0].rpartition(",")
+            return name.strip(), float(mem)
+        except (OSError, subprocess.SubprocessError, IndexError, ValueError):
+            return "", 0.0
+
     def snapshot(self) -> ResourceSnapshot:
         """Prend un instantané des ressources courantes."""
         cpu_pct = 0.0
@@ -202,12 +232,14 @@ class CPUGPUOrchestrator:
         except ImportError:
             pass
 
-        if self._gpu_available:
+        # Mémoire CUDA allouée *par ce process* : n'a de sens que si torch
+        # y est déjà chargé (ne pas l'importer pour une métrique)
+        torch = sys.modules.get("torch")
+        if self._gpu_available and torch is not None:
             try:
-                import torch
                 if torch.cuda.is_available():
                     gpu_used_mb = torch.cuda.memory_allocated(0) / 1024 / 1024
-                    gpu_total_mb = torch.cuda.get_device_properties(0).total_mem / 1024 / 1024
+                    gpu_total_mb = torch.cuda.get_device_properties(0).total_memory / 1024 / 1024
             except Exception:
                 log.debug("GPU memory probe failed", exc_info=True)
 
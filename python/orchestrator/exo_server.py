@@ -217,6 +217,9 @@ class GUIServer:
         elif msg_type == "pipeline_state":
             state = msg.get("state", "idle")
             logger.info("Pipeline state: %s", state)
+            if state in ("listening", "transcribing"):
+                # Session LLM refroidie : warmup en parallèle du STT
+                self._pipeline.warmup.prewarm()
             await self.push_state(state)
 
         elif msg_type == "audio_level":
@@ -2116,9 +2119,13 @@ class PipelineManager:
 
     def __init__(self) -> None:
         self.warmup = LLMWarmup()
-        self.pipeline = FusedPipeline()
-        self.tts_pred = TTSPredictive()
         self.cache = ContextCache()
+        # Réponses LLM réutilisées pour une commande répétée : opt-in, une
+        # réponse dépendant de l'heure ou d'un état ne doit pas être rejouée.
+        self.pipeline = FusedPipeline(
+            response_cache=self.cache if os.environ.get("EXO_RESPONSE_CACHE") == "1" else None,
+        )
+        self.tts_pred = TTSPredictive()
         self.cpu_gpu = CPUGPUOrchestrator()
         self.profiler = PipelineProfiler()
         self.resilience = PipelineResilience()
@@ -2128,10 +2135,13 @@ class PipelineManager:
         """Initialisation au démarrage du serveur."""
         # Priorité process
         self.cpu_gpu.init_process(high_priority=True)
-        self.cpu_gpu.probe_gpu()
 
-        # Warmup LLM (si send_fn configuré)
-        result = await self.warmup.warmup()
+        # Sonde GPU (sous-process nvidia-smi, bloquante) dans un thread, en
+        # parallèle du warmup LLM (si send_fn configuré) : max au lieu de somme
+        _, result = await asyncio.gather(
+            asyncio.to_thread(self.cpu_gpu.probe_gpu),
+            self.warmup.warmup(),
+        )
         logger.info("Pipeline warmup: %s", result.get("status", "skip"))
 
         # KeepAlive en arrière-plan
@@ -2215,10 +2225,8 @@ async def main() -> None:
     )
     logger.info("EXO GUI WebSocket server running on ws://localhost:8765")
 
-    # Start Pipeline v8.2
-    await pipeline_mgr.startup()
-
-    # Start HA bridge in background
+    # Start HA bridge in background — lancé avant le warmup pipeline pour que
+    # connexion + bootstrap HA (réseau) se recouvrent avec le warmup LLM
     ha_token = os.environ.get("HA_TOKEN", "")
     if ha_token:
         ha_task = asyncio.create_task(bridge.start())
@@ -2227,6 +2235,9 @@ async def main() -> None:
         ha_task = None
         logger.warning("HA_TOKEN not set — Home Assistant integration disabled")
 
+    # Start Pipeline v8.2
+    await pipeline_mgr.startup()
+
     # Idle loop
     stop = asyncio.Event()
 
@@ -2252,6 +2263,7 @@ async def main() -> None:
         gui_server.close()
         await gui_server.wait_closed()
         await bridge.stop()
+        await agent_mgr.close()
         if ha_task:
             ha_task.cancel()
 
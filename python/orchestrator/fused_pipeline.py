@@ -14,10 +14,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Callable, Coroutine, Optional
+from typing import Any, AsyncIterator, Callable, Coroutine, Optional
+
+from context_cache import CacheDomain, ContextCache
 
 log = logging.getLogger("pipeline.fused")
 
@@ -127,9 +130,38 @@ class InteractionContext:
         }
 
 
+def _speculation_key(text: str) -> str:
+    """Clé de comparaison partiel/final : casse, ponctuation et espaces ignorés."""
+    return "".join(ch for ch in text.casefold() if ch.isalnum())
+
+
+def _drop_task(task: asyncio.Task) -> None:
+    """Abandonne *task* : annulation, et son exception éventuelle est lue
+    (pas de « Task exception was never retrieved » pour une spéculation
+    déjà terminée en erreur)."""
+    if task.done():
+        if not task.cancelled():
+            task.exception()
+        return
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+# Fin de phrase suivie d'un blanc : découpe d'une réponse LLM déjà complète.
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?…])\s+")
+# Frontière de proposition : virgule suivie d'un blanc (« 21,5 » n'en est pas une).
+_CLAUSE_BREAK_RE = re.compile(r",\s")
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Découpe *text* en phrases non vides (ponctuation finale conservée)."""
+    return [s for s in _SENTENCE_SPLIT_RE.split(text.strip()) if s]
+
+
 # Type aliases pour les callbacks
 SendFn = Callable[..., Coroutine[Any, Any, str]]
 StreamFn = Callable[..., Coroutine[Any, Any, None]]
+TokenStreamFn = Callable[..., AsyncIterator[str]]
 
 
 # Renseigne la table de transitions après la définition de l'Enum.
@@ -151,12 +183,20 @@ class FusedPipeline:
     - on_partial(text)  : résultat partiel STT → lance pré-analyse LLM si assez long
     - on_final(text)    : résultat final STT → LLM complet → TTS streaming
     - on_llm_token(tok) : token LLM reçu → accumule et flush vers TTS
+
+    Si ``llm_stream`` est fourni, on_final recouvre LLM et TTS : chaque phrase
+    complète part en synthèse pendant que le LLM génère la suite.
     """
 
     # Seuils
     ANTICIPATION_MIN_CHARS = 15   # minimum pour lancer anticipation
     ANTICIPATION_COOLDOWN = 1.5   # secondes entre deux anticipations
     SENTENCE_FLUSH_CHARS = ('.', '!', '?', ':', ';')
+    _FLUSH_CHARSET = frozenset(SENTENCE_FLUSH_CHARS)
+    # Première phrase seulement : flush anticipé sur une virgule dès que la
+    # proposition est assez longue pour être prononcée seule → le TTS démarre
+    # sans attendre la fin d'une longue première phrase.
+    FIRST_CLAUSE_MIN_CHARS = 24
 
     # Timeouts explicites — protègent le pipeline contre des appels bloquants.
     # Valeurs prudentes : LLM peut être lent, TTS streaming peut couvrir une réponse longue.
@@ -165,14 +205,28 @@ class FusedPipeline:
     ANTICIPATION_TIMEOUT_S: float = 5.0
     ERROR_RECOVERY_DELAY_S: float = 0.5
 
+    # Pipeline parallèle : quand deux partiels STT consécutifs sont identiques
+    # (l'utilisateur a fini de parler), la requête LLM finale est lancée tout
+    # de suite, en recouvrement avec le hang VAD + la transcription finale.
+    SPECULATIVE_LLM: bool = True
+
+    # Cache de réponses (optionnel, ``response_cache``) : une commande
+    # identique (casse/ponctuation ignorées) répétée dans ce délai reprend la
+    # réponse précédente sans aller-retour LLM.
+    RESPONSE_CACHE_TTL_S: float = 300.0
+
     def __init__(
         self,
         *,
         llm_send: Optional[SendFn] = None,
         tts_stream: Optional[StreamFn] = None,
         on_state_change: Optional[Callable[[PipelineState], Any]] = None,
+        llm_stream: Optional[TokenStreamFn] = None,
+        response_cache: Optional[ContextCache] = None,
     ):
         self._llm_send = llm_send
+        self._llm_stream = llm_stream
+        self._response_cache = response_cache
         self._tts_stream = tts_stream
         self._on_state_change = on_state_change
 
@@ -182,10 +236,13 @@ class FusedPipeline:
         self._last_anticipation: float = 0.0
         self._anticipation_task: Optional[asyncio.Task] = None
         self._current_task: Optional[asyncio.Task] = None
+        self._speculative_task: Optional[asyncio.Task] = None
+        self._speculative_key: str = ""
 
         # Tampon de tokens pour TTS flush par phrase
         self._token_buffer: list[str] = []
         self._sentence_buffer = ""
+        self._sentences_flushed = 0
 
         # Historique des dernières interactions
         self._history: list[dict[str, Any]] = []
@@ -200,6 +257,9 @@ class FusedPipeline:
             "timeouts_tts": 0,
             "errors_llm": 0,
             "errors_tts": 0,
+            "speculative_hits": 0,
+            "speculative_misses": 0,
+            "response_cache_hits": 0,
         }
 
         # Dédup anticipation : on ne relance pas sur un préfixe déjà analysé.
@@ -254,6 +314,7 @@ class FusedPipeline:
         self._ctx = ctx
         self._token_buffer.clear()
         self._sentence_buffer = ""
+        self._sentences_flushed = 0
         self._interrupt_requested = False
         self._last_anticipation_text = ""
         self._set_state(PipelineState.LISTENING)
@@ -277,6 +338,7 @@ class FusedPipeline:
 
         if not self._ctx:
             return
+        prev_partial = self._ctx.partial_texts[-1] if self._ctx.partial_texts else None
         self._ctx.partial_texts.append(text)
         self._ctx.t_stt_start = self._ctx.t_stt_start or time.perf_counter()
         self._set_state(PipelineState.TRANSCRIBING)
@@ -296,6 +358,20 @@ class FusedPipeline:
             self._anticipation_task = asyncio.ensure_future(
                 self._run_anticipation(text)
             )
+        elif (
+            self.SPECULATIVE_LLM
+            and self._llm_send
+            and prev_partial is not None
+            and len(text) >= self.ANTICIPATION_MIN_CHARS
+        ):
+            key = _speculation_key(text)
+            if key == _speculation_key(prev_partial) and key != self._speculative_key:
+                self._cancel_speculation()
+                self._speculative_key = key
+                self._speculative_task = asyncio.ensure_future(
+                    self._llm_send(text, 1024, "")
+                )
+                log.debug("[fsm][speculative] LLM lancé sur partiel stable : %s", text[:60])
 
     async def _run_anticipation(self, partial_text: str) -> None:
         """Pré-analyse LLM sur un résultat partiel — bornée par timeout court."""
@@ -338,12 +414,25 @@ class FusedPipeline:
         log.info("[fsm][final-stt][int=%s] %s", ctx.interaction_id, text)
         log.info("[fsm][stt-lat][int=%s] %.0fms", ctx.interaction_id, ctx.stt_latency_ms)
 
-        # LLM (borné)
-        if self._llm_send:
+        cached = self._cached_response(text)
+        if cached is not None:
+            self._cancel_speculation()
+            self._metrics["response_cache_hits"] += 1
+            ctx.t_llm_start = ctx.t_llm_first_token = ctx.t_llm_end = time.perf_counter()
+            ctx.response_text = cached
+            log.info("[fsm][llm-cache-hit][int=%s]", ctx.interaction_id)
+
+        # LLM (borné) — reprend la requête spéculative si le texte final
+        # correspond au partiel stable sur lequel elle a été lancée.
+        spec = self._take_speculation(text) if cached is None else None
+        if cached is None and spec is None and self._llm_stream:
+            await self._stream_llm_to_tts(ctx, text)
+            return
+        if cached is None and self._llm_send:
             ctx.t_llm_start = time.perf_counter()
             try:
                 response = await _run_with_timeout(
-                    self._llm_send(text, 1024, ""),
+                    spec if spec is not None else self._llm_send(text, 1024, ""),
                     self.LLM_TIMEOUT_S,
                     label="llm_send",
                     fallback=None,
@@ -358,6 +447,7 @@ class FusedPipeline:
                 ctx.t_llm_first_token = ctx.t_llm_first_token or time.perf_counter()
                 ctx.t_llm_end = time.perf_counter()
                 ctx.response_text = response
+                self._store_response(text, response)
                 log.info("[fsm][llm-lat][int=%s] %.0fms", ctx.interaction_id, ctx.llm_latency_ms)
             except Exception as exc:  # noqa: BLE001
                 self._metrics["errors_llm"] += 1
@@ -373,29 +463,141 @@ class FusedPipeline:
             self._finish_interaction()
             return
 
-        # TTS streaming (borné)
+        # TTS streaming (borné). La réponse complète (llm_send ou spéculation)
+        # passe phrase par phrase dans le consommateur du chemin streaming :
+        # la lecture de la première phrase démarre sans attendre la synthèse
+        # de toute la réponse.
         if self._tts_stream and ctx.response_text:
-            self._set_state(PipelineState.SPEAKING)
-            ctx.t_tts_start = time.perf_counter()
+            queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+            for sentence in _split_sentences(ctx.response_text):
+                queue.put_nowait(sentence)
+            queue.put_nowait(None)
             try:
                 await _run_with_timeout(
-                    self._tts_stream(ctx.response_text),
+                    self._tts_consumer(ctx, queue),
                     self.TTS_TIMEOUT_S,
                     label="tts_stream",
                     fallback=None,
                 )
-                if not ctx.t_tts_first_chunk:
-                    ctx.t_tts_first_chunk = time.perf_counter()
-                ctx.t_tts_end = time.perf_counter()
+                if ctx.t_tts_start:
+                    ctx.t_tts_end = time.perf_counter()
             except asyncio.CancelledError:
                 log.info("[fsm][tts-cancelled][int=%s]", ctx.interaction_id)
-            except Exception as exc:  # noqa: BLE001
-                self._metrics["errors_tts"] += 1
-                log.error("[fsm][tts-error][int=%s] %s", ctx.interaction_id, exc)
 
         log.info("[fsm][total][int=%s] %.0fms", ctx.interaction_id, ctx.total_latency_ms)
         self._finish_interaction()
 
+    async def _stream_llm_to_tts(self, ctx: InteractionContext, text: str) -> None:
+        """LLM en streaming → TTS par phrase, les deux étages en recouvrement.
+
+        Les phrases complètes (on_llm_token) passent par une asyncio.Queue vers
+        un consommateur TTS : la synthèse de la phrase N tourne pendant que le
+        LLM produit la phrase N+1, la latence perçue devient celle de la
+        première phrase au lieu de la réponse entière.
+        """
+        assert self._llm_stream is not None
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        tts_task = (
+            asyncio.ensure_future(self._tts_consumer(ctx, queue))
+            if self._tts_stream else None
+        )
+
+        async def _produce() -> str:
+            parts: list[str] = []
+            async for token in self._llm_stream(text, 1024, ""):
+                if self._interrupt_requested:
+                    break
+                parts.append(token)
+                sentence = self.on_llm_token(token)
+                if sentence:
+                    queue.put_nowait(sentence)
+            tail = self.flush_sentence_buffer()
+            if tail:
+                queue.put_nowait(tail)
+            return "".join(parts)
+
+        ctx.t_llm_start = time.perf_counter()
+        try:
+            try:
+                response = await _run_with_timeout(
+                    _produce(), self.LLM_TIMEOUT_S, label="llm_stream", fallback=None,
+                )
+            finally:
+                queue.put_nowait(None)
+            if response is None:
+                self._metrics["timeouts_llm"] += 1
+                log.error("[fsm][llm-timeout][int=%s] %.1fs", ctx.interaction_id, self.LLM_TIMEOUT_S)
+                self._set_state(PipelineState.ERROR)
+                await self._recover_from_error()
+                self._finish_interaction()
+                return
+            ctx.t_llm_end = time.perf_counter()
+            ctx.response_text = response
+            if not self._interrupt_requested:
+                self._store_response(text, response)
+            log.info("[fsm][llm-lat][int=%s] %.0fms", ctx.interaction_id, ctx.llm_latency_ms)
+
+            if tts_task is not None and not self._interrupt_requested:
+                await _run_with_timeout(
+                    tts_task, self.TTS_TIMEOUT_S, label="tts_stream", fallback=None,
+                )
+                if ctx.t_tts_start:
+                    ctx.t_tts_end = time.perf_counter()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            self._metrics["errors_llm"] += 1
+            log.error("[fsm][llm-error][int=%s] %s", ctx.interaction_id, exc)
+            self._set_state(PipelineState.ERROR)
+            await self._recover_from_error()
+            self._finish_interaction()
+            return
+        finally:
+            if tts_task is not None and not tts_task.done():
+                tts_task.cancel()
+
+        if self._interrupt_requested:
+            log.info("[fsm][interrupt][int=%s] pendant LLM/TTS — abandon", ctx.interaction_id)
+        log.info("[fsm][total][int=%s] %.0fms", ctx.interaction_id, ctx.total_latency_ms)
+        self._finish_interaction()
+
+    async def _tts_consumer(self, ctx: InteractionContext,
+                            queue: "asyncio.Queue[Optional[str]]") -> None:
+        """Synthétise les phrases dans l'ordre jusqu'au marqueur de fin (None)."""
+        assert self._tts_stream is not None
+        while True:
+            sentence = await queue.get()
+            if sentence is None or self._interrupt_requested:
+                return
+            if not ctx.t_tts_start:
+                ctx.t_tts_start = time.perf_counter()
+                self._set_state(PipelineState.SPEAKING)
+            try:
+                await self._tts_stream(sentence)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                self._metrics["errors_tts"] += 1
+                log.error("[fsm][tts-error][int=%s] %s", ctx.interaction_id, exc)
+                return
+            if not ctx.t_tts_first_chunk:
+                ctx.t_tts_first_chunk = time.perf_counter()
+
+    def _cached_response(self, text: str) -> Optional[str]:
+        if self._response_cache is None:
+            return None
+        key = _speculation_key(text)
+        if not key:
+            return None
+        return self._response_cache.get(key, CacheDomain.LLM_CONTEXT)
+
+    def _store_response(self, text: str, response: str) -> None:
+        key = _speculation_key(text)
+        if self._response_cache is None or not key or not response:
+            return
+        self._response_cache.set(key, response, CacheDomain.LLM_CONTEXT,
+                                 ttl=self.RESPONSE_CACHE_TTL_S)
+
     async def _recover_from_error(self) -> None:
         """Pause brève après ERROR avant de revenir à IDLE (évite boucle)."""
         try:
@@ -412,13 +614,33 @@ class FusedPipeline:
             self._ctx.t_llm_first_token = time.perf_counter()
 
         self._sentence_buffer += token
+        # Le découpage ne peut changer que si le token apporte une ponctuation
+        # de flush : sinon, pas de rfind sur tout le buffer à chaque token.
+        # La virgule de proposition n'est confirmée que par le blanc qui la
+        # suit, parfois porté par le token suivant : on inclut le caractère
+        # précédant le token.
+        if self._FLUSH_CHARSET.isdisjoint(token) and (
+            self._sentences_flushed
+            or "," not in self._sentence_buffer[-len(token) - 1:]
+        ):
+            return None
         # Vérifier si on a une phrase complète
         for ch in self.SENTENCE_FLUSH_CHARS:
             idx = self._sentence_buffer.rfind(ch)
             if idx >= 0 and len(self._sentence_buffer[:idx + 1].strip()) >= 5:
                 sentence = self._sentence_buffer[:idx + 1].strip()
                 self._sentence_buffer = self._sentence_buffer[idx + 1:]
+                self._sentences_flushed += 1
                 return sentence
+        if self._sentences_flushed == 0:
+            idx = -1
+            for m in _CLAUSE_BREAK_RE.finditer(self._sentence_buffer):
+                idx = m.start()
+            if idx >= 0 and len(self._sentence_buffer[:idx].strip()) >= self.FIRST_CLAUSE_MIN_CHARS:
+                clause = self._sentence_buffer[:idx + 1].strip()
+                self._sentence_buffer = self._sentence_buffer[idx + 1:]
+                self._sentences_flushed += 1
+                return clause
         return None
 
     def flush_sentence_buffer(self) -> Optional[str]:
@@ -443,8 +665,29 @@ class FusedPipeline:
             self._anticipation_task.cancel()
             self._anticipation_task = None
 
+    def _take_speculation(self, final_text: str) -> Optional[asyncio.Task]:
+        """Retourne la tâche LLM spéculative si elle porte sur *final_text*."""
+        task, key = self._speculative_task, self._speculative_key
+        self._speculative_task = None
+        self._speculative_key = ""
+        if task is None:
+            return None
+        if key == _speculation_key(final_text) and not task.cancelled():
+            self._metrics["speculative_hits"] += 1
+            return task
+        self._metrics["speculative_misses"] += 1
+        _drop_task(task)
+        return None
+
+    def _cancel_speculation(self) -> None:
+        if self._speculative_task is not None:
+            _drop_task(self._speculative_task)
+        self._speculative_task = None
+        self._speculative_key = ""
+
     def _cancel_pending(self) -> None:
         self._cancel_anticipation()
+        self._cancel_speculation()
         if self._current_task and not self._current_task.done():
             self._current_task.cancel()
             self._current_task = None
@@ -470,15 +713,6 @@ class FusedPipeline:
             log.info("[fsm][interrupt][int=%s] état=%s", self._ctx.interaction_id, self._state.name)
         self._set_state(PipelineState.IDLE)
 
-    def metrics(self) -> dict[str, Any]:
-        """Snapshot des métriques FSM (compteurs cumulés)."""
-        return {
-            "state": self._state.name,
-            "history_size": len(self._history),
-            **self._metrics,
-        }
-        self._ctx = None
-
     def metrics(self) -> dict[str, Any]:
         """Métriques du pipeline fusionné."""
         recent = self._history[-20:] if self._history else []
@@ -491,22 +725,39 @@ class FusedPipeline:
         def _avg(vals: list[float]) -> float:
             return round(sum(vals) / len(vals), 1) if vals else 0.0
 
-        def _p95(vals: list[float]) -> float:
+        def _pct(vals: list[float], q: float) -> float:
             if not vals:
                 return 0.0
             s = sorted(vals)
-            idx = int(len(s) * 0.95)
+            idx = int(len(s) * q)
             return round(s[min(idx, len(s) - 1)], 1)
 
+        # Queue de distribution par étage : la moyenne masque les pics qui
+        # cassent le tour de parole. Alarme si p95 > 2 x p50.
+        stages = {"total": latencies, "stt": stt_lats, "llm": llm_lats,
+                  "tts_first_chunk": tts_lats}
+        tails: dict[str, float] = {}
+        tail_alarms: list[str] = []
+        for name, vals in stages.items():
+            p50, p95 = _pct(vals, 0.50), _pct(vals, 0.95)
+            tails[f"p50_{name}_ms"] = p50
+            tails[f"p95_{name}_ms"] = p95
+            if p50 > 0 and p95 > 2 * p50:
+                tail_alarms.append(name)
+
         return {
             "state": self._state.name,
             "total_interactions": self._interaction_counter,
             "avg_total_ms": _avg(latencies),
-            "p95_total_ms": _p95(latencies),
             "avg_stt_ms": _avg(stt_lats),
             "avg_llm_ms": _avg(llm_lats),
             "avg_tts_first_chunk_ms": _avg(tts_lats),
+            **tails,
+            "tail_alarms": tail_alarms,
             "anticipation_used": anticipation_used,
+            "speculative_hits": self._metrics["speculative_hits"],
+            "speculative_misses": self._metrics["speculative_misses"],
+            "response_cache_hits": self._metrics["response_cache_hits"],
             "recent_count": len(recent),
         }
 
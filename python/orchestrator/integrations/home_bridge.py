@@ -6,7 +6,6 @@ event subscriptions, and REST API calls for EXO.
 """
 
 import asyncio
-import json
 import logging
 import os
 import time
@@ -14,6 +13,10 @@ from typing import Any, Callable, Optional
 
 import aiohttp
 
+# orjson fast-path : chaque state_changed HA passe par ici (plusieurs / s) et
+# /api/states renvoie souvent plusieurs centaines de Ko.
+from shared.base_service import json_dumps, json_loads
+
 logger = logging.getLogger("exo.ha.bridge")
 
 # ---------------------------------------------------------------------------
@@ -191,7 +194,7 @@ class HomeBridge:
         assert self._ws is not None
         async for raw in self._ws:
             if raw.type == aiohttp.WSMsgType.TEXT:
-                msg = json.loads(raw.data)
+                msg = json_loads(raw.data)
                 await self._handle_message(msg)
             elif raw.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
                 break
@@ -266,7 +269,7 @@ class HomeBridge:
         payload = {"id": mid, "type": cmd_type, **kwargs}
         fut: asyncio.Future = asyncio.get_event_loop().create_future()
         self._pending[mid] = fut
-        await self._ws.send_json(payload)
+        await self._ws.send_json(payload, dumps=json_dumps)
         try:
             return await asyncio.wait_for(fut, timeout=15)
         except asyncio.TimeoutError:
@@ -288,14 +291,14 @@ class HomeBridge:
         url = f"{self._base_url}{path}"
         async with self._session.get(url, headers=self._headers(), timeout=aiohttp.ClientTimeout(total=10)) as resp:
             resp.raise_for_status()
-            return await resp.json()
+            return await resp.json(loads=json_loads)
 
     async def rest_post(self, path: str, data: Optional[dict] = None) -> Any:
         assert self._session is not None
         url = f"{self._base_url}{path}"
-        async with self._session.post(url, headers=self._headers(), json=data or {}, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+        async with self._session.post(url, headers=self._headers(), data=json_dumps(data or {}), timeout=aiohttp.ClientTimeout(total=10)) as resp:
             resp.raise_for_status()
-            return await resp.json()
+            return await resp.json(loads=json_loads)
 
     # ------------------------------------------------------------------
     # Convenience REST endpoints
@@ -85,28 +85,32 @@ class KnowledgeGroundedLLM:
             except Exception:
                 pass
 
-        # Construire le prompt augmenté
-        augmented_parts = [prompt]
-
-        if kg_facts:
-            facts_text = "; ".join(str(f) for f in kg_facts[:5])
-            augmented_parts.insert(0, f"[CONNAISSANCES] {facts_text}")
+        # Construire le prompt augmenté, du plus stable au plus volatil :
+        # règles et préférences changent rarement, le contexte à chaque tour.
+        # Un préfixe identique d'un appel à l'autre laisse le cache de prompt
+        # côté fournisseur LLM le réutiliser ; la requête reste en dernier.
+        augmented_parts = []
 
         if rules or inferred_rules:
             all_rules = rules + inferred_rules
             rules_text = "; ".join(str(r) for r in all_rules[:5])
-            augmented_parts.insert(0, f"[RÈGLES] {rules_text}")
+            augmented_parts.append(f"[RÈGLES] {rules_text}")
 
         if preferences:
             pref_text = "; ".join(f"{k}={v}" for k, v in
                                   list(preferences.items())[:5])
-            augmented_parts.insert(0, f"[PRÉFÉRENCES] {pref_text}")
+            augmented_parts.append(f"[PRÉFÉRENCES] {pref_text}")
+
+        if kg_facts:
+            facts_text = "; ".join(str(f) for f in kg_facts[:5])
+            augmented_parts.append(f"[CONNAISSANCES] {facts_text}")
 
         if context:
             ctx_text = "; ".join(f"{k}={v}" for k, v in
                                  list(context.items())[:5])
-            augmented_parts.insert(0, f"[CONTEXTE] {ctx_text}")
+            augmented_parts.append(f"[CONTEXTE] {ctx_text}")
 
+        augmented_parts.append(prompt)
         augmented_prompt = "\n".join(augmented_parts)
 
         # Calculer le score d'ancrage
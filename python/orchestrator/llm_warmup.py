@@ -51,6 +51,7 @@ class LLMWarmup:
         # État
         self._warmed_up = False
         self._keepalive_task: Optional[asyncio.Task] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
         self._last_warmup: float = 0.0
         self._warmup_count: int = 0
         self._keepalive_count: int = 0
@@ -123,6 +124,24 @@ class LLMWarmup:
                 "warmed_up": self._warmed_up,
             }
 
+    def prewarm(self) -> Optional[asyncio.Task]:
+        """Relance un warmup en tâche de fond si la session a refroidi.
+
+        Appelé dès que l'utilisateur parle : le ping LLM se recouvre avec
+        la transcription STT au lieu de s'ajouter au premier token.
+        Non bloquant ; aucune action si un warmup est déjà en cours ou
+        récent (moins d'un intervalle de keep-alive).
+        """
+        if self._send_fn is None:
+            return None
+        if self._prewarm_task is not None and not self._prewarm_task.done():
+            return self._prewarm_task
+        if (self._warmed_up
+                and time.monotonic() - self._last_warmup < self._keepalive_interval):
+            return None
+        self._prewarm_task = asyncio.ensure_future(self.warmup())
+        return self._prewarm_task
+
     async def keep_alive_loop(self) -> None:
         """Boucle de keep-alive : ping périodique pour garder la connexion chaude."""
         self._running = True
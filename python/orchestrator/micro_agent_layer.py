@@ -60,7 +60,7 @@ class MicroAgentLayer:
     def micro_execute(self, task: dict) -> dict:
         """Exécuter une micro-tâche atomique."""
         self._stats["tasks_executed"] += 1
-        t0 = time.time()
+        t0 = time.perf_counter()
 
         action = task.get("action", task.get("micro", "generic"))
         params = task.get("params", {})
@@ -109,7 +109,7 @@ class MicroAgentLayer:
         # Simuler l'exécution atomique
         output = self._execute_atomic(action, params, text, domain)
 
-        elapsed_ms = (time.time() - t0) * 1000
+        elapsed_ms = (time.perf_counter() - t0) * 1000
         micro["executions"] = micro.get("executions", 0) + 1
         # Running average
         prev = micro.get("avg_latency_ms", 0.0)
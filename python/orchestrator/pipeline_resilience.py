@@ -20,6 +20,8 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Callable, Coroutine, Optional
 
+from shared.resilience import jittered
+
 log = logging.getLogger("pipeline.resilience")
 
 
@@ -198,7 +200,9 @@ class PipelineResilience:
         for attempt in range(cfg.retries + 1):
             if attempt > 0:
                 health.record_retry()
-                delay = cfg.backoff_delay(attempt - 1)
+                # Jitter : les étages qui échouent ensemble (panne réseau)
+                # ne relancent pas tous au même instant.
+                delay = jittered(cfg.backoff_delay(attempt - 1))
                 log.info(f"[{module_name}] Retry #{attempt} après {delay:.1f}s")
                 await asyncio.sleep(delay)
 
@@ -95,11 +95,16 @@ class SelfConsistencyEngine:
         conclusion = reasoning_trace.get("conclusion", "")
         inconsistencies = []
 
+        # Textes des étapes extraits, normalisés (minuscules, strip) une seule
+        # fois : les boucles ci-dessous sont en O(n²) sur les paires d'étapes.
+        texts_lower = [
+            (step.get("text", "") if isinstance(step, dict) else str(step)).lower().strip()
+            for step in steps
+        ]
+
         # 1. Detect step contradictions
-        for i, step_a in enumerate(steps):
-            text_a = step_a.get("text", "") if isinstance(step_a, dict) else str(step_a)
-            for j, step_b in enumerate(steps[i + 1:], start=i + 1):
-                text_b = step_b.get("text", "") if isinstance(step_b, dict) else str(step_b)
+        for i, text_a in enumerate(texts_lower):
+            for j, text_b in enumerate(texts_lower[i + 1:], start=i + 1):
                 if self._texts_contradict(text_a, text_b):
                     inconsistencies.append({
                         "type": "step_contradiction",
@@ -111,9 +116,8 @@ class SelfConsistencyEngine:
         if conclusion and steps:
             conclusion_words = set(conclusion.lower().split())
             supporting_steps = 0
-            for step in steps:
-                text = step.get("text", "") if isinstance(step, dict) else str(step)
-                step_words = set(text.lower().split())
+            for text in texts_lower:
+                step_words = set(text.split())
                 if step_words & conclusion_words:
                     supporting_steps += 1
             if supporting_steps == 0:
@@ -124,13 +128,12 @@ class SelfConsistencyEngine:
 
         # 3. Check for logic reversals
         for i, step in enumerate(steps):
-            text = step.get("text", "") if isinstance(step, dict) else str(step)
             result_val = step.get("result") if isinstance(step, dict) else None
             if result_val is not None:
+                result_lower = str(result_val).lower()
                 # Check if a later step contradicts the result
-                for j, later in enumerate(steps[i + 1:], start=i + 1):
-                    later_text = later.get("text", "") if isinstance(later, dict) else str(later)
-                    if str(result_val).lower() in later_text.lower() and "pas" in later_text.lower():
+                for j, later_text in enumerate(texts_lower[i + 1:], start=i + 1):
+                    if result_lower in later_text and "pas" in later_text:
                         inconsistencies.append({
                             "type": "result_reversal",
                             "step_indices": [i, j],
@@ -344,9 +347,11 @@ class SelfConsistencyEngine:
         return issues
 
     def _texts_contradict(self, text_a: str, text_b: str) -> bool:
-        """Simple heuristic to check if two texts contradict each other."""
-        a = text_a.lower().strip()
-        b = text_b.lower().strip()
+        """Simple heuristic to check if two texts contradict each other.
+
+        Expects pre-normalized input (lowercased and stripped by the caller).
+        """
+        a, b = text_a, text_b
         if not a or not b:
             return False
 
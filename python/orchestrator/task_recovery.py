@@ -99,7 +99,7 @@ class TaskRecovery:
         Analyzes the error, determines the best recovery strategy,
         and attempts correction.
         """
-        start = time.time()
+        start = time.perf_counter()
         category = self._classify_error(error)
         strategy = self._determine_strategy(step, category, error)
 
@@ -133,7 +133,7 @@ class TaskRecovery:
                 message=f"Escalated to {escalation.level}: {escalation.reason}",
             )
 
-        result.elapsed_s = round(time.time() - start, 4)
+        result.elapsed_s = round(time.perf_counter() - start, 4)
 
         # Log recovery attempt
         self._recovery_log.append({
@@ -22,8 +22,9 @@ log = logging.getLogger("pipeline.tts_predictive")
 
 # ── Configuration ────────────────────────────────────────────
 DEFAULT_MIN_BUFFER_MS = 250       # seuil minimum avant lecture
-DEFAULT_CHUNK_SIZE = 2048         # taille chunk PCM16 (~43ms à 24kHz)
+DEFAULT_SAMPLE_RATE = 24000       # Orpheus, PCM16 mono
 DEFAULT_BUFFER_CAPACITY = 200    # nombre max de chunks en buffer
+PLAYBACK_DRAIN_MS = 100           # audio max par play_fn (borne la latence de barge-in)
 
 
 class AudioChunk:
@@ -45,12 +46,18 @@ class CircularAudioBuffer:
         self._total_pushed = 0
         self._total_popped = 0
         self._underruns = 0
+        # Octets PCM en attente : les chunks serveur sont de taille variable
+        # (480 o à 4 Ko), seul ce total mesure l'audio réellement bufferisé.
+        self._bytes = 0
 
     def push(self, data: bytes) -> AudioChunk:
         """Ajoute un chunk audio au buffer."""
         self._seq += 1
         chunk = AudioChunk(data=data, timestamp=time.perf_counter(), seq=self._seq)
+        if len(self._buffer) == self._buffer.maxlen:
+            self._bytes -= len(self._buffer[0].data)  # évincé par le deque
         self._buffer.append(chunk)
+        self._bytes += len(data)
         self._total_pushed += 1
         return chunk
 
@@ -58,10 +65,34 @@ class CircularAudioBuffer:
         """Retire le plus ancien chunk du buffer."""
         if self._buffer:
             self._total_popped += 1
-            return self._buffer.popleft()
+            chunk = self._buffer.popleft()
+            self._bytes -= len(chunk.data)
+            return chunk
         self._underruns += 1
         return None
 
+    def pop_up_to(self, max_bytes: int) -> bytes:
+        """Retire au plus max_bytes de PCM, en coupant le chunk de tête si besoin."""
+        if not self._buffer:
+            self._underruns += 1
+            return b""
+        parts = []
+        n = 0
+        while self._buffer and n < max_bytes:
+            chunk = self._buffer[0]
+            room = max_bytes - n
+            if len(chunk.data) <= room:
+                self._buffer.popleft()
+                self._total_popped += 1
+                parts.append(chunk.data)
+                n += len(chunk.data)
+            else:
+                parts.append(chunk.data[:room])
+                chunk.data = chunk.data[room:]
+                n = max_bytes
+        self._bytes -= n
+        return b"".join(parts)
+
     def peek(self) -> Optional[AudioChunk]:
         """Regarde le plus ancien chunk sans le retirer."""
         return self._buffer[0] if self._buffer else None
@@ -70,16 +101,22 @@ class CircularAudioBuffer:
     def size(self) -> int:
         return len(self._buffer)
 
+    @property
+    def buffered_bytes(self) -> int:
+        return self._bytes
+
     @property
     def empty(self) -> bool:
         return len(self._buffer) == 0
 
     def clear(self) -> None:
         self._buffer.clear()
+        self._bytes = 0
 
     def metrics(self) -> dict[str, Any]:
         return {
             "current_size": len(self._buffer),
+            "buffered_bytes": self._bytes,
             "capacity": self._buffer.maxlen,
             "total_pushed": self._total_pushed,
             "total_popped": self._total_popped,
@@ -94,6 +131,7 @@ class TextAccumulator:
     """
 
     SENTENCE_ENDS = ('.', '!', '?', ':', ';')
+    _ENDS_CHARSET = frozenset(SENTENCE_ENDS)
     MIN_SENTENCE_LEN = 5  # minimum pour considérer comme phrase
 
     def __init__(self):
@@ -103,6 +141,10 @@ class TextAccumulator:
     def add(self, token: str) -> Optional[str]:
         """Ajoute un token. Retourne phrase complète si prête, sinon None."""
         self._buffer += token
+        # Sans ponctuation finale dans le token, le résultat ne peut pas
+        # changer : on évite cinq rfind sur tout le buffer à chaque token.
+        if self._ENDS_CHARSET.isdisjoint(token):
+            return None
         for ch in self.SENTENCE_ENDS:
             idx = self._buffer.rfind(ch)
             if idx >= 0:
@@ -142,13 +184,13 @@ class TTSPredictive:
         self,
         *,
         min_buffer_ms: float = DEFAULT_MIN_BUFFER_MS,
-        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
         buffer_capacity: int = DEFAULT_BUFFER_CAPACITY,
         synthesize_fn: Optional[Callable[..., Coroutine]] = None,
         play_fn: Optional[Callable[[bytes], Coroutine]] = None,
     ):
         self._min_buffer_ms = min_buffer_ms
-        self._chunk_size = chunk_size
+        self._sample_rate = sample_rate
         self._synthesize_fn = synthesize_fn
         self._play_fn = play_fn
 
@@ -158,10 +200,14 @@ class TTSPredictive:
         # Métriques
         self._total_sessions = 0
         self._first_chunk_latencies: list[float] = []
+        self._first_play_latencies: list[float] = []
         self._active = False
         self._synth_task: Optional[asyncio.Task] = None
         self._play_task: Optional[asyncio.Task] = None
         self._synth_queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        # Signalé à chaque chunk poussé et à la fin de session : la lecture
+        # est cadencée par la synthèse au lieu de sonder le buffer.
+        self._chunk_event = asyncio.Event()
         self._t_session_start: float = 0.0
         self._t_first_chunk: float = 0.0
 
@@ -170,6 +216,7 @@ class TTSPredictive:
         self._audio_buffer.clear()
         self._text_accum = TextAccumulator()
         self._synth_queue = asyncio.Queue()
+        self._chunk_event = asyncio.Event()
         self._active = True
         self._total_sessions += 1
         self._t_session_start = time.perf_counter()
@@ -204,6 +251,7 @@ class TTSPredictive:
                     t0 = time.perf_counter()
                     async for chunk_data in self._synthesize_fn(sentence):
                         chunk = self._audio_buffer.push(chunk_data)
+                        self._chunk_event.set()
                         if not self._t_first_chunk:
                             self._t_first_chunk = time.perf_counter()
                             latency = (self._t_first_chunk - self._t_session_start) * 1000
@@ -217,6 +265,12 @@ class TTSPredictive:
             pass
         finally:
             self._active = False
+            self._chunk_event.set()
+
+    async def _wait_chunk(self) -> None:
+        """Attend le prochain chunk poussé (ou la fin de session)."""
+        self._chunk_event.clear()
+        await self._chunk_event.wait()
 
     async def run_playback_loop(self) -> None:
         """Boucle de lecture : consomme le buffer audio et joue les chunks.
@@ -227,27 +281,37 @@ class TTSPredictive:
             log.warning("Pas de fonction de lecture configurée")
             return
 
-        # Attendre le seuil minimum de buffer
-        sample_rate = 24000  # Orpheus native rate
+        # Seuil en octets d'audio bufferisé, pas en nombre de chunks : avec
+        # des chunks de 4 Ko un seuil "N chunks de 2 Ko" retardait la
+        # lecture de ~2x, avec des chunks de 480 o il la lançait à ~50 ms.
         bytes_per_sample = 2  # PCM16
-        ms_per_chunk = (self._chunk_size / (sample_rate * bytes_per_sample)) * 1000
-
-        min_chunks = max(1, int(self._min_buffer_ms / ms_per_chunk))
-        log.debug(f"Attente de {min_chunks} chunks ({self._min_buffer_ms}ms) avant lecture")
+        min_bytes = max(bytes_per_sample,
+                        int(self._min_buffer_ms * self._sample_rate * bytes_per_sample / 1000))
+        drain_bytes = int(PLAYBACK_DRAIN_MS * self._sample_rate / 1000) * bytes_per_sample
+        log.debug(f"Attente de {min_bytes} octets ({self._min_buffer_ms}ms) avant lecture")
 
-        # Attendre assez de chunks
-        while self._active and self._audio_buffer.size < min_chunks:
-            await asyncio.sleep(0.01)
+        while self._active and self._audio_buffer.buffered_bytes < min_bytes:
+            await self._wait_chunk()
 
         try:
+            first = True
             while self._active or not self._audio_buffer.empty:
-                chunk = self._audio_buffer.pop()
-                if chunk:
-                    await self._play_fn(chunk.data)
+                # Les petits chunks accumulés partent regroupés (avec des
+                # chunks serveur de 480 o, un appel par chunk = un aller-retour
+                # de lecture toutes les 10 ms), mais jamais plus de
+                # PLAYBACK_DRAIN_MS par appel : cancel() est vu entre deux
+                # play_fn, un barge-in ne rejoue donc pas tout le backlog.
+                data = self._audio_buffer.pop_up_to(drain_bytes)
+                if data:
+                    if first:
+                        first = False
+                        self._first_play_latencies.append(
+                            (time.perf_counter() - self._t_session_start) * 1000)
+                    await self._play_fn(data)
                 else:
                     if not self._active:
                         break
-                    await asyncio.sleep(0.005)  # attendre nouveau chunk
+                    await self._wait_chunk()  # attendre nouveau chunk
         except asyncio.CancelledError:
             pass
 
@@ -260,16 +324,19 @@ class TTSPredictive:
     def end_session(self) -> None:
         """Termine la session TTS prédictive."""
         self._active = False
+        self._chunk_event.set()
         log.debug(f"TTS session #{self._total_sessions} terminée")
 
     def cancel(self) -> None:
         """Annule la session en cours."""
         self._active = False
         self._audio_buffer.clear()
+        self._chunk_event.set()
 
     def metrics(self) -> dict[str, Any]:
         """Métriques du TTS prédictif."""
         first_chunk_ms = self._first_chunk_latencies[-20:] if self._first_chunk_latencies else []
+        first_play_ms = self._first_play_latencies[-20:]
 
         def _avg(vals: list[float]) -> float:
             return round(sum(vals) / len(vals), 1) if vals else 0.0
@@ -278,6 +345,7 @@ class TTSPredictive:
             "total_sessions": self._total_sessions,
             "active": self._active,
             "avg_first_chunk_ms": _avg(first_chunk_ms),
+            "avg_first_play_ms": _avg(first_play_ms),
             "text_accumulator_flushed": self._text_accum.flushed_count,
             "text_pending": len(self._text_accum.pending),
             "buffer": self._audio_buffer.metrics(),
@@ -1,6 +1,7 @@
 """EXO shared modules — v9.1 observability, resilience, security."""
 
-from .base_service import json_loads, json_dumps  # noqa: F401
+import importlib
+
 from .hardening import (  # noqa: F401
     install_global_excepthook,
     preflight_file,
@@ -16,18 +17,37 @@ from .hardening import (  # noqa: F401
     RateLimiter,
     PreflightReport,
 )
-from .ws_resilient import (  # noqa: F401
-    WsBackoff,
-    parse_ws_message,
-    safe_send_json,
-    make_reconnect_loop,
-)
-from .config_validator import (  # noqa: F401
-    ConfigValidationReport,
-    validate_config_file,
-)
 from .log_event import log_event  # noqa: F401
 
+# Ré-exports paresseux (PEP 562) : base_service tire toute la pile
+# log/metrics/trace/config (~15 ms au-delà d'asyncio). Un simple
+# `import shared.cache` ou `shared.singleton_guard` ne la paie plus ;
+# `from shared import json_loads` continue de fonctionner.
+_LAZY = {
+    "json_loads": ".base_service",
+    "json_dumps": ".base_service",
+    "WsBackoff": ".ws_resilient",
+    "parse_ws_message": ".ws_resilient",
+    "safe_send_json": ".ws_resilient",
+    "make_reconnect_loop": ".ws_resilient",
+    "ConfigValidationReport": ".config_validator",
+    "validate_config_file": ".config_validator",
+}
+
+
+def __getattr__(name: str):
+    modname = _LAZY.get(name)
+    if modname is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(modname, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_LAZY))
+
+
 # Hardening 2026 : capture systématique des exceptions non rattrapées
 # dès qu'un service importe quoi que ce soit du package partagé.
 install_global_excepthook()
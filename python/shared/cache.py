@@ -1,31 +1,139 @@
 """Shared LRU phrase cache for TTS servers."""
 
+import asyncio
 import hashlib
-from typing import Optional
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
 
 
 class PhraseCache:
-    """LRU cache for short phrases to avoid re-synthesis."""
+    """LRU cache for short phrases to avoid re-synthesis.
 
-    def __init__(self, max_entries: int = 64) -> None:
-        self._cache: dict[str, bytes] = {}
-        self._order: list[str] = []
+    With ``cache_dir``, entries are also persisted as raw PCM files so the
+    usual acknowledgements survive a restart (a disk read instead of a full
+    synthesis). The directory is bounded to ``max_files``, least recently
+    used first. ``get``/``put`` only touch memory; the disk is reached via
+    ``aget``/``aput``, which run file I/O in a worker thread.
+    """
+
+    def __init__(self, max_entries: int = 64,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 max_files: int = 512) -> None:
+        # OrderedDict : get() remonte l'entrée en fin (vrai LRU, les accusés
+        # fréquents « C'est fait », « Ok »… ne sont plus évincés) et
+        # l'éviction popitem(last=False) est O(1) (list.pop(0) était O(n)).
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
         self._max = max_entries
+        self._dir = Path(cache_dir) if cache_dir else None
+        self._max_files = max_files
+        # Index LRU des fichiers : construit une fois (scan trié par mtime),
+        # puis tenu à jour à chaque lecture/écriture -> élagage incrémental.
+        self._disk: Optional[OrderedDict[str, None]] = None
+        self._disk_lock = threading.Lock()
+        if self._dir is not None:
+            self._dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._cache)
 
     def key(self, text: str, voice: str, lang: str) -> str:
-        return hashlib.md5(f"{text}|{voice}|{lang}".encode()).hexdigest()
+        # blake2b 128 bits : plus rapide que md5 et sert aussi de nom de fichier
+        return hashlib.blake2b(f"{text}|{voice}|{lang}".encode(),
+                               digest_size=16).hexdigest()
 
     def get(self, text: str, voice: str, lang: str) -> Optional[bytes]:
-        return self._cache.get(self.key(text, voice, lang))
+        k = self.key(text, voice, lang)
+        pcm = self._cache.get(k)
+        if pcm is not None:
+            self._cache.move_to_end(k)
+        return pcm
 
     def put(self, text: str, voice: str, lang: str, pcm: bytes) -> None:
+        self._put(text, voice, lang, pcm)
+
+    async def aget(self, text: str, voice: str, lang: str) -> Optional[bytes]:
+        """``get`` puis, sur miss mémoire, lecture disque hors boucle."""
+        pcm = self.get(text, voice, lang)
+        if pcm is not None or self._dir is None:
+            return pcm
+        k = self.key(text, voice, lang)
+        pcm = await asyncio.to_thread(self._read, k)
+        if pcm is not None:
+            self._remember(k, pcm)
+        return pcm
+
+    async def aput(self, text: str, voice: str, lang: str, pcm: bytes) -> None:
+        """``put`` puis, pour une nouvelle entrée, écriture disque hors boucle."""
+        k = self._put(text, voice, lang, pcm)
+        if k is not None and self._dir is not None:
+            await asyncio.to_thread(self._persist, k, pcm)
+
+    def _put(self, text: str, voice: str, lang: str, pcm: bytes) -> Optional[str]:
+        """Insère en mémoire ; retourne la clé si l'entrée est nouvelle."""
         if len(text) > 40:
-            return
+            return None
         k = self.key(text, voice, lang)
         if k in self._cache:
-            return
-        if len(self._cache) >= self._max:
-            oldest = self._order.pop(0)
-            self._cache.pop(oldest, None)
+            self._cache.move_to_end(k)
+            return None
+        self._remember(k, pcm)
+        return k
+
+    def _remember(self, k: str, pcm: bytes) -> None:
         self._cache[k] = pcm
-        self._order.append(k)
+        while len(self._cache) > self._max:
+            self._cache.popitem(last=False)
+
+    # ── Disque (appelé via asyncio.to_thread) ─────────────────
+
+    def _disk_index(self) -> "OrderedDict[str, None]":
+        if self._disk is None:
+            files = []
+            for path in self._dir.glob("*.pcm"):
+                try:
+                    files.append((path.stat().st_mtime, path.stem))
+                except OSError:
+                    pass
+            files.sort()
+            self._disk = OrderedDict((stem, None) for _, stem in files)
+        return self._disk
+
+    def _read(self, k: str) -> Optional[bytes]:
+        if self._dir is None:
+            return None
+        path = self._dir / f"{k}.pcm"
+        try:
+            pcm = path.read_bytes()
+            os.utime(path)  # mtime = dernier accès -> ordre LRU au prochain scan
+        except OSError:
+            return None
+        with self._disk_lock:
+            index = self._disk_index()
+            index[k] = None
+            index.move_to_end(k)
+        return pcm
+
+    def _persist(self, k: str, pcm: bytes) -> None:
+        if self._dir is None:
+            return
+        with self._disk_lock:
+            index = self._disk_index()
+            if k in index:
+                return
+            path = self._dir / f"{k}.pcm"
+            tmp = path.with_suffix(".tmp")
+            try:
+                tmp.write_bytes(pcm)
+                os.replace(tmp, path)  # atomique : jamais de fichier tronqué lu
+            except OSError:
+                return
+            index[k] = None
+            while len(index) > self._max_files:
+                old, _ = index.popitem(last=False)
+                try:
+                    (self._dir / f"{old}.pcm").unlink()
+                except OSError:
+                    pass
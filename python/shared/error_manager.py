@@ -7,6 +7,8 @@ import logging
 import time
 from typing import Any, Callable, Optional
 
+from .resilience import jittered
+
 logger = logging.getLogger(__name__)
 
 
@@ -160,7 +162,7 @@ def with_retry(module: str, fallback: Optional[Callable] = None):
                 except Exception as exc:
                     last_exc = exc
                     if attempt < max_retries:
-                        await asyncio.sleep(backoff * (2 ** attempt))
+                        await asyncio.sleep(jittered(backoff * (2 ** attempt)))
             if fallback is not None:
                 try:
                     return await fallback(*args, **kwargs) if asyncio.iscoroutinefunction(fallback) else fallback(*args, **kwargs)
@@ -273,27 +273,42 @@ def preflight_binary(
     return True
 
 
+@functools.lru_cache(maxsize=None)
+def _probe_module(mod: str) -> Optional[str]:
+    """Tente l'import une seule fois par processus.
+
+    Retourne ``None`` si le module est importable, sinon le nom de la
+    classe d'exception. Le cache évite de re-parcourir ``sys.path`` à
+    chaque preflight (coûteux pour les modules absents).
+    """
+    import importlib
+
+    try:
+        importlib.import_module(mod)
+    except Exception as exc:  # noqa: BLE001
+        return exc.__class__.__name__
+    return None
+
+
 def preflight_dependencies(
     modules: Iterable[str],
     *,
     report: Optional[PreflightReport] = None,
 ) -> bool:
     """Vérifie que tous les modules Python listés sont importables."""
-    import importlib
-
     all_ok = True
     for mod in modules:
-        try:
-            importlib.import_module(mod)
+        err = _probe_module(mod)
+        if err is None:
             if report:
                 report.add_ok(f"Module Python : {mod}")
-        except Exception as exc:  # noqa: BLE001
-            all_ok = False
-            msg = f"Module Python manquant : {mod} ({exc.__class__.__name__})"
-            if report:
-                report.add_error(msg)
-            else:
-                _log.error(msg)
+            continue
+        all_ok = False
+        msg = f"Module Python manquant : {mod} ({err})"
+        if report:
+            report.add_error(msg)
+        else:
+            _log.error(msg)
     return all_ok
 
 
@@ -344,7 +359,7 @@ async def with_timeout(
     Retourne ``fallback`` si le délai est dépassé.
     """
     try:
-        if asyncio.iscoroutine(coro_or_callable):
+        if asyncio.iscoroutine(coro_or_callable) or asyncio.isfuture(coro_or_callable):
             return await asyncio.wait_for(coro_or_callable, timeout=timeout_s)
         if asyncio.iscoroutinefunction(coro_or_callable):
             return await asyncio.wait_for(
@@ -0,0 +1,33 @@
+"""Session aiohttp persistante partagée par les connecteurs HTTP (domotique)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from .base_service import json_dumps
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class HttpSessionMixin:
+    """Pool keep-alive créé au premier appel, libéré par ``close()``.
+
+    Une session par appel refaisait connexion TCP/TLS + DNS à chaque
+    commande. Les corps ``json=`` passent par le fast-path orjson.
+    """
+
+    _session: Optional["aiohttp.ClientSession"] = None
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return persistent HTTP session, creating it on first use."""
+        import aiohttp
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(json_serialize=json_dumps)
+        return self._session
+
+    async def close(self) -> None:
+        """Release HTTP session resources."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            self._session = None
@@ -2,10 +2,16 @@
 
 import asyncio
 import functools
+import random
 import time
 from typing import Any, Callable, Optional
 
 
+def jittered(delay: float) -> float:
+    """Backoff ±20 % : évite que les clients relancent tous au même instant."""
+    return delay * (0.8 + 0.4 * random.random())
+
+
 class CircuitBreaker:
     """Simple circuit breaker: CLOSED → OPEN after N failures, HALF_OPEN after cooldown."""
 
@@ -91,7 +97,7 @@ def resilient(module: str, *,
                     if breaker:
                         breaker.record_failure()
                     if attempt < retries:
-                        await asyncio.sleep(backoff * (2 ** attempt))
+                        await asyncio.sleep(jittered(backoff * (2 ** attempt)))
 
             if fallback is not None:
                 return await _call(fallback, *args, **kwargs)
@@ -110,12 +110,16 @@ def wait_for_ports(services: list[str], max_wait: float = 5.0) -> list[str]:
     deadline = time.time() + max_wait
     remaining = list(services)
 
-    while remaining and time.time() < deadline:
-        time.sleep(0.5)
+    # Check first, then poll every 100 ms (no fixed 0.5 s step before the
+    # first probe).
+    while True:
         remaining = [
             n for n in remaining
             if not port_is_open(SERVICE_REGISTRY[n]["port"])
         ]
+        if not remaining or time.time() >= deadline:
+            break
+        time.sleep(0.1)
 
     return remaining
 
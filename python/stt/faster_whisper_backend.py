@@ -20,6 +20,21 @@ import numpy as np
 logger = logging.getLogger("exo.stt.faster_whisper")
 
 SAMPLE_RATE = 16000
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _cuda_compute_type() -> str:
+    """Pick int8 weights on CUDA when the GPU supports it, else float16.
+
+    int8_float16 keeps activations in fp16 but halves the weight bytes read
+    per decoded token (decode is memory-bound), at a negligible WER cost.
+    """
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types("cuda")
+    except Exception:
+        return "float16"
+    return "int8_float16" if "int8_float16" in supported else "float16"
 
 
 class FasterWhisperEngine:
@@ -32,17 +47,24 @@ class FasterWhisperEngine:
         compute_type: str = "auto",
         language: str = "fr",
         beam_size: int = 1,
+        cpu_threads: int = 0,
     ) -> None:
         self.model_size = model_size
         self._device = device
         self._compute_type = compute_type
         self.language = language
         self.beam_size = beam_size
+        # 0 = défaut CTranslate2 (tous les cœurs → sur-souscription avec les
+        # autres services du pipeline sur la même machine)
+        self.cpu_threads = cpu_threads
         self._model = None
         self.actual_device = "unknown"
 
     def load(self) -> None:
         """Load the Faster-Whisper model."""
+        if self.cpu_threads > 0:
+            # Avant l'import : les pools OpenMP lisent la variable au chargement
+            os.environ.setdefault("OMP_NUM_THREADS", str(self.cpu_threads))
         try:
             from faster_whisper import WhisperModel
         except ImportError:
@@ -63,7 +85,7 @@ class FasterWhisperEngine:
 
         # Auto compute type based on device
         if compute_type == "auto":
-            compute_type = "float16" if device == "cuda" else "int8"
+            compute_type = _cuda_compute_type() if device == "cuda" else "int8"
 
         # Force int8 on CPU (float16 not supported)
         if device == "cpu":
@@ -78,13 +100,37 @@ class FasterWhisperEngine:
             self.model_size,
             device=device,
             compute_type=compute_type,
+            cpu_threads=self.cpu_threads,
         )
         self.actual_device = device
         dt = time.monotonic() - t0
         logger.info(
-            "Faster-whisper loaded in %.1fs (device=%s, compute=%s)",
-            dt, device, compute_type,
+            "Faster-whisper loaded in %.1fs (device=%s, compute=%s, cpu_threads=%s)",
+            dt, device, compute_type, self.cpu_threads or "auto",
+        )
+
+    def warmup(self) -> None:
+        """Force one real encode/decode pass so the first utterance runs hot.
+
+        transcribe() enables vad_filter: on silence the Silero VAD strips all
+        the audio and CTranslate2 never runs, so a silent transcribe() only
+        warmed the VAD. Here the filter is off and the segment generator is
+        consumed (faster-whisper decodes lazily).
+        """
+        if self._model is None:
+            raise RuntimeError("FasterWhisperEngine not loaded — call load() first")
+        segments_gen, _ = self._model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32),
+            language=self.language,
+            beam_size=self.beam_size,
+            best_of=1,
+            temperature=0.0,
+            without_timestamps=True,
+            condition_on_previous_text=False,
+            vad_filter=False,
         )
+        for _ in segments_gen:
+            pass
 
     def transcribe(
         self,
@@ -101,13 +147,19 @@ class FasterWhisperEngine:
         if self._model is None:
             raise RuntimeError("FasterWhisperEngine not loaded — call load() first")
 
-        audio_f32 = audio_pcm16.astype(np.float32) / 32768.0
-        duration = len(audio_f32) / SAMPLE_RATE
-
+        # Durée testée avant toute conversion : un faux déclenchement ne paie
+        # plus l'allocation float32.
+        duration = len(audio_pcm16) / SAMPLE_RATE
         if duration < 0.3:
             logger.warning("Audio %.2fs < 0.3s — ignored", duration)
             return {"text": "", "segments": [], "duration": duration}
 
+        # Cast + mise à l'échelle fusionnés : une seule allocation et un seul
+        # parcours (astype puis / créait deux tableaux float32 par énoncé).
+        # Pas de buffer de travail partagé : keepalive et session peuvent
+        # transcrire en parallèle et faster-whisper lit l'audio paresseusement.
+        audio_f32 = np.multiply(audio_pcm16, _PCM16_SCALE, dtype=np.float32)
+
         prompt = initial_prompt or (
             "EXO est un assistant vocal domotique français. "
             "Jarvis, allume, éteins, météo, température, lumière."
@@ -118,6 +170,14 @@ class FasterWhisperEngine:
             audio_f32,
             language=self.language,
             beam_size=self.beam_size,
+            # Commandes vocales courtes : un seul décodage greedy/beam. L'échelle
+            # de température par défaut (0.0→1.0) relançait jusqu'à 5 décodages
+            # complets sur les clips courts/bruités sous log_prob_threshold.
+            best_of=1,
+            temperature=0.0,
+            # Timings de segments inutilisés par les clients -> pas de tokens
+            # timestamp à décoder
+            without_timestamps=True,
             word_timestamps=False,
             initial_prompt=prompt,
             condition_on_previous_text=False,
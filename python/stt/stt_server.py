@@ -11,9 +11,25 @@ import numpy as np
 # Patch global EXO : forcer le working directory à D:/EXO/ pour tous les services
 os.chdir("D:/EXO/")
 
-def profile_block(label, threshold_ms=5):
+def profile_block(label, threshold_ms=5, min_interval_s=1.0):
     import time
     from functools import wraps
+    # Au plus un WARNING par label et par seconde : _on_audio est décoré et
+    # appelé à chaque chunk, une boucle ralentie émettait un log console +
+    # fichier par chunk, ce qui aggravait lui-même le retard.
+    last_log = [0.0]
+    suppressed = [0]
+    def _report(dt):
+        now = time.monotonic()
+        if now - last_log[0] < min_interval_s:
+            suppressed[0] += 1
+            return
+        last_log[0] = now
+        if suppressed[0]:
+            logger.warning("[PERF] %s: %.1f ms (+%d suppressed)", label, dt, suppressed[0])
+            suppressed[0] = 0
+        else:
+            logger.warning("[PERF] %s: %.1f ms", label, dt)
     def decorator(func):
         if asyncio.iscoroutinefunction(func):
             @wraps(func)
@@ -22,7 +38,7 @@ def profile_block(label, threshold_ms=5):
                 result = await func(*args, **kwargs)
                 dt = (time.monotonic() - t0) * 1000
                 if dt > threshold_ms:
-                    logger.warning(f"[PERF] {label}: {dt:.1f} ms")
+                    _report(dt)
                 return result
             return wrapper
         else:
@@ -32,7 +48,7 @@ def profile_block(label, threshold_ms=5):
                 result = func(*args, **kwargs)
                 dt = (time.monotonic() - t0) * 1000
                 if dt > threshold_ms:
-                    logger.warning(f"[PERF] {label}: {dt:.1f} ms")
+                    _report(dt)
                 return result
             return wrapper
     return decorator
@@ -101,6 +117,7 @@ Dependencies:
     (faster-whisper only needed when backend=faster_whisper)
 """
 import asyncio
+import concurrent.futures
 
 try:
     import ujson as json  # v6.0 perf : 3-5x plus rapide que stdlib (audit perf)
@@ -108,6 +125,7 @@ except ImportError:
     import json
 
 import logging
+import math
 import os
 import sys
 import time
@@ -174,13 +192,30 @@ DEFAULT_COMPUTE_TYPE = "int8"    # int8 = fast CPU
 DEFAULT_BACKEND = "faster_whisper"  # 2026-05-04 : faster_whisper CPU (auparavant : whispercpp Vulkan)
 DEFAULT_THREADS = 6              # Optimised for RTX 3070 + Ryzen 5600
 SAMPLE_RATE = 16000
+# Sous 0.3 s, les deux backends renvoient un texte vide : inutile de payer
+# copie, débruitage, gain et aller-retour executor pour le savoir.
+MIN_TRANSCRIBE_BYTES = int(0.3 * SAMPLE_RATE) * 2
+# 1 s de silence PCM16 alloué une fois, en lecture seule : warmup et
+# keepalive en prennent une vue au lieu de réallouer des zéros.
+_SILENCE_1S = np.zeros(SAMPLE_RATE, dtype=np.int16)
+_SILENCE_1S.setflags(write=False)
+# Toutes les transcriptions (partiels, finals, keepalive, toutes sessions)
+# passent par ce thread unique : jamais deux décodages Whisper concurrents
+# qui se partageraient les threads CPU/BLAS, et plus de contention avec le
+# reste de l'executor par défaut.
+_WHISPER_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="whisper")
+# Variantes ggml quantifiées essayées (dans l'ordre) pour le backend whispercpp_cpu
+WHISPERCPP_CPU_QUANTS = ("q4_1", "q4_0", "q5_1", "q5_0", "q8_0")
+# Vulkan : q8_0 seulement (WER ~ f16, moitié moins d'octets de poids lus par token)
+WHISPERCPP_GPU_QUANTS = ("q8_0",)
 NOISE_REDUCTION_STRENGTH = 0.3   # 0.0 = off, 1.0 = max (light: C++ AGC already normalises)
 
-try:
-    import noisereduce  # noqa: F401
-    _noisereduce_available = True
-except ImportError:
-    _noisereduce_available = False
+# v6.0 perf audit : simple sonde find_spec — importer noisereduce tire scipy
+# (plusieurs centaines de ms au démarrage) même quand la réduction est à 0.
+# L'import réel est différé au premier appel de _apply_noise_reduction.
+import importlib.util
+_noisereduce_available = importlib.util.find_spec("noisereduce") is not None
 
 
 def _apply_noise_reduction(pcm: "np.ndarray", sr: int, strength: float) -> "np.ndarray":
@@ -232,6 +267,10 @@ def _is_hallucination(text: str) -> bool:
     if len(words) >= 3 and len(set(words)) == 1:
         logger.debug("Hallucination filter: repeated word: %r", text)
         return True
+    # Boucle de `in` volontaire : str.__contains__ (fastsearch C) sur ~30
+    # littéraux reste ~2x plus rapide qu'une alternance compilée "a|b|..."
+    # sous sre, mesuré sur des transcriptions propres (cas courant : aucun
+    # motif ne matche, tous sont testés).
     for pat in _HALLUCINATION_PATTERNS:
         if pat in lower:
             logger.debug("Hallucination filter: pattern %r in: %r", pat, text)
@@ -331,6 +370,18 @@ class STTEngine:
         model_dir = Path(os.environ.get("EXO_WHISPER_MODELS", str(project_root / "models" / "whisper")))
         model_path = str(model_dir / model_file)
 
+        # Décodage limité par la bande passante mémoire -> préférer une
+        # variante ggml quantifiée si elle a été téléchargée à côté du modèle
+        # f16 (ex. ggml-small-q5_1.bin) : 4/5/8 bits sur CPU, q8_0 sur Vulkan.
+        stem = model_file[:-len(".bin")]
+        for quant in (WHISPERCPP_GPU_QUANTS if use_gpu else WHISPERCPP_CPU_QUANTS):
+            candidate = model_dir / f"{stem}-{quant}.bin"
+            if candidate.is_file():
+                logger.info("whisper.cpp %s: using quantized model %s",
+                            "Vulkan" if use_gpu else "CPU", candidate.name)
+                model_path = str(candidate)
+                break
+
         if not os.path.isfile(model_path):
             raise FileNotFoundError(
                 f"Whisper.cpp model not found: {model_path}. "
@@ -366,6 +417,7 @@ class STTEngine:
             compute_type=compute,
             language=self.language,
             beam_size=self.beam_size,
+            cpu_threads=self.threads,
         )
         engine.load()
         self._engine = engine
@@ -403,6 +455,16 @@ class STTEngine:
 
         return result
 
+    def warmup(self) -> None:
+        """Run one throwaway inference so the first user request hits a hot model."""
+        if self._engine is None:
+            raise RuntimeError("Engine not loaded")
+        warm = getattr(self._engine, "warmup", None)
+        if warm is not None:
+            warm()
+        else:
+            self.transcribe(_SILENCE_1S)
+
     @property
     def actual_device(self) -> str:
         return self._actual_device
@@ -624,7 +686,7 @@ class STTSession:
                     # Final has fired and acquired the lock first — abort partial
                     return
                 result = await loop.run_in_executor(
-                    None, lambda: self.engine.transcribe(pcm)
+                    _WHISPER_EXECUTOR, lambda: self.engine.transcribe(pcm)
                 )
             if not self._recording:
                 # Recording stopped while partial was running — skip sending
@@ -655,12 +717,14 @@ class STTSession:
         # acquires the engine lock (no double POST to whisper-server).
         self._recording = False
 
-        if not self._audio_buffer:
+        if len(self._audio_buffer) < MIN_TRANSCRIBE_BYTES:
+            duration = len(self._audio_buffer) / (SAMPLE_RATE * 2)
+            self._audio_buffer.clear()
             await ws.send(json.dumps({
                 "type": "final",
                 "text": "",
                 "segments": [],
-                "duration": 0.0,
+                "duration": round(duration, 2),
             }))
             return
 
@@ -673,7 +737,10 @@ class STTSession:
         pcm = _apply_noise_reduction(pcm, SAMPLE_RATE, NOISE_REDUCTION_STRENGTH)
 
         # ── Gain normalization: gentle boost (C++ AGC already normalises) ──
-        peak = int(np.max(np.abs(pcm)))
+        # J5 : pic via max()/min() (pas de temporaire np.abs, ni de
+        # débordement int16 sur -32768) et calculé une seule fois : après le
+        # gain, il se déduit (gain <= target/peak -> aucun échantillon clippé).
+        peak = max(int(pcm.max()), -int(pcm.min())) if pcm.size else 0
         if peak > 0:
             target_peak = int(32768 * 0.8)  # -2 dBFS
             if peak < target_peak:
@@ -682,13 +749,19 @@ class STTSession:
                 # J5 : float32 suffit (PCM int16 * gain <= 6 -> max ~2e5,
                 # bien dans la mantisse float32). float64 doublait la BP
                 # memoire et la latence du multiply pour aucun gain de precision.
-                pcm = np.clip(pcm.astype(np.float32) * gain, -32768, 32767).astype(np.int16)
+                # Gain + clip in-place sur un seul tampon float32.
+                f = pcm.astype(np.float32)
+                f *= gain
+                np.clip(f, -32768, 32767, out=f)
+                pcm = f.astype(np.int16)
+                peak = min(int(peak * gain), 32767)
 
         # ── DEBUG: PCM statistics ──
-        # J5 : float32 OK (somme de carres int16, pcm <= 24kHz * 30s = 720k
-        # samples, max sumSq < 720k * 32768^2 ~= 7.7e14, dans la limite float32).
-        rms = float(np.sqrt(np.mean(pcm.astype(np.float32) ** 2)))
-        peak = int(np.max(np.abs(pcm)))
+        # Somme des carrés en un seul produit scalaire int64 (exact : 720k
+        # samples * 32768^2 ~= 7.7e14 << 2^63) au lieu de cast float32 +
+        # carré + moyenne, soit deux tableaux temporaires et trois passes.
+        pcm64 = pcm.astype(np.int64)
+        rms = math.sqrt(int(np.dot(pcm64, pcm64)) / pcm.size) if pcm.size else 0.0
         dur = len(pcm) / SAMPLE_RATE
         logger.info("PCM stats: samples=%d dur=%.2fs rms=%.1f peak=%d (%.1f dBFS)",
                      len(pcm), dur, rms, peak,
@@ -699,7 +772,7 @@ class STTSession:
             async with self._engine_lock:
                 result = await asyncio.wait_for(
                     loop.run_in_executor(
-                        None, lambda: self.engine.transcribe(pcm)
+                        _WHISPER_EXECUTOR, lambda: self.engine.transcribe(pcm)
                     ),
                     timeout=20.0
                 )
@@ -752,7 +825,7 @@ async def main() -> None:
                         choices=["whispercpp", "faster_whisper", "fasterwhisper_gpu", "whispercpp_cpu", "auto"],
                         help="STT backend: whispercpp (Vulkan GPU), fasterwhisper_gpu (CUDA), faster_whisper (auto GPU/CPU), whispercpp_cpu (CPU), auto")
     parser.add_argument("--threads", type=int, default=DEFAULT_THREADS,
-                        help="Number of threads for whisper.cpp (default: 6)")
+                        help="CPU threads for whisper.cpp / faster-whisper (default: 6)")
     parser.add_argument("--noise-reduction", type=float, default=NOISE_REDUCTION_STRENGTH,
                         help="Noise reduction strength (0.0=off, 1.0=max)")
     args = parser.parse_args()
@@ -800,8 +873,7 @@ async def main() -> None:
     # élevée sur la première vraie requête utilisateur. Non bloquant.
     try:
         t_warm = time.monotonic()
-        silence = np.zeros(16000, dtype=np.int16)  # 1 s de silence à 16 kHz
-        _ = engine.transcribe(silence)
+        engine.warmup()
         warm_ms = (time.monotonic() - t_warm) * 1000
         logger.info("[Latency] Warmup STT: OK (%.0f ms)", warm_ms)
     except Exception as exc:
@@ -819,7 +891,8 @@ async def main() -> None:
 
     server = await websockets.serve(
         handler, args.host, args.port,
-        **_v9.ws_serve_kwargs(max_size=10 * 1024 * 1024),
+        # PCM16 brut : permessage-deflate ne gagne rien et coûte du CPU par frame
+        **_v9.ws_serve_kwargs(max_size=10 * 1024 * 1024, compression=None),
     )
     logger.info("STT server running on ws://%s:%d (model=%s, device=%s, backend=%s)",
                 args.host, args.port, args.model, engine.actual_device, engine._active_backend)
@@ -830,7 +903,7 @@ async def main() -> None:
     _keepalive_lock = asyncio.Lock()
 
     async def _keepalive_loop():
-        silent_pcm = np.zeros(int(SAMPLE_RATE * 0.4), dtype=np.int16)
+        silent_pcm = _SILENCE_1S[:int(SAMPLE_RATE * 0.4)]
         loop = asyncio.get_running_loop()
         logger.info("[Keepalive] loop started (interval=20s, skip<15s)")
         while True:
@@ -840,7 +913,7 @@ async def main() -> None:
                 continue
             try:
                 async with _keepalive_lock:
-                    await loop.run_in_executor(None, lambda: engine.transcribe(silent_pcm))
+                    await loop.run_in_executor(_WHISPER_EXECUTOR, lambda: engine.transcribe(silent_pcm))
                 logger.info("[Keepalive] whisper-server warm")
             except Exception as e:
                 logger.warning("[Keepalive] failed: %s", e)
@@ -15,14 +15,15 @@ Usage from stt_server.py:
 
 from __future__ import annotations
 
-import io
+import http.client
 import json
 import logging
 import os
 import signal
+import struct
 import subprocess
+import threading
 import time
-import wave
 from pathlib import Path
 from typing import Optional
 
@@ -58,6 +59,12 @@ class WhisperCppEngine:
         self.host = host
         self.port = port
         self._process: subprocess.Popen | None = None
+        # Connexion HTTP keep-alive vers whisper-server, réutilisée d'un
+        # transcribe() à l'autre (évite un handshake TCP par requête).
+        self._conn: http.client.HTTPConnection | None = None
+        # HTTPConnection n'est pas thread-safe : un seul échange requête/réponse
+        # à la fois, quel que soit le thread d'executor qui appelle transcribe().
+        self._conn_lock = threading.Lock()
         self._base_url = f"http://{host}:{port}"
         self.last_transcribe_ts: float = 0.0  # monotonic timestamp of last transcribe()
 
@@ -96,6 +103,9 @@ class WhisperCppEngine:
             "--threads", str(self.threads),
             "--flash-attn",
             "--suppress-nst",
+            # Pas d'échelle de température : un seul décodage par requête
+            # (les relances +0.2 multipliaient la latence des clips courts)
+            "--no-fallback",
         ]
 
         logger.info("Starting whisper-server: %s", " ".join(cmd))
@@ -139,7 +149,16 @@ class WhisperCppEngine:
                 urllib.request.urlopen(req, timeout=2)
                 return
             except (urllib.error.URLError, ConnectionError, OSError):
-                time.sleep(0.5)
+                # Attente sur le process plutôt qu'un palier fixe de 500 ms :
+                # réveil immédiat s'il meurt (erreur levée au tour suivant),
+                # et sondage HTTP toutes les 50 ms (refus de connexion = ~0 coût).
+                if self._process is not None:
+                    try:
+                        self._process.wait(timeout=0.05)
+                    except subprocess.TimeoutExpired:
+                        pass
+                else:
+                    time.sleep(0.05)
 
         raise TimeoutError(
             f"whisper-server did not start within {timeout}s"
@@ -152,9 +171,6 @@ class WhisperCppEngine:
         Returns:
             {"text": str, "segments": list[dict], "duration": float}
         """
-        import urllib.request
-        import urllib.error
-
         duration = len(audio_pcm16) / SAMPLE_RATE
         if duration < 0.3:
             return {"text": "", "segments": [], "duration": duration}
@@ -166,21 +182,18 @@ class WhisperCppEngine:
         boundary = "----ExoWhisperBoundary"
         body = self._build_multipart(wav_bytes, boundary)
 
-        url = f"{self._base_url}/inference"
         headers = {
             "Content-Type": f"multipart/form-data; boundary={boundary}",
         }
 
         t0 = time.monotonic()
-        req = urllib.request.Request(url, data=body, headers=headers, method="POST")
         # Timeout : si whisper-server freeze (GPU idle / Vulkan asleep, contention
         # avec TTS Orpheus, etc.), on restart en ~10s au lieu de 30s. 10s laisse
         # de la marge en cas de freeze ponctuel sans declencher de restart inutile
         # (audio 10s, RTF ~0.1 => ~1s de calcul nominal).
         try:
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                raw = resp.read().decode("utf-8")
-        except (urllib.error.URLError, ConnectionError, OSError, TimeoutError) as e:
+            raw = self._post_inference(body, headers)
+        except (http.client.HTTPException, ConnectionError, OSError, TimeoutError) as e:
             logger.error("whisper-server request failed: %s — restarting server", e)
             self._restart_server()
             return {"text": "", "segments": [], "duration": round(duration, 2)}
@@ -219,15 +232,54 @@ class WhisperCppEngine:
             "duration": round(duration, 2),
         }
 
+    def _post_inference(self, body: bytes, headers: dict) -> str:
+        """POST /inference sur la connexion keep-alive (une reconnexion si
+        le serveur a fermé le socket entre deux requêtes)."""
+        with self._conn_lock:
+            return self._post_inference_locked(body, headers)
+
+    def _post_inference_locked(self, body: bytes, headers: dict) -> str:
+        for attempt in (0, 1):
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(self.host, self.port, timeout=10)
+            try:
+                self._conn.request("POST", "/inference", body=body, headers=headers)
+                resp = self._conn.getresponse()
+                raw = resp.read().decode("utf-8")
+            # Socket keep-alive fermé par le serveur pendant l'inactivité :
+            # ConnectionError couvre reset, broken pipe et, sous Windows,
+            # ConnectionAbortedError (WinError 10053).
+            except (http.client.RemoteDisconnected, ConnectionError):
+                self._drop_conn()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                self._drop_conn()
+                raise
+            if resp.status >= 400:
+                self._drop_conn()
+                raise http.client.HTTPException(f"HTTP {resp.status}: {raw[:200]}")
+            return raw
+        raise ConnectionError("whisper-server unreachable")
+
+    def _drop_conn(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
     def _pcm16_to_wav(self, pcm16: np.ndarray) -> bytes:
         """Convert int16 PCM array to WAV bytes in memory."""
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(pcm16.tobytes())
-        return buf.getvalue()
+        # En-tête RIFF écrit directement + join sur une vue du tableau : une
+        # seule copie du PCM (tobytes + wave/BytesIO + getvalue en faisaient 3).
+        pcm = np.ascontiguousarray(pcm16, dtype="<i2")
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + pcm.nbytes, b"WAVE",
+            b"fmt ", 16, 1, 1, SAMPLE_RATE, SAMPLE_RATE * 2, 2, 16,
+            b"data", pcm.nbytes,
+        )
+        return b"".join((header, memoryview(pcm).cast("B")))
 
     def _build_multipart(self, wav_bytes: bytes, boundary: str) -> bytes:
         """Build multipart/form-data body with audio file and parameters."""
@@ -237,7 +289,7 @@ class WhisperCppEngine:
         parts.append(
             f"--{boundary}\r\n"
             f'Content-Disposition: form-data; name="file"; filename="audio.wav"\r\n'
-            f"Content-Type: audio/wav\r\n\r\n"
+            f"Content-Type: audio/wav\r\n\r\n".encode("utf-8")
         )
         parts.append(wav_bytes)
         parts.append(b"\r\n")
@@ -255,19 +307,14 @@ class WhisperCppEngine:
             parts.append(
                 f"--{boundary}\r\n"
                 f'Content-Disposition: form-data; name="{key}"\r\n\r\n'
-                f"{value}\r\n"
+                f"{value}\r\n".encode("utf-8")
             )
 
-        parts.append(f"--{boundary}--\r\n")
+        parts.append(f"--{boundary}--\r\n".encode("utf-8"))
 
-        # Combine into bytes
-        result = b""
-        for part in parts:
-            if isinstance(part, str):
-                result += part.encode("utf-8")
-            else:
-                result += part
-        return result
+        # Un seul join : `result += part` recopiait tout le corps (WAV compris)
+        # à chaque morceau ajouté.
+        return b"".join(parts)
 
     @property
     def actual_device(self) -> str:
@@ -275,6 +322,8 @@ class WhisperCppEngine:
 
     def close(self) -> None:
         """Stop the whisper-server subprocess."""
+        with self._conn_lock:
+            self._drop_conn()
         if self._process:
             logger.info("Stopping whisper-server (pid=%d)", self._process.pid)
             self._process.terminate()
@@ -322,16 +371,17 @@ class WhisperCppEngine:
                         continue
             else:
                 # Fallback: blunt taskkill on every whisper-server.exe instance
-                # (no per-port filtering without psutil).
+                # (no per-port filtering without psutil). Un seul process :
+                # taskkill renvoie 128 quand aucune image ne correspond, inutile
+                # de sonder d'abord via tasklist.
                 r = subprocess.run(
-                    ["tasklist", "/FI", "IMAGENAME eq whisper-server.exe", "/FO", "CSV", "/NH"],
-                    capture_output=True, text=True, timeout=5,
+                    ["taskkill", "/F", "/IM", "whisper-server.exe"],
+                    capture_output=True, timeout=5,
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                    if os.name == "nt"
+                    else 0,
                 )
-                if "whisper-server.exe" in r.stdout:
-                    subprocess.run(
-                        ["taskkill", "/F", "/IM", "whisper-server.exe"],
-                        capture_output=True, timeout=5,
-                    )
+                if r.returncode == 0:
                     logger.warning("Killed orphan whisper-server.exe via taskkill (no psutil)")
                     killed = 1
             if killed:
@@ -247,6 +247,18 @@ async def run_all_tests(
 
 # ── Pretty print ─────────────────────────────────────────────────
 
+# Étiquettes colorées précalculées (statut -> (tag, affiche la latence)) :
+# plus de chaîne if/elif ni de f-string ANSI reconstruite par service et par boucle.
+_STATUS_TAGS: dict[str, tuple[str, bool]] = {
+    "ok":        (_green(f"{'OK':>8}"), True),
+    "timeout":   (_yellow(f"{'TIMEOUT':>8}"), False),
+    "down":      (_red(f"{'DOWN':>8}"), False),
+    "flapping":  (_yellow(f"{'FLAP':>8}"), True),
+    "cancelled": (_yellow(f"{'CANCEL':>8}"), False),
+}
+_STATUS_TAG_ERROR: tuple[str, bool] = (_red(f"{'ERROR':>8}"), False)
+
+
 def print_report(report: TestReport) -> None:
     """Print a human-readable summary."""
     print(f"\n{'═' * 60}")
@@ -259,24 +271,8 @@ def print_report(report: TestReport) -> None:
         status = entry["status"]
         latency = entry.get("latency_ms", "")
 
-        if status == "ok":
-            tag = _green(f"{'OK':>8}")
-            lat = f"  {latency:>6.0f} ms" if latency != "" else ""
-        elif status == "timeout":
-            tag = _yellow(f"{'TIMEOUT':>8}")
-            lat = ""
-        elif status == "down":
-            tag = _red(f"{'DOWN':>8}")
-            lat = ""
-        elif status == "flapping":
-            tag = _yellow(f"{'FLAP':>8}")
-            lat = f"  {latency:>6.0f} ms" if latency != "" else ""
-        elif status == "cancelled":
-            tag = _yellow(f"{'CANCEL':>8}")
-            lat = ""
-        else:
-            tag = _red(f"{'ERROR':>8}")
-            lat = ""
+        tag, show_latency = _STATUS_TAGS.get(status, _STATUS_TAG_ERROR)
+        lat = f"  {latency:>6.0f} ms" if show_latency and latency != "" else ""
 
         error = f"  ({entry.get('error', '')})" if entry.get("error") else ""
         print(f"  {name:<{col_w}} {tag}{lat}{error}")
@@ -357,7 +353,7 @@ async def start_missing_services(down_services: list[str]) -> list[str]:
             continue
 
         port = SERVICES.get(name)
-        if port and _port_is_open(port):
+        if port and await _port_is_open(port):
             print(f"  {_green(f'✔ {name} déjà actif sur :{port}')}")
             continue
 
@@ -385,35 +381,45 @@ async def start_missing_services(down_services: list[str]) -> list[str]:
             print(f"  {_red(f'✗ Échec démarrage {name}: {e}')}")
 
     # Wait for ports to open (up to 5 seconds)
+    # Sondage court (100 ms) dès le lancement : plus de palier fixe de 0.5 s
+    # avant le premier check, un service déjà prêt est détecté immédiatement.
     if started:
         print(f"\n  Attente disponibilité ({len(started)} services) …")
-        for attempt in range(10):
-            await asyncio.sleep(0.5)
-            all_up = True
-            for name in started:
-                port = SERVICES.get(name, 0)
-                if not _port_is_open(port):
-                    all_up = False
-                    break
-            if all_up:
-                print(f"  {_green(f'✔ Tous les services démarrés ({(attempt + 1) * 0.5:.1f}s)')}")
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        pending = list(started)
+        while True:
+            # Sondes concurrentes et non bloquantes : un connect() synchrone
+            # gelait la boucle jusqu'à 0.5 s par service encore en attente.
+            is_open = await asyncio.gather(
+                *(_port_is_open(SERVICES.get(n, 0)) for n in pending)
+            )
+            pending = [n for n, ok in zip(pending, is_open) if not ok]
+            if not pending:
+                print(f"  {_green(f'✔ Tous les services démarrés ({loop.time() - t0:.1f}s)')}")
                 break
-        else:
-            still_down = [n for n in started if not _port_is_open(SERVICES.get(n, 0))]
-            if still_down:
-                print(f"  {_yellow('Timeout: ' + ', '.join(still_down) + ' toujours DOWN après 5s')}")
+            if loop.time() - t0 >= 5.0:
+                print(f"  {_yellow('Timeout: ' + ', '.join(pending) + ' toujours DOWN après 5s')}")
+                break
+            await asyncio.sleep(0.1)
 
     return started
 
 
-def _port_is_open(port: int) -> bool:
-    """Check if a TCP port is open on localhost."""
-    import socket
+async def _port_is_open(port: int, timeout: float = 0.5) -> bool:
+    """Check if a TCP port is open on localhost (never blocks the event loop)."""
     try:
-        with socket.create_connection(("localhost", port), timeout=0.5):
-            return True
-    except (ConnectionRefusedError, OSError, TimeoutError):
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection("localhost", port), timeout=timeout
+        )
+    except (OSError, asyncio.TimeoutError):
         return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
 
 
 # ── Main loop ────────────────────────────────────────────────────
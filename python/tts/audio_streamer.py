@@ -77,10 +77,16 @@ def merge_and_chunk(blocks: Iterable[bytes],
         if not blk:
             continue
         buf.extend(blk)
-        while len(buf) >= target:
-            out = bytes(buf[:target])
-            del buf[:target]
-            yield out
+        take = len(buf) - len(buf) % target
+        if not take:
+            continue
+        # Une seule copie par chunk (vue -> bytes, au lieu de slice bytearray
+        # puis bytes()) et un seul compactage du tampon par bloc reçu. La vue
+        # est relâchée avant le del et avant tout yield.
+        with memoryview(buf) as mv:
+            outs = [mv[off:off + target].tobytes() for off in range(0, take, target)]
+        del buf[:take]
+        yield from outs
     if buf:
         yield bytes(buf)
 
@@ -24,14 +24,18 @@ import argparse
 import asyncio
 import json
 import logging
+import os
 import time
 import urllib.request
 import wave
 from dataclasses import dataclass
-from typing import AsyncIterator, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Optional
 
 import websockets
 
+if TYPE_CHECKING:
+    from shared.cache import PhraseCache
+
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8767
 DEFAULT_VOICE = "exo_default"
@@ -63,6 +67,9 @@ class TTSClient:
         connect_timeout: float = 10.0,
         # Timeout *par chunk* (réinitialisé à chaque message reçu).
         chunk_timeout: float = 30.0,
+        # Cache LRU des phrases courtes (accusés, erreurs) : un hit évite
+        # l'aller-retour serveur et toute l'inférence Orpheus.
+        cache: Optional["PhraseCache"] = None,
     ) -> None:
         self.host = host
         self.port = port
@@ -70,6 +77,7 @@ class TTSClient:
         self.lang = lang
         self.connect_timeout = connect_timeout
         self.chunk_timeout = chunk_timeout
+        self.cache = cache
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
 
     @property
@@ -91,7 +99,9 @@ class TTSClient:
     async def connect(self) -> None:
         logger.info("[TTSClient] Connecting to %s", self.url)
         self._ws = await asyncio.wait_for(
-            websockets.connect(self.url, max_size=None, ping_interval=20),
+            # Flux PCM16 brut : compression=None évite la négociation
+            # permessage-deflate (CPU par chunk sans gain sur de l'audio).
+            websockets.connect(self.url, max_size=None, ping_interval=20, compression=None),
             timeout=self.connect_timeout,
         )
         # Attente du message "ready" envoyé par le serveur.
@@ -157,8 +167,35 @@ class TTSClient:
             if t == "error":
                 raise RuntimeError(f"Server error: {obj.get('message')}")
 
-    async def synthesize(self, text: str, *, rate: float = 1.0) -> SynthesisResult:
-        """Helper qui collecte tous les chunks + retourne les métriques."""
+    async def synthesize(
+        self,
+        text: str,
+        *,
+        rate: float = 1.0,
+        on_chunk: Optional[Callable[[bytes], object]] = None,
+    ) -> SynthesisResult:
+        """Helper qui collecte tous les chunks + retourne les métriques.
+
+        ``on_chunk`` reçoit chaque chunk PCM dès sa réception (écriture WAV
+        progressive, lecture) au lieu d'attendre la fin de la synthèse.
+        """
+        # rate != 1.0 change l'audio mais pas la clé (texte|voix|langue)
+        cacheable = self.cache is not None and rate == 1.0
+        if cacheable:
+            pcm = await self.cache.aget(text, self.voice, self.lang)
+            if pcm is not None:
+                logger.info("[TTSClient] Cache hit (%d bytes): %s", len(pcm), text[:40])
+                if on_chunk is not None:
+                    on_chunk(pcm)
+                return SynthesisResult(
+                    pcm=pcm,
+                    first_chunk_ms=0,
+                    total_ms=0,
+                    duration_s=len(pcm) / 2.0 / SAMPLE_RATE,
+                    chunks=1,
+                    rtf=0.0,
+                )
+
         t0 = time.monotonic()
         first_chunk_ms = -1
         chunks_list: list[bytes] = []
@@ -167,8 +204,12 @@ class TTSClient:
                 first_chunk_ms = int((time.monotonic() - t0) * 1000)
                 logger.info("[TTSClient] First chunk received in %d ms", first_chunk_ms)
             chunks_list.append(chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
         end = getattr(self, "last_metrics", {}) or {}
         pcm = b"".join(chunks_list)
+        if cacheable and pcm:
+            await self.cache.aput(text, self.voice, self.lang, pcm)
         total_ms = int(end.get("total_ms") or (time.monotonic() - t0) * 1000)
         duration_s = float(end.get("duration") or (len(pcm) / 2.0 / SAMPLE_RATE))
         rtf = float(end.get("rtf") or (total_ms / 1000.0 / duration_s if duration_s > 0 else 0.0))
@@ -186,12 +227,12 @@ class TTSClient:
         )
 
 
-def _save_wav(path: str, pcm: bytes) -> None:
-    with wave.open(path, "wb") as w:
-        w.setnchannels(1)
-        w.setsampwidth(2)
-        w.setframerate(SAMPLE_RATE)
-        w.writeframes(pcm)
+def _open_wav(path: str) -> wave.Wave_write:
+    w = wave.open(path, "wb")
+    w.setnchannels(1)
+    w.setsampwidth(2)
+    w.setframerate(SAMPLE_RATE)
+    return w
 
 
 async def _amain(args: argparse.Namespace) -> int:
@@ -200,16 +241,28 @@ async def _amain(args: argparse.Namespace) -> int:
         format="%(asctime)s [TTS-CLIENT] %(levelname)s %(message)s",
         datefmt="%H:%M:%S",
     )
-    cli = TTSClient(host=args.host, port=args.port, voice=args.voice)
+    cache = None
+    if args.cache_dir:
+        from shared.cache import PhraseCache
+        cache = PhraseCache(cache_dir=args.cache_dir)
+    cli = TTSClient(host=args.host, port=args.port, voice=args.voice, cache=cache)
 
     if args.health_only:
         print(json.dumps(cli.health_sync(), indent=2))
         return 0
 
     async with cli:
-        result = await cli.synthesize(args.text, rate=args.rate)
-        if args.out and not args.no_save:
-            _save_wav(args.out, result.pcm)
+        # Écriture WAV au fil des chunks (l'en-tête est finalisé à la fermeture).
+        wav = _open_wav(args.out) if args.out and not args.no_save else None
+        try:
+            result = await cli.synthesize(
+                args.text, rate=args.rate,
+                on_chunk=wav.writeframes if wav is not None else None,
+            )
+        finally:
+            if wav is not None:
+                wav.close()
+        if wav is not None:
             print(f"WAV écrit: {args.out}")
         print(json.dumps({
             "first_chunk_ms": result.first_chunk_ms,
@@ -230,6 +283,8 @@ def main() -> None:
     ap.add_argument("--rate", type=float, default=1.0)
     ap.add_argument("--out", default="tts_client_out.wav")
     ap.add_argument("--no-save", action="store_true")
+    ap.add_argument("--cache-dir", default=os.environ.get("EXO_TTS_CACHE_DIR", ""),
+                    help="Cache disque des phrases courtes (PCM), conservé entre deux runs.")
     ap.add_argument("--health-only", action="store_true",
                     help="Affiche /health et quitte.")
     args = ap.parse_args()
@@ -6,7 +6,7 @@ real-time voice activity detection scores using Silero VAD.
 
 Protocol:
   → Binary: PCM16 audio chunks (16kHz mono)
-  → JSON:   {"type": "config", "threshold": 0.5}
+  → JSON:   {"type": "config", "threshold": 0.5, "hang_ms": 800}
              {"type": "reset"}
   ← JSON:   {"type": "ready", "model": "silero_vad"}
              {"type": "vad", "score": 0.85, "is_speech": true}
@@ -41,7 +41,9 @@ import os as _os
 if "TORCH_HOME" not in _os.environ:
     _os.environ["TORCH_HOME"] = "D:/EXO/cache/torch"
 
-import torch
+# torch (~1-2 s, plusieurs centaines de Mo) n'est importé que dans
+# SileroVAD.load() : --help et une instance doublon refusée par le singleton
+# guard ne le chargent plus.
 
 # Singleton guard — prevent duplicate instances
 from shared.singleton_guard import ensure_single_instance
@@ -89,6 +91,25 @@ DEFAULT_PORT = 8768
 SAMPLE_RATE = 16000
 # Silero VAD expects chunks of 512 samples at 16kHz (32ms)
 CHUNK_SAMPLES = 512
+CHUNK_MS = CHUNK_SAMPLES * 1000 // SAMPLE_RATE
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+# Silence avant speech-end. Le hang pilote directement la latence de fin de
+# tour ; Silero décide par trame de 32 ms, donc un client qui parle en
+# commandes courtes peut le baisser (~300-500 ms) sans recalibrer un seuil
+# d'énergie. 800 ms tolère les pauses naturelles en milieu de phrase.
+DEFAULT_HANG_MS = 800
+
+# v6.0 perf audit : message "vad" émis pour CHAQUE chunk de 32 ms. Les deux
+# variantes de l'en-tête sont pré-encodées une fois ; seul le score est
+# formaté à chaud (évite un json.dumps de dict ~31x/s par client).
+_VAD_MSG_SPEECH = '{"type":"vad","is_speech":true,"score":%s}'
+_VAD_MSG_SILENCE = '{"type":"vad","is_speech":false,"score":%s}'
+
+
+def _encode_vad_msg(score: float, is_speech: bool) -> str:
+    """Sérialise un résultat VAD à partir des templates pré-encodés."""
+    tpl = _VAD_MSG_SPEECH if is_speech else _VAD_MSG_SILENCE
+    return tpl % round(score, 4)
 
 
 class SileroVAD:
@@ -96,18 +117,21 @@ class SileroVAD:
 
     def __init__(self) -> None:
         self._model = None
+        self._torch = None
         self._threshold = 0.5
         self._is_speech = False
         self._speech_frames = 0
         self._silence_frames = 0
         self._speech_start_frames = 2
-        self._speech_hang_frames = 25  # ~800ms at 32ms chunks — tolerates natural mid-sentence pauses
+        self._speech_hang_frames = DEFAULT_HANG_MS // CHUNK_MS
 
     def load(self) -> None:
         """Load Silero VAD model."""
         t0 = time.monotonic()
         try:
+            import torch
             from silero_vad import load_silero_vad
+            self._torch = torch
             # onnx=True : utilise onnxruntime (déjà installé) au lieu du JIT torch.
             # Économie ~150 MB RAM vs mode JIT par défaut. Inférence équivalente
             # (le wrapper accepte toujours torch.Tensor en entrée).
@@ -140,18 +164,38 @@ class SileroVAD:
         if self._model is None:
             return 0.0, False
 
-        # Convert to float32 tensor
-        audio = torch.from_numpy(pcm16.astype(np.float32) / 32768.0)
+        # Cast + mise à l'échelle en un seul passage (astype puis / créait
+        # deux tableaux float32)
+        audio = np.multiply(pcm16, _PCM16_SCALE, dtype=np.float32)
 
         # Silero expects exactly 512 samples at 16kHz
-        if len(audio) != CHUNK_SAMPLES:
-            # Pad or truncate
-            if len(audio) < CHUNK_SAMPLES:
-                audio = torch.nn.functional.pad(audio, (0, CHUNK_SAMPLES - len(audio)))
-            else:
-                audio = audio[:CHUNK_SAMPLES]
+        if len(audio) < CHUNK_SAMPLES:
+            audio = np.pad(audio, (0, CHUNK_SAMPLES - len(audio)))
+        elif len(audio) > CHUNK_SAMPLES:
+            audio = audio[:CHUNK_SAMPLES]
+
+        return self._step(audio)
+
+    def process_chunks(self, frames: np.ndarray) -> list[tuple[float, bool]]:
+        """
+        Process several CHUNK_SAMPLES frames in a single call.
 
-        score = float(self._model(audio, SAMPLE_RATE))
+        Args:
+            frames: int16 array of shape (n, CHUNK_SAMPLES)
+
+        Returns:
+            One (score, is_speech) tuple per frame, in order.
+        """
+        if self._model is None:
+            return [(0.0, False)] * len(frames)
+        # Conversion int16 -> float32 faite une fois pour tout le bloc ; les
+        # lignes d'un tableau C-contigu sont passées telles quelles (vues).
+        audio = np.multiply(frames, _PCM16_SCALE, dtype=np.float32)
+        return [self._step(row) for row in audio]
+
+    def _step(self, audio: np.ndarray) -> tuple[float, bool]:
+        """Run Silero on one float32 frame and update the speech hysteresis."""
+        score = float(self._model(self._torch.from_numpy(audio), SAMPLE_RATE))
 
         # Update speech state with hysteresis
         frame_is_speech = score >= self._threshold
@@ -161,7 +205,6 @@ class SileroVAD:
         else:
             self._silence_frames += 1
 
-        prev_speech = self._is_speech
         if not self._is_speech:
             if self._speech_frames >= self._speech_start_frames:
                 self._is_speech = True
@@ -171,7 +214,7 @@ class SileroVAD:
                 self._is_speech = False
                 self._speech_frames = 0
                 logger.debug("[Latency] VAD speech-end after %d silence frames (~%d ms)",
-                            self._silence_frames, self._silence_frames * 32)
+                            self._silence_frames, self._silence_frames * CHUNK_MS)
 
         return score, self._is_speech
 
@@ -183,6 +226,14 @@ class SileroVAD:
     def threshold(self, value: float) -> None:
         self._threshold = max(0.01, min(0.99, value))
 
+    @property
+    def hang_ms(self) -> int:
+        return self._speech_hang_frames * CHUNK_MS
+
+    @hang_ms.setter
+    def hang_ms(self, value: float) -> None:
+        self._speech_hang_frames = max(1, min(100, round(value / CHUNK_MS)))
+
 
 # ---------------------------------------------------------------------------
 # WebSocket handler
@@ -239,31 +290,47 @@ class VADSession:
             if "threshold" in msg:
                 self.vad.threshold = float(msg["threshold"])
                 logger.info("VAD threshold: %.2f", self.vad.threshold)
+            if "hang_ms" in msg:
+                self.vad.hang_ms = float(msg["hang_ms"])
+                logger.info("VAD hang: %d ms", self.vad.hang_ms)
         elif msg_type == "reset":
             self.vad.reset()
 
     async def _on_audio(self, ws, data: bytes) -> None:
         """Process incoming audio and return VAD score."""
-        self._chunk_buffer.extend(data)
-
         # Process in CHUNK_SAMPLES-sized blocks
         chunk_bytes = CHUNK_SAMPLES * 2  # 2 bytes per int16 sample
-        while len(self._chunk_buffer) >= chunk_bytes:
-            chunk = self._chunk_buffer[:chunk_bytes]
-            self._chunk_buffer = self._chunk_buffer[chunk_bytes:]
-
-            pcm = np.frombuffer(bytes(chunk), dtype=np.int16)
-            # Run Silero RNN inference in default executor to avoid blocking event loop.
-            loop = asyncio.get_running_loop()
-            score, is_speech = await loop.run_in_executor(
-                None, self.vad.process_chunk, pcm
-            )
-
-            await ws.send(json.dumps({
-                "type": "vad",
-                "score": round(score, 4),
-                "is_speech": is_speech,
-            }))
+        if not self._chunk_buffer and len(data) % chunk_bytes == 0:
+            # Cas nominal (message = N frames entières, rien en attente) : vue
+            # numpy directe sur le message `bytes` immuable, sans passer par
+            # le buffer de session (extend + 2 copies par tranche).
+            n_chunks = len(data) // chunk_bytes
+            if n_chunks == 0:
+                return
+            block = data
+        else:
+            self._chunk_buffer.extend(data)
+            n_chunks = len(self._chunk_buffer) // chunk_bytes
+            if n_chunks == 0:
+                return
+            # v6.0 perf audit : toutes les frames complètes du message sont
+            # envoyées en UN seul aller-retour executor (au lieu d'un par frame
+            # de 32 ms) — le client pousse typiquement 2-4 frames par message.
+            take = n_chunks * chunk_bytes
+            block = self._chunk_buffer[:take]
+            self._chunk_buffer = self._chunk_buffer[take:]
+
+        # J5 : `block` est une copie détachée du buffer de session (ou le
+        # message lui-même) -> vue numpy zero-copy, jamais modifiée ensuite.
+        frames = np.frombuffer(block, dtype=np.int16).reshape(n_chunks, CHUNK_SAMPLES)
+        # Run Silero RNN inference in default executor to avoid blocking event loop.
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None, self.vad.process_chunks, frames
+        )
+
+        for score, is_speech in results:
+            await ws.send(_encode_vad_msg(score, is_speech))
 
 
 # ---------------------------------------------------------------------------
@@ -277,9 +344,12 @@ async def main() -> None:
 
     # Lecture seuil par defaut depuis ConfigManager (vad.threshold).
     _cfg_threshold = 0.5
+    _cfg_hang_ms = DEFAULT_HANG_MS
     try:
         from shared.config_manager import ConfigManager
-        _cfg_threshold = float(ConfigManager.instance().get("vad.threshold", 0.5))
+        _cfg = ConfigManager.instance()
+        _cfg_threshold = float(_cfg.get("vad.threshold", 0.5))
+        _cfg_hang_ms = float(_cfg.get("vad.hang_ms", DEFAULT_HANG_MS))
     except Exception:
         pass
 
@@ -288,6 +358,8 @@ async def main() -> None:
     parser.add_argument("--port", type=int, default=DEFAULT_PORT)
     parser.add_argument("--threshold", type=float, default=_cfg_threshold,
                         help="VAD threshold (0.01-0.99)")
+    parser.add_argument("--hang-ms", type=float, default=_cfg_hang_ms,
+                        help="Silence before speech-end, in ms (32 ms steps)")
     args = parser.parse_args()
 
     # Prevent duplicate instances
@@ -296,6 +368,7 @@ async def main() -> None:
 
     vad = SileroVAD()
     vad.threshold = args.threshold
+    vad.hang_ms = args.hang_ms
     vad.load()
 
     # Mutex : un seul client VAD actif à la fois (état interne RNN non partageable)
@@ -335,12 +408,13 @@ async def main() -> None:
 
     server = await websockets.serve(
         handler, args.host, args.port,
-        **_v9.ws_serve_kwargs(),
+        # PCM16 brut : permessage-deflate ne gagne rien et coûte du CPU par frame
+        **_v9.ws_serve_kwargs(compression=None),
     )
     logger.info("VAD server running on ws://%s:%d (threshold=%.2f, hang_frames=%d)",
                 args.host, args.port, vad.threshold, vad._speech_hang_frames)
     logger.info("[Latency] VAD: speech_hang=~%d ms, speech_start=~%d ms",
-                vad._speech_hang_frames * 32, vad._speech_start_frames * 32)
+                vad.hang_ms, vad._speech_start_frames * CHUNK_MS)
     logger.info("[Latency] Streaming: OK — ready for low-latency VAD")
 
     try:
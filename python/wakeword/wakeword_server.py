@@ -155,6 +155,18 @@ class WakeWordEngine:
         prediction = self._model.predict(pcm16)
         return {k: float(v) for k, v in prediction.items()}
 
+    def process_chunks(self, frames: np.ndarray) -> list[dict[str, float]]:
+        """
+        Process several CHUNK_SAMPLES frames in a single call.
+
+        Args:
+            frames: int16 array of shape (n, CHUNK_SAMPLES)
+
+        Returns:
+            One {model_name: score} dict per frame, in order.
+        """
+        return [self.process_chunk(frame) for frame in frames]
+
     @property
     def threshold(self) -> float:
         return self._threshold
@@ -226,30 +238,45 @@ class WakeWordSession:
 
     async def _on_audio(self, ws, data: bytes) -> None:
         """Process incoming audio for wake word detection."""
-        self._chunk_buffer.extend(data)
-
         chunk_bytes = CHUNK_SAMPLES * 2
-        while len(self._chunk_buffer) >= chunk_bytes:
-            chunk = self._chunk_buffer[:chunk_bytes]
-            self._chunk_buffer = self._chunk_buffer[chunk_bytes:]
-
-            self._chunk_start_time = time.monotonic()
-            pcm = np.frombuffer(bytes(chunk), dtype=np.int16)
-            # Run ONNX inference in default executor to avoid blocking event loop.
-            loop = asyncio.get_running_loop()
-            scores = await loop.run_in_executor(
-                None, self.engine.process_chunk, pcm
-            )
-
-            # Only send if any model exceeds threshold + cooldown elapsed
-            now = time.monotonic()
+        if not self._chunk_buffer and len(data) % chunk_bytes == 0:
+            # Cas nominal (frames entières, rien en attente) : vue directe sur
+            # le message immuable, sans extend + copies du buffer de session.
+            n_chunks = len(data) // chunk_bytes
+            if n_chunks == 0:
+                return
+            block = data
+        else:
+            self._chunk_buffer.extend(data)
+            n_chunks = len(self._chunk_buffer) // chunk_bytes
+            if n_chunks == 0:
+                return
+            # v6.0 perf audit : un seul aller-retour executor pour toutes les
+            # frames complètes reçues (cf. vad_server) au lieu d'un par frame.
+            take = n_chunks * chunk_bytes
+            block = self._chunk_buffer[:take]
+            self._chunk_buffer = self._chunk_buffer[take:]
+
+        self._chunk_start_time = time.monotonic()
+        # J5 : `block` est une copie détachée du buffer de session (ou le
+        # message lui-même) -> vue numpy zero-copy, jamais modifiée ensuite.
+        frames = np.frombuffer(block, dtype=np.int16).reshape(n_chunks, CHUNK_SAMPLES)
+        # Run ONNX inference in default executor to avoid blocking event loop.
+        loop = asyncio.get_running_loop()
+        all_scores = await loop.run_in_executor(
+            None, self.engine.process_chunks, frames
+        )
+
+        # Only send if any model exceeds threshold + cooldown elapsed
+        now = time.monotonic()
+        for scores in all_scores:
             for model_name, score in scores.items():
                 if score >= self.engine.threshold:
                     if (now - self._last_detection_time) < DETECTION_COOLDOWN_S:
                         logger.debug("Wake word suppressed (cooldown): %s (%.3f)", model_name, score)
                         continue
                     self._last_detection_time = now
-                    detect_ms = (now - self._chunk_start_time) * 1000 if hasattr(self, '_chunk_start_time') else 0
+                    detect_ms = (now - self._chunk_start_time) * 1000
                     await ws.send(json.dumps({
                         "type": "wakeword",
                         "word": model_name,
@@ -304,7 +331,8 @@ async def main() -> None:
 
     server = await websockets.serve(
         handler, args.host, args.port,
-        **_v9.ws_serve_kwargs(),
+        # PCM16 brut : permessage-deflate ne gagne rien et coûte du CPU par frame
+        **_v9.ws_serve_kwargs(compression=None),
     )
     logger.info("WakeWord server running on ws://%s:%d (models=%s, threshold=%.2f)",
                 args.host, args.port, engine.active_models, engine.threshold)
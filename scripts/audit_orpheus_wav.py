@@ -30,7 +30,6 @@ import asyncio
 import base64
 import json
 import shutil
-import struct
 import subprocess
 import sys
 import math
@@ -39,6 +38,8 @@ import wave
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 DEFAULT_TEXT = (
     "Bonjour, ceci est un test audio de reference pour diagnostiquer "
     "les craquements dans le pipeline EXO. La synthese est realisee a "
@@ -62,10 +63,10 @@ def synth_http(url: str, text: str, voice: Optional[str], timeout: float) -> byt
         headers={"Content-Type": "application/json"},
         method="POST",
     )
-    t0 = time.time()
+    t0 = time.perf_counter()
     with urllib.request.urlopen(req, timeout=timeout) as resp:
         body = resp.read()
-    elapsed = time.time() - t0
+    elapsed = time.perf_counter() - t0
     obj = json.loads(body)
     if "audio_b64" not in obj:
         raise RuntimeError(f"reponse HTTP inattendue : {list(obj.keys())}")
@@ -106,7 +107,7 @@ async def synth_ws_async(url: str, text: str, voice: Optional[str], timeout: flo
         if voice:
             req["voice"] = voice
         await ws.send(json.dumps(req))
-        t0 = time.time()
+        t0 = time.perf_counter()
         while True:
             try:
                 msg = await asyncio.wait_for(ws.recv(), timeout=timeout)
@@ -127,7 +128,7 @@ async def synth_ws_async(url: str, text: str, voice: Optional[str], timeout: flo
                         sample_rate = int(sr)
                     print(f"[WS] {ev} sample_rate={sample_rate} voice={obj.get('voice')}")
                 elif ev in ("end", "done", "finished"):
-                    print(f"[WS] done elapsed={time.time()-t0:.2f}s "
+                    print(f"[WS] done elapsed={time.perf_counter()-t0:.2f}s "
                           f"chunks={len(pcm_chunks)} bytes={sum(len(c) for c in pcm_chunks)}")
                     break
                 elif ev == "error":
@@ -178,13 +179,14 @@ def analyze_wav(path: Path) -> dict:
 
     # Statistiques amplitude (PCM16 mono attendu)
     if sw == 2 and nch == 1 and nframes > 0:
-        # Decode int16
-        samples = struct.unpack(f"<{nframes}h", raw)
-        n = len(samples)
-        peak = max(abs(s) for s in samples)
-        rms = (sum(s * s for s in samples) / n) ** 0.5
-        clip_count = sum(1 for s in samples if s >= 32760 or s <= -32760)
-        sil_count = sum(1 for s in samples if -10 <= s <= 10)
+        # Vue int16 zero-copy + réductions NumPy (4 boucles Python par
+        # échantillon auparavant). int64 : somme des carrés sans débordement.
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.int64)
+        n = samples.size
+        peak = int(np.abs(samples).max())
+        rms = math.sqrt(int(np.dot(samples, samples)) / n)
+        clip_count = int(np.count_nonzero((samples >= 32760) | (samples <= -32760)))
+        sil_count = int(np.count_nonzero(np.abs(samples) <= 10))
         info["peak"]            = peak
         info["rms"]             = round(rms, 1)
         info["clipping_pct"]    = round(100.0 * clip_count / n, 4)
@@ -39,6 +39,10 @@ EXO_SERVICES = {
 
 WHISPER_SERVER_EXE = "whisper-server.exe"
 
+# wmic / tasklist / taskkill sont des exécutables console : sans ce flag,
+# chaque appel lancé depuis pythonw ou la GUI alloue une console (flash).
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
 # Max allowed Node watchers and Code Helper processes
 MAX_NODE_WATCHERS = 3
 MAX_CODE_HELPERS = 20
@@ -78,6 +82,7 @@ def _get_processes() -> list[ProcessInfo]:
              "ProcessId,Name,WorkingSetSize,CommandLine",
              "/format:csv"],
             capture_output=True, text=True, timeout=15,
+            creationflags=_NO_WINDOW,
         )
         for line in result.stdout.strip().splitlines():
             parts = line.split(",")
@@ -102,6 +107,7 @@ def _get_processes() -> list[ProcessInfo]:
         result = subprocess.run(
             ["tasklist", "/v", "/fo", "csv"],
             capture_output=True, text=True, timeout=10,
+            creationflags=_NO_WINDOW,
         )
         for line in result.stdout.strip().splitlines()[1:]:
             parts = line.strip('"').split('","')
@@ -129,6 +135,7 @@ def _kill_process(pid: int) -> bool:
         subprocess.run(
             ["taskkill", "/pid", str(pid), "/f"],
             capture_output=True, timeout=5,
+            creationflags=_NO_WINDOW,
         )
         return True
     except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
@@ -243,24 +250,23 @@ def _execute_cleanup(report: CleanupReport, do_kill: bool) -> None:
 
 def _print_report(report: CleanupReport, do_kill: bool) -> None:
     """Print a human-readable report."""
-    print()
-    print("=" * 70)
-    print("  EXO ZOMBIE PROCESS REPORT")
-    print("=" * 70)
+    # Rapport assemblé en mémoire puis écrit en une fois (un seul write
+    # au lieu d'une trentaine de print, sensible quand stdout est capturé).
+    lines: list[str] = ["", "=" * 70, "  EXO ZOMBIE PROCESS REPORT", "=" * 70]
 
     def _section(title: str, items: list[ProcessInfo]) -> None:
         if not items:
-            print(f"\n  {title}: (none)")
+            lines.append(f"\n  {title}: (none)")
             return
-        print(f"\n  {title}: {len(items)} found")
+        lines.append(f"\n  {title}: {len(items)} found")
         for p in items:
             status = ""
             if do_kill and p in report.killed:
                 status = " [KILLED]"
             elif do_kill and p not in report.killed:
                 status = " [FAILED]"
-            print(f"    PID {p.pid:>6}  {p.ram_mb:>8.1f} MB  "
-                  f"{p.service or p.name}{status}")
+            lines.append(f"    PID {p.pid:>6}  {p.ram_mb:>8.1f} MB  "
+                         f"{p.service or p.name}{status}")
 
     _section("Python duplicates", report.python_duplicates)
     _section("Whisper-server duplicates", report.whisper_duplicates)
@@ -270,27 +276,29 @@ def _print_report(report: CleanupReport, do_kill: bool) -> None:
     total = (len(report.python_duplicates) + len(report.whisper_duplicates) +
              len(report.node_excess) + len(report.code_helper_excess))
 
-    print()
-    print("-" * 70)
-    print(f"  Total zombie/duplicate processes: {total}")
-    print(f"  Total RAM occupied: {report.ram_before_mb:.0f} MB "
-          f"({report.ram_before_mb / 1024:.1f} GB)")
+    lines.append("")
+    lines.append("-" * 70)
+    lines.append(f"  Total zombie/duplicate processes: {total}")
+    lines.append(f"  Total RAM occupied: {report.ram_before_mb:.0f} MB "
+                 f"({report.ram_before_mb / 1024:.1f} GB)")
 
     if do_kill:
-        print(f"  Processes killed: {len(report.killed)}")
-        print(f"  RAM freed: {report.ram_freed_mb:.0f} MB "
-              f"({report.ram_freed_mb / 1024:.1f} GB)")
+        lines.append(f"  Processes killed: {len(report.killed)}")
+        lines.append(f"  RAM freed: {report.ram_freed_mb:.0f} MB "
+                     f"({report.ram_freed_mb / 1024:.1f} GB)")
         if report.errors:
-            print(f"  Errors: {len(report.errors)}")
+            lines.append(f"  Errors: {len(report.errors)}")
             for err in report.errors:
-                print(f"    - {err}")
+                lines.append(f"    - {err}")
     else:
-        print()
-        print("  ** DRY RUN — no processes killed **")
-        print("  Run with --kill to actually clean up.")
-
-    print("=" * 70)
-    print()
+        lines.append("")
+        lines.append("  ** DRY RUN — no processes killed **")
+        lines.append("  Run with --kill to actually clean up.")
+
+    lines.append("=" * 70)
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 # ---------------------------------------------------------------------------
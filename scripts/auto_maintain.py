@@ -55,17 +55,19 @@ _dry_run = False
 _json_output = False
 
 
+# Préfixes ANSI par niveau, construits une fois (et non à chaque log()).
+_LEVEL_PREFIX = {
+    "INFO": GREEN, "WARN": YELLOW, "ERROR": RED, "SECTION": f"{BOLD}{CYAN}",
+}
+
+
 def log(msg: str, level: str = "INFO") -> None:
     ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     raw = f"[{ts}] [{level}] {msg}"
     _log_lines.append(raw)
     if _json_output:
         return
-    colour = {
-        "INFO": GREEN, "WARN": YELLOW, "ERROR": RED, "SECTION": CYAN
-    }.get(level, "")
-    prefix = f"{BOLD}{colour}" if level == "SECTION" else colour
-    print(f"{prefix}{raw}{RESET}")
+    print(f"{_LEVEL_PREFIX.get(level, '')}{raw}{RESET}")
 
 
 def flush_log() -> None:
@@ -1,12 +1,16 @@
 """Bench charge : 10 syntheses TTS (1.5-4 s audio cible), mesure RTF + first_chunk + WS stabilite.
 
+Une seule connexion WS chaude pour les 10 phrases ; PREWARM=1 ajoute une
+synthese non mesuree avant le bench (demarrage a froid hors statistiques).
+
 Sortie : D:\\EXO\\logs\\bench_tts_10x_<ts>.json
 """
 import asyncio
 import json
+import os
 import sys
-import time
 from datetime import datetime
+from time import perf_counter_ns
 from pathlib import Path
 
 import websockets
@@ -26,34 +30,70 @@ PHRASES = [
 ]
 
 
-async def one(uri: str, text: str, idx: int):
-    t0 = time.time()
+def _since_ms(t0_ns: int) -> float:
+    """ms écoulées depuis un perf_counter_ns() : horloge monotone (l'horloge
+    murale peut reculer sur ajustement NTP), pas d'arrondi float au relevé."""
+    return (perf_counter_ns() - t0_ns) / 1e6
+
+
+class _Session:
+    """Connexion WS unique réutilisée pour toutes les phrases.
+
+    Le serveur accepte plusieurs ``synthesize`` sur une même connexion : on
+    ne paie le handshake + message ``ready`` qu'une fois, et first_ms ne
+    mesure plus que la synthèse. Reconnexion paresseuse après une erreur.
+    """
+
+    def __init__(self, uri: str) -> None:
+        self.uri = uri
+        self.ws = None
+
+    async def get(self):
+        if self.ws is None:
+            ws = await websockets.connect(self.uri, max_size=None, open_timeout=5, close_timeout=2)
+            msg = json.loads(await ws.recv())
+            assert msg.get("type") == "ready", msg
+            self.ws = ws
+        return self.ws
+
+    async def drop(self) -> None:
+        if self.ws is not None:
+            ws, self.ws = self.ws, None
+            try:
+                await ws.close()
+            except Exception:
+                pass
+
+
+async def one(session: _Session, text: str, idx: int):
+    t0 = perf_counter_ns()
     first_byte_ms = None
     n_bytes = 0
     end_msg = None
     ws_error = None
     try:
-        async with websockets.connect(uri, max_size=None, open_timeout=5, close_timeout=2) as ws:
-            msg = json.loads(await ws.recv())
-            assert msg.get("type") == "ready", msg
-            await ws.send(json.dumps({"type": "synthesize", "text": text, "voice": "amelie"}))
-            while True:
-                msg = await ws.recv()
-                if isinstance(msg, (bytes, bytearray)):
-                    if first_byte_ms is None:
-                        first_byte_ms = (time.time() - t0) * 1000
-                    n_bytes += len(msg)
-                else:
-                    obj = json.loads(msg)
-                    if obj.get("type") == "end":
-                        end_msg = obj
-                        break
-                    if obj.get("type") == "error":
-                        ws_error = obj
-                        break
+        ws = await session.get()
+        t0 = perf_counter_ns()
+        await ws.send(json.dumps({"type": "synthesize", "text": text, "voice": "amelie"}))
+        while True:
+            msg = await ws.recv()
+            if isinstance(msg, (bytes, bytearray)):
+                if first_byte_ms is None:
+                    first_byte_ms = _since_ms(t0)
+                n_bytes += len(msg)
+            else:
+                obj = json.loads(msg)
+                if obj.get("type") == "end":
+                    end_msg = obj
+                    break
+                if obj.get("type") == "error":
+                    ws_error = obj
+                    break
     except Exception as e:
         ws_error = {"type": "exception", "msg": repr(e)}
-    total_ms = (time.time() - t0) * 1000
+        # Flux dans un état inconnu : nouvelle connexion pour la phrase suivante
+        await session.drop()
+    total_ms = _since_ms(t0)
     audio_s = n_bytes / 2 / 24000
     rtf = (end_msg or {}).get("rtf")
     status = "OK" if (end_msg and not ws_error) else f"FAIL({ws_error})"
@@ -77,13 +117,21 @@ async def main():
     uri = "ws://127.0.0.1:8767"
     print(f"=== Bench TTS x10 vers {uri} ===")
     print(f"Start: {datetime.now().isoformat(timespec='seconds')}")
+    session = _Session(uri)
+    if os.environ.get("PREWARM") == "1":
+        # Synthèse jetable : chargement des poids / kernels CUDA hors mesure
+        await one(session, "Bonjour.", 0)
     results = []
-    t_start = time.time()
-    for i, p in enumerate(PHRASES, 1):
-        r = await one(uri, p, i)
-        results.append(r)
-        await asyncio.sleep(0.4)
-    t_dur = time.time() - t_start
+    t_start = perf_counter_ns()
+    try:
+        for i, p in enumerate(PHRASES, 1):
+            # Pas de pause entre phrases : "end" reçu = synthèse terminée côté
+            # serveur, la session suivante ne chevauche rien (0.4 s x 10 de
+            # temps mort retirés du bench).
+            results.append(await one(session, p, i))
+    finally:
+        await session.drop()
+    t_dur = _since_ms(t_start) / 1000
 
     ok = [r for r in results if r["ok"]]
     fails = [r for r in results if not r["ok"]]
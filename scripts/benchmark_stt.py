@@ -72,26 +72,33 @@ def generate_test_wav(path: Path, duration: float = 5.0) -> Path:
     return path
 
 
-def _server_ready(port: int, timeout: float = 30.0) -> bool:
-    """Wait for whisper-server to be ready."""
+def _server_ready(port: int, proc: subprocess.Popen | None = None,
+                  timeout: float = 30.0) -> bool:
+    """Wait for whisper-server to be ready (False if it exits or times out)."""
     import urllib.request
     import urllib.error
-    start = time.time()
-    while time.time() - start < timeout:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         try:
             req = urllib.request.Request(f"http://{SERVER_HOST}:{port}/")
             with urllib.request.urlopen(req, timeout=2):
                 return True
         except (urllib.error.URLError, OSError):
-            time.sleep(0.5)
+            # Attente sur le process au lieu d'un palier fixe de 500 ms :
+            # un crash au chargement est vu tout de suite, sonde toutes les 50 ms
+            if proc is None:
+                time.sleep(0.05)
+                continue
+            try:
+                proc.wait(timeout=0.05)
+                return False
+            except subprocess.TimeoutExpired:
+                pass
     return False
 
 
-def transcribe_http(wav_path: Path, port: int) -> tuple[str, float]:
-    """Send WAV to whisper-server /inference and return (text, server_time_ms)."""
-    import urllib.request
-    import urllib.error
-
+def build_inference_request(wav_path: Path) -> tuple[bytes, dict[str, str]]:
+    """Build the /inference multipart body + headers once for all runs."""
     with open(wav_path, "rb") as f:
         wav_data = f.read()
 
@@ -104,11 +111,18 @@ def transcribe_http(wav_path: Path, port: int) -> tuple[str, float]:
         f'Content-Disposition: form-data; name="response_format"\r\n\r\njson'
         f"\r\n--{boundary}--\r\n"
     ).encode()
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+    return body, headers
+
+
+def transcribe_http(body: bytes, headers: dict[str, str], port: int) -> tuple[str, float]:
+    """Send a prebuilt /inference request and return (text, server_time_ms)."""
+    import urllib.request
 
     req = urllib.request.Request(
         f"http://{SERVER_HOST}:{port}/inference",
         data=body,
-        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        headers=headers,
         method="POST",
     )
 
@@ -132,7 +146,7 @@ def run_benchmark(
     wav_path: Path,
     num_runs: int = 3,
     language: str = "fr",
-    beam_size: int = 5,
+    beam_size: int = 1,
 ) -> None:
     """Run the full benchmark: start server, transcribe N times, report."""
 
@@ -170,6 +184,10 @@ def run_benchmark(
         "--port", str(SERVER_PORT),
         "--language", language,
         "--beam-size", str(beam_size),
+        # Mêmes réglages de décodage que le service (python/stt/whisper_cpp.py) :
+        # greedy sans échelle de température, sinon le bench mesure une
+        # configuration ~plusieurs fois plus lente que la production.
+        "--no-fallback",
     ]
 
     proc = subprocess.Popen(
@@ -179,15 +197,23 @@ def run_benchmark(
     )
 
     try:
-        if not _server_ready(SERVER_PORT):
-            print("  ERREUR : whisper-server n'a pas démarré dans les 30s")
+        # Lecture WAV + multipart construits une seule fois, pendant le
+        # chargement du modèle par whisper-server (étapes indépendantes) :
+        # les runs ne mesurent que l'aller-retour whisper-server.
+        body, headers = build_inference_request(wav_path)
+
+        if not _server_ready(SERVER_PORT, proc):
+            if proc.poll() is not None:
+                print(f"  ERREUR : whisper-server s'est arrêté (code {proc.returncode})")
+            else:
+                print("  ERREUR : whisper-server n'a pas démarré dans les 30s")
             return
 
         print("  whisper-server prêt.\n")
 
         rtfs = []
         for i in range(num_runs):
-            text, elapsed = transcribe_http(wav_path, SERVER_PORT)
+            text, elapsed = transcribe_http(body, headers, SERVER_PORT)
             rtf = elapsed / audio_duration
             rtfs.append(rtf)
             print(f"  Run {i+1}/{num_runs}: {elapsed:.3f}s  RTF={rtf:.3f}  \"{text[:80]}\"")
@@ -231,7 +257,8 @@ def main():
     parser.add_argument("--model", type=str, default=DEFAULT_MODEL, help="Nom du modèle (small, medium, large-v3)")
     parser.add_argument("--runs", type=int, default=3, help="Nombre de runs")
     parser.add_argument("--language", type=str, default="fr", help="Langue")
-    parser.add_argument("--beam-size", type=int, default=5, help="Beam size")
+    parser.add_argument("--beam-size", type=int, default=1,
+                        help="Beam size (1 = greedy, comme stt_server)")
     args = parser.parse_args()
 
     # Resolve audio file
@@ -119,7 +119,7 @@ def load_models() -> None:
     model_path = _resolve_model_path()
     log.info("Chargement Orpheus depuis: %s", model_path)
 
-    t0 = time.time()
+    t0 = time.perf_counter()
     STATE.tokenizer = AutoTokenizer.from_pretrained(model_path)
     STATE.model = AutoModelForCausalLM.from_pretrained(
         model_path,
@@ -127,12 +127,12 @@ def load_models() -> None:
         low_cpu_mem_usage=True,
     ).to(STATE.device)
     STATE.model.eval()
-    log.info("LM charge en %.1fs", time.time() - t0)
+    log.info("LM charge en %.1fs", time.perf_counter() - t0)
 
-    t0 = time.time()
+    t0 = time.perf_counter()
     log.info("Chargement SNAC 24 kHz...")
     STATE.snac = SNAC.from_pretrained("hubertsiuzdak/snac_24khz").eval().to(STATE.device)
-    log.info("SNAC charge en %.1fs", time.time() - t0)
+    log.info("SNAC charge en %.1fs", time.perf_counter() - t0)
 
     # Voix : on prend les valeurs de la variable d'env si fournies,
     # sinon defaut FR connu.
@@ -313,13 +313,13 @@ def tts(req: TTSRequest) -> TTSResponse:
     voice = (req.voice or STATE.default_voice).strip().lower()
     log.info("synth voice=%s len_text=%d speed=%.2f", voice, len(req.text), req.speed)
 
-    t0 = time.time()
+    t0 = time.perf_counter()
     try:
         wav = synthesize(req.text, voice, req.speed)
     except Exception as e:  # pragma: no cover
         log.exception("synth error")
         raise HTTPException(500, f"Erreur de synthese: {e}")
-    synth_s = time.time() - t0
+    synth_s = time.perf_counter() - t0
 
     duration = len(wav) / STATE.sample_rate if wav.size else 0.0
     rtf = (synth_s / duration) if duration > 0 else 0.0
@@ -22,16 +22,15 @@ Le modele genere des tokens stringifies "<custom_token_N>" qui encodent
 from __future__ import annotations
 
 import base64
-import io
 import json
 import logging
 import os
+import struct
 import time
 from pathlib import Path
 from typing import List, Optional
 
 import numpy as np
-import soundfile as sf
 import torch
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
@@ -187,7 +186,7 @@ def load_model(model_path: str) -> object:
     n_ubatch = int(os.environ.get("ORPHEUS_N_UBATCH", "512"))
     flash_attn = os.environ.get("ORPHEUS_FLASH_ATTN", "1").lower() not in ("0", "false", "no")
     offload_kqv = os.environ.get("ORPHEUS_OFFLOAD_KQV", "1").lower() not in ("0", "false", "no")
-    t0 = time.time()
+    t0 = time.perf_counter()
     llm = Llama(
         model_path=model_path,
         n_ctx=n_ctx,
@@ -202,7 +201,7 @@ def load_model(model_path: str) -> object:
     log.info(
         "LLM charge en %.1fs (n_ctx=%d, gpu_layers=%d, n_batch=%d, n_ubatch=%d, "
         "flash_attn=%s, offload_kqv=%s)",
-        time.time() - t0, n_ctx, n_gpu_layers, n_batch, n_ubatch, flash_attn, offload_kqv,
+        time.perf_counter() - t0, n_ctx, n_gpu_layers, n_batch, n_ubatch, flash_attn, offload_kqv,
     )
     return llm
 
@@ -276,10 +275,10 @@ def load_models() -> None:
 
     from snac import SNAC
 
-    t0 = time.time()
+    t0 = time.perf_counter()
     STATE.snac_device = "cuda"
     STATE.snac = SNAC.from_pretrained("hubertsiuzdak/snac_24khz").eval().to(STATE.snac_device)
-    log.info("SNAC charge en %.1fs sur %s", time.time() - t0, STATE.snac_device)
+    log.info("SNAC charge en %.1fs sur %s", time.perf_counter() - t0, STATE.snac_device)
 
     # J3-bis (audit perf 2026-05-14) : pre-warm SNAC pour amortir l'init des
     # kernels CUDA (cuDNN convolutions, etc.). Sans cela, le 1er decode SNAC
@@ -287,7 +286,7 @@ def load_models() -> None:
     # On execute un decode "jouet" sur des codes valides (zeros) :
     # 3 codebooks SNAC, dimensions [1, n_frames * mult] avec mult=1,2,4.
     try:
-        t_warm = time.time()
+        t_warm = time.perf_counter()
         with torch.inference_mode():
             warm_codes = [
                 torch.zeros((1, 1), dtype=torch.int32, device=STATE.snac_device),
@@ -296,7 +295,7 @@ def load_models() -> None:
             ]
             _ = STATE.snac.decode(warm_codes)
             torch.cuda.synchronize()
-        log.info("SNAC pre-warm OK (%.0f ms)", (time.time() - t_warm) * 1000)
+        log.info("SNAC pre-warm OK (%.0f ms)", (time.perf_counter() - t_warm) * 1000)
     except Exception as e:
         log.warning("SNAC pre-warm KO (non-fatal) : %s", e)
 
@@ -403,6 +402,22 @@ def _convert_frames_to_audio(frame_ids: List[int]) -> np.ndarray:
     return np.concatenate(chunks).astype(np.float32)
 
 
+def _wav_bytes(wav: np.ndarray, sample_rate: int) -> bytes:
+    """WAV PCM16 mono = en-tete RIFF de 44 octets + echantillons bruts.
+
+    Remplace sf.write() dans un BytesIO : ni conteneur intermediaire ni
+    aller-retour libsndfile, une seule conversion float -> int16.
+    """
+    pcm = (np.clip(wav, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(pcm), b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", len(pcm),
+    )
+    return header + pcm
+
+
 # ---------------------------------------------------------------------------
 # Generation
 # ---------------------------------------------------------------------------
@@ -415,7 +430,7 @@ def synthesize(text: str, voice: str, speed: float) -> np.ndarray:
     max_tokens = min(2600, max(400, int(len(text_norm) * 28)))
 
     log.info("synthese voice=%s len=%d max_tokens=%d", voice, len(text_norm), max_tokens)
-    t0 = time.time()
+    t0 = time.perf_counter()
 
     out = STATE.llm.create_completion(
         prompt=prompt,
@@ -450,7 +465,7 @@ def synthesize(text: str, voice: str, speed: float) -> np.ndarray:
                 audio_ids.append(tid)
                 index += 1
 
-    gen_dt = time.time() - t0
+    gen_dt = time.perf_counter() - t0
     log.info("LLM termine : %d audio_ids / %d tokens bruts en %.2fs", len(audio_ids), raw_token_count, gen_dt)
 
     if not audio_ids:
@@ -519,19 +534,17 @@ def voices() -> dict:
 def tts(req: TTSRequest) -> TTSResponse:
     if STATE.llm is None or STATE.snac is None:
         raise HTTPException(status_code=503, detail="Modele non charge")
-    t0 = time.time()
+    t0 = time.perf_counter()
     try:
         wav = synthesize(req.text, req.voice or STATE.default_voice, req.speed)
     except Exception as e:
         log.exception("Erreur synthese")
         raise HTTPException(status_code=500, detail=f"Synth error: {e}")
     duration = float(wav.size) / SAMPLE_RATE if wav.size else 0.0
-    elapsed = time.time() - t0
+    elapsed = time.perf_counter() - t0
     rtf = (elapsed / duration) if duration > 0 else 0.0
 
-    buf = io.BytesIO()
-    sf.write(buf, wav, SAMPLE_RATE, format="WAV", subtype="PCM_16")
-    audio_b64 = base64.b64encode(buf.getvalue()).decode("ascii")
+    audio_b64 = base64.b64encode(_wav_bytes(wav, SAMPLE_RATE)).decode("ascii")
 
     log.info("/tts dur=%.2fs elapsed=%.2fs rtf=%.2f", duration, elapsed, rtf)
 
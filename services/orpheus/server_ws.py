@@ -52,6 +52,8 @@ Variables d'environnement :
 import argparse
 import asyncio
 import concurrent.futures
+import functools
+from collections import OrderedDict
 try:
     import ujson as json  # v6.0 perf : 3-5x plus rapide que stdlib (audit perf)
 except ImportError:
@@ -107,6 +109,22 @@ DEFAULT_CHUNK_BYTES   = DEFAULT_CHUNK_SAMPLES * OUTPUT_BYTES_PER_SAMPLE  # 1920
 # allocation `b"\x00" * pad` a chaque drain final de _stream_pcm.
 _SILENCE_PAD = bytes(max(ALLOWED_CHUNK_SAMPLES) * OUTPUT_BYTES_PER_SAMPLE)
 
+# Une seule génération llama.cpp à la fois, toutes sessions confondues :
+# STATE.llm (contexte + KV cache) n'est pas thread-safe, et deux streams
+# parallèles sur le même GPU/CPU se ralentissent mutuellement (p50 pire
+# qu'en série). Les workers orpheus-ws en attente bloquent ici.
+_LLM_SEM = threading.Semaphore(1)
+
+# Segments courts déjà synthétisés (« C'est fait. », « D'accord. »…) : les
+# chunks PCM sont rejoués tels quels, sans génération llama.cpp ni décodage
+# SNAC. LRU manipulé uniquement depuis la boucle asyncio (pas de verrou).
+_PHRASE_CACHE_MAX_CHARS = 40
+try:
+    _PHRASE_CACHE_SIZE = int(os.environ.get("ORPHEUS_PHRASE_CACHE", "64"))
+except ValueError:
+    _PHRASE_CACHE_SIZE = 64
+_PHRASE_CACHE: "OrderedDict[tuple, tuple[bytes, ...]]" = OrderedDict()
+
 # ---------------------------------------------------------------------------
 # Phase de readiness globale (v5.1 supervisor)
 #   ready_loading : port ouvert, modèle pas encore chargé
@@ -282,9 +300,16 @@ def _stream_pcm(
             idx = np.linspace(0, len(seg_np) - 1, n_out).astype(np.int64)
             seg_np = seg_np[idx]
         pcm_buf.extend(_float_to_pcm16(seg_np))
-        while len(pcm_buf) >= target:
-            yield bytes(pcm_buf[:target])
-            del pcm_buf[:target]
+        take = len(pcm_buf) - len(pcm_buf) % target
+        if not take:
+            return
+        # Une copie par chunk (vue -> bytes) au lieu de deux (slice bytearray
+        # + bytes()), un seul compactage par segment ; vue relâchée avant le
+        # del et avant de rendre la main au consommateur.
+        with memoryview(pcm_buf) as mv:
+            outs = [mv[off:off + target].tobytes() for off in range(0, take, target)]
+        del pcm_buf[:take]
+        yield from outs
 
     for chunk in out:
         if cancel_flag.is_set():
@@ -464,9 +489,12 @@ class Session:
         except Exception:
             log.exception("Session erreur")
         finally:
-            # Annule toute synth en vol avant de fermer
+            # Annule toute synth en vol avant de fermer. Drapeau levé même si
+            # synth_task est déjà terminée (ws.send a levé sur la déconnexion) :
+            # le producteur de l'executor tournerait sinon jusqu'à la fin du
+            # segment en gardant _LLM_SEM, bloquant les autres sessions.
+            self._cancel.set()
             if synth_task and not synth_task.done():
-                self._cancel.set()
                 try:
                     await asyncio.wait_for(synth_task, timeout=2.0)
                 except (asyncio.TimeoutError, Exception):
@@ -545,34 +573,52 @@ class Session:
             if self._cancel.is_set():
                 break
 
-            queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+            # Pont thread -> boucle sans aller-retour : call_soon_threadsafe +
+            # put_nowait ne bloque pas le thread de synthèse, alors que
+            # run_coroutine_threadsafe(queue.put(...)).result() l'arrêtait à
+            # chaque chunk (480 o) le temps que la boucle exécute la tâche.
+            # File non bornée : au pire l'audio d'un segment (quelques 100 Ko).
+            queue: asyncio.Queue = asyncio.Queue()
             SENTINEL = object()
+            _push = functools.partial(loop.call_soon_threadsafe, queue.put_nowait)
+
+            cache_key = None
+            if _PHRASE_CACHE_SIZE > 0 and len(seg_text) <= _PHRASE_CACHE_MAX_CHARS:
+                cache_key = (seg_text, voice, round(rate, 3), self.chunk_bytes)
+            cached = _PHRASE_CACHE.get(cache_key) if cache_key else None
 
-            def _producer(_seg=seg_text) -> None:
+            def _producer(_seg=seg_text) -> "list[bytes]":
+                produced: list[bytes] = []
                 try:
-                    for pcm_chunk in _stream_pcm(
-                        text=_seg,
-                        voice=voice,
-                        speed=rate,
-                        chunk_bytes=self.chunk_bytes,
-                        cancel_flag=self._cancel,
-                    ):
-                        if self._cancel.is_set():
-                            break
-                        asyncio.run_coroutine_threadsafe(
-                            queue.put(pcm_chunk), loop
-                        ).result()
+                    with _LLM_SEM:
+                        for pcm_chunk in _stream_pcm(
+                            text=_seg,
+                            voice=voice,
+                            speed=rate,
+                            chunk_bytes=self.chunk_bytes,
+                            cancel_flag=self._cancel,
+                        ):
+                            if self._cancel.is_set():
+                                break
+                            produced.append(pcm_chunk)
+                            _push(pcm_chunk)
                 except Exception as exc:
                     log.exception("Engine erreur: %s", exc)
-                    asyncio.run_coroutine_threadsafe(
-                        queue.put(("error", str(exc))), loop
-                    ).result()
+                    _push(("error", str(exc)))
+                    produced = []
                 finally:
-                    asyncio.run_coroutine_threadsafe(
-                        queue.put(SENTINEL), loop
-                    ).result()
-
-            fut = loop.run_in_executor(Session._executor, _producer)
+                    _push(SENTINEL)
+                return produced
+
+            if cached is not None:
+                _PHRASE_CACHE.move_to_end(cache_key)
+                for pcm_chunk in cached:
+                    queue.put_nowait(pcm_chunk)
+                queue.put_nowait(SENTINEL)
+                fut = None
+                log.info("[ws] phrase cache hit (%d chunks): %s", len(cached), seg_text)
+            else:
+                fut = loop.run_in_executor(Session._executor, _producer)
 
             while True:
                 item = await queue.get()
@@ -611,7 +657,12 @@ class Session:
                 else:
                     next_send_at = max(sent_at, next_send_at) + chunk_duration_s
 
-            await fut
+            if fut is not None:
+                produced = await fut
+                if cache_key and produced and not err_msg and not self._cancel.is_set():
+                    _PHRASE_CACHE[cache_key] = tuple(produced)
+                    while len(_PHRASE_CACHE) > _PHRASE_CACHE_SIZE:
+                        _PHRASE_CACHE.popitem(last=False)
 
             if err_msg:
                 break
@@ -716,6 +767,8 @@ async def _serve(host: str, port: int, chunk_bytes: int) -> None:
         bind_host,
         port,
         max_size=None,
+        # PCM16 sortant : pas de permessage-deflate (CPU par chunk, ~0 gain)
+        compression=None,
         process_request=process_request,
     ) as server:
         try:
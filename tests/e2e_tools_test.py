@@ -33,20 +33,21 @@ async def main():
     print("E2E Test — 4 Tool Microservices")
     print("=" * 60)
 
-    # Tools: calculate
-    await test_service(8776, "calculate", {"expression": "2+2*3"}, "Tools/calc")
-
-    # Tools: convert
-    await test_service(8776, "convert", {"value": 100, "from_unit": "km", "to_unit": "miles"}, "Tools/conv")
-
-    # Knowledge: Wikipedia summary
-    await test_service(8775, "get_summary", {"topic": "Python (langage)", "lang": "fr"}, "Knowledge")
-
-    # WebSearch: DuckDuckGo
-    await test_service(8773, "search_web", {"query": "test websearch exo", "max_results": 3}, "WebSearch")
-
-    # News: RSS
-    await test_service(8774, "get_news", {"topic": "tech", "region": "fr", "max_results": 3}, "News")
+    # Services indépendants (aucune dépendance de données entre eux) :
+    # sondes lancées en parallèle, durée totale ≈ la plus lente au lieu
+    # de la somme (Knowledge/WebSearch/News attendent le réseau).
+    await asyncio.gather(
+        # Tools: calculate
+        test_service(8776, "calculate", {"expression": "2+2*3"}, "Tools/calc"),
+        # Tools: convert
+        test_service(8776, "convert", {"value": 100, "from_unit": "km", "to_unit": "miles"}, "Tools/conv"),
+        # Knowledge: Wikipedia summary
+        test_service(8775, "get_summary", {"topic": "Python (langage)", "lang": "fr"}, "Knowledge"),
+        # WebSearch: DuckDuckGo
+        test_service(8773, "search_web", {"query": "test websearch exo", "max_results": 3}, "WebSearch"),
+        # News: RSS
+        test_service(8774, "get_news", {"topic": "tech", "region": "fr", "max_results": 3}, "News"),
+    )
 
     print("=" * 60)
     print("Done.")
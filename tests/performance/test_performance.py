@@ -15,9 +15,14 @@ pytestmark = pytest.mark.performance
 class TestNLUPerformance:
     """Benchmarks de latence NLU (régression de performance)."""
 
-    def setup_method(self):
+    @classmethod
+    def setup_class(cls):
+        # Une seule instance pour toute la classe (compilation des motifs hors
+        # mesure), plus un appel à blanc pour chauffer le cache sre : les
+        # timings reflètent le régime établi, pas l'initialisation.
         from nlu_server import RegexNLU
-        self.nlu = RegexNLU()
+        cls.nlu = RegexNLU()
+        cls.nlu.classify("allume la lumière du salon")
 
     def test_classify_latency_under_1ms(self):
         """La classification regex doit prendre < 1ms."""
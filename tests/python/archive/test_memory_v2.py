@@ -20,6 +20,7 @@ import time
 import uuid
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 
@@ -426,6 +427,96 @@ class TestVectorIndexFallback:
         s = vi.stats()
         assert s["stm"]["entries"] == 2
 
+    def test_add_many_fallback(self):
+        from vector_index import VectorIndex
+        vi = VectorIndex()
+        n = vi.add_many([("id1", "lumière salon"), ("id2", "météo demain")], tier="mtm")
+        assert n == 2
+        assert vi.stats()["mtm"]["entries"] == 2
+        assert vi.add_many([], tier="mtm") == 0
+
+    def test_query_embedding_cache(self):
+        from vector_index import VectorIndex
+
+        class _Enc:
+            calls = 0
+
+            def encode(self, texts, normalize_embeddings=True):
+                _Enc.calls += 1
+                return np.ones((len(texts), 4))
+
+        vi = VectorIndex()
+        vi._encoder = _Enc()
+        vi.QUERY_CACHE_SIZE = 2
+        vi._encode_query("météo demain")
+        vi._encode_query("  météo   demain ")
+        assert _Enc.calls == 1
+        vi._encode_query("a")
+        vi._encode_query("b")  # évince « météo demain »
+        vi._encode_query("météo demain")
+        assert _Enc.calls == 4
+
+    def _restore(self, disk_ids, ids):
+        from vector_index import VectorIndex
+
+        class _Idx:
+            ntotal = 2
+
+        vi = VectorIndex()
+        vi._available = True
+        vi._indices["ltm"] = _Idx()
+        vi._disk_ids["ltm"] = disk_ids
+        rebuilt = []
+        vi._rebuild_tier_unlocked = rebuilt.append
+        vi.restore_tier("ltm", ["a", "b"], ids)
+        assert vi.stats()["ltm"]["entries"] == 2
+        return rebuilt
+
+    def test_restore_tier_reuses_disk_index(self):
+        assert self._restore(["id1", "id2"], ["id1", "id2"]) == []
+
+    def test_restore_tier_rebuilds_on_mismatch(self):
+        assert self._restore(["id2", "id1"], ["id1", "id2"]) == ["ltm"]
+
+    def test_add_encodes_once(self):
+        from vector_index import VectorIndex
+
+        class _Enc:
+            calls = 0
+
+            def encode(self, texts, normalize_embeddings=True):
+                _Enc.calls += 1
+                return np.ones((len(texts), 4))
+
+        class _Idx:
+            def __init__(self):
+                self.ntotal = 0
+
+            def add(self, emb):
+                self.ntotal += len(emb)
+
+            def search(self, emb, k):
+                return np.full((len(emb), k), 0.99), np.zeros((len(emb), k))
+
+        vi = VectorIndex()
+        vi._available = True
+        vi._encoder = _Enc()
+        vi._indices = {t: _Idx() for t in vi.TIERS}
+        assert vi.add("id1", "lumière salon")
+        assert not vi.add("id2", "lumière du salon")  # doublon
+        assert _Enc.calls == 2
+
+    def test_delete_many(self):
+        from vector_index import VectorIndex
+        vi = VectorIndex()
+        vi.add("id1", "a", tier="stm")
+        vi.add("id2", "b", tier="mtm")
+        vi.add("id3", "c", tier="mtm")
+        assert vi.delete_many(["id1", "id3", "absent"]) == 2
+        s = vi.stats()
+        assert s["stm"]["entries"] == 0
+        assert s["mtm"]["entries"] == 1
+
 
 # ═══════════════════════════════════════════════════════════════
 # ConsolidationManager
@@ -917,6 +1008,19 @@ class TestMemoryManagerNoFaiss:
         assert "mtm" in ts
         assert "ltm" in ts
 
+    def test_add_many(self):
+        m = self._make_manager()
+        res = m.add_many([
+            {"text": "lumière salon", "tier": "mtm"},
+            {"text": ""},
+            {"text": "météo demain"},
+        ])
+        assert res[0].tier == "mtm"
+        assert res[1] is None
+        assert res[2].tier == "stm"
+        assert m.hierarchy.get(res[0].id) is not None
+        assert m.vector.stats()["mtm"]["entries"] == 1
+
     def test_health_check(self):
         m = self._make_manager()
         h = m.health_check()
@@ -115,6 +115,19 @@ class TestLLMWarmup:
         m = w.metrics()
         assert m["warmup_count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_prewarm_only_when_cold(self):
+        from llm_warmup import LLMWarmup
+        w = LLMWarmup(keepalive_interval=60)
+        assert w.prewarm() is None  # pas de send_fn
+        send = AsyncMock(return_value="OK")
+        w.set_send_function(send)
+        task = w.prewarm()
+        assert w.prewarm() is task  # warmup déjà en cours
+        await task
+        assert w.prewarm() is None  # session chaude
+        assert send.await_count == 1
+
     def test_stop_keepalive_when_not_started(self):
         from llm_warmup import LLMWarmup
         w = LLMWarmup()
@@ -211,6 +224,119 @@ class TestFusedPipeline:
         await p.on_final("allume la lumière")
         mock_tts.assert_called_once_with("Lumière allumée")
 
+    @pytest.mark.asyncio
+    async def test_on_final_full_response_tts_per_sentence(self):
+        from fused_pipeline import FusedPipeline, PipelineState
+        mock_llm = AsyncMock(return_value="Lumière allumée. Autre chose ?")
+        mock_tts = AsyncMock()
+        p = FusedPipeline(llm_send=mock_llm, tts_stream=mock_tts)
+        ctx = p.begin_interaction()
+        await p.on_final("allume la lumière")
+        assert [c.args[0] for c in mock_tts.call_args_list] == [
+            "Lumière allumée.", "Autre chose ?",
+        ]
+        assert ctx.t_tts_first_chunk and ctx.t_tts_end
+        assert p.state == PipelineState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_on_final_llm_stream_tts_per_sentence(self):
+        from fused_pipeline import FusedPipeline, PipelineState
+
+        async def llm_stream(text, max_tokens, system):
+            for tok in ("Lumière", " allumée.", " Autre", " chose ?"):
+                yield tok
+
+        mock_tts = AsyncMock()
+        p = FusedPipeline(llm_stream=llm_stream, tts_stream=mock_tts)
+        ctx = p.begin_interaction()
+        await p.on_final("allume la lumière")
+        assert [c.args[0] for c in mock_tts.call_args_list] == [
+            "Lumière allumée.", "Autre chose ?",
+        ]
+        assert ctx.response_text == "Lumière allumée. Autre chose ?"
+        assert p.state == PipelineState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_on_final_response_cache(self):
+        from context_cache import ContextCache
+        from fused_pipeline import FusedPipeline
+        mock_llm = AsyncMock(return_value="Lumière allumée.")
+        mock_tts = AsyncMock()
+        p = FusedPipeline(llm_send=mock_llm, tts_stream=mock_tts,
+                          response_cache=ContextCache())
+        await p.on_final("Allume la lumière.")
+        ctx = p.begin_interaction()
+        await p.on_final("allume la lumière")
+        assert mock_llm.await_count == 1
+        assert ctx.response_text == "Lumière allumée."
+        assert mock_tts.await_count == 2
+        assert p.metrics()["response_cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_on_final_speculation_hit(self):
+        from fused_pipeline import FusedPipeline, _speculation_key
+
+        async def _spec():
+            return "Lumière du salon allumée."
+        mock_llm = AsyncMock(return_value="autre")
+        p = FusedPipeline(llm_send=mock_llm)
+        ctx = p.begin_interaction()
+        p._speculative_key = _speculation_key("allume la lumière du salon")
+        p._speculative_task = asyncio.ensure_future(_spec())
+        await p.on_final("Allume la lumière du salon.")
+        mock_llm.assert_not_awaited()
+        assert ctx.response_text == "Lumière du salon allumée."
+        assert p.metrics()["speculative_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_on_final_speculation_miss(self):
+        from fused_pipeline import FusedPipeline, _speculation_key
+        mock_llm = AsyncMock(return_value="Il fait 21,5 degrés.")
+        p = FusedPipeline(llm_send=mock_llm)
+        ctx = p.begin_interaction()
+        spec = asyncio.ensure_future(asyncio.sleep(10))
+        p._speculative_key = _speculation_key("allume la lumière du salon")
+        p._speculative_task = spec
+        await p.on_final("Quelle température fait-il ?")
+        assert mock_llm.await_count == 1
+        assert ctx.response_text == "Il fait 21,5 degrés."
+        assert spec.cancelled()
+        assert p.metrics()["speculative_misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_speculation(self):
+        from fused_pipeline import FusedPipeline
+        p = FusedPipeline(llm_send=AsyncMock())
+        p.begin_interaction()
+        task = asyncio.ensure_future(asyncio.sleep(10))
+        p._speculative_task, p._speculative_key = task, "x"
+        p.cancel()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert p._speculative_task is None and p._speculative_key == ""
+
+    @pytest.mark.asyncio
+    async def test_cancel_retrieves_failed_speculation(self):
+        import gc
+        from fused_pipeline import FusedPipeline
+
+        async def _spec():
+            raise ConnectionError("LLM down")
+        errors = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _loop, c: errors.append(c))
+        try:
+            p = FusedPipeline(llm_send=AsyncMock())
+            p.begin_interaction()
+            p._speculative_task = asyncio.ensure_future(_spec())
+            p._speculative_key = "x"
+            await asyncio.sleep(0)  # la spéculation échoue avant l'annulation
+            p.cancel()
+            gc.collect()
+            assert errors == []
+        finally:
+            loop.set_exception_handler(None)
+
     @pytest.mark.asyncio
     async def test_on_final_llm_error(self):
         from fused_pipeline import FusedPipeline, PipelineState
@@ -239,6 +365,41 @@ class TestFusedPipeline:
         result = p.on_llm_token("est allumée! ")
         assert result == "La lumière est allumée!"
 
+    def test_on_llm_token_first_clause_early_flush(self):
+        from fused_pipeline import FusedPipeline
+        p = FusedPipeline()
+        p.begin_interaction()
+        assert p.on_llm_token("Oui,") is None  # proposition trop courte
+        # Virgule finale : frontière confirmée seulement par le blanc suivant
+        assert p.on_llm_token(" la lumière du salon est allumée,") is None
+        first = p.on_llm_token(" et celle")
+        assert first == "Oui, la lumière du salon est allumée,"
+        # Ensuite, flush uniquement sur ponctuation de fin de phrase
+        assert p.on_llm_token(" de la cuisine aussi, comme demandé,") is None
+        assert p.on_llm_token(" tout est prêt.") == (
+            "et celle de la cuisine aussi, comme demandé, tout est prêt."
+        )
+
+    def test_on_llm_token_keeps_decimal_comma(self):
+        from fused_pipeline import FusedPipeline
+        p = FusedPipeline()
+        p.begin_interaction()
+        assert p.on_llm_token("La température du salon est de 21") is None
+        assert p.on_llm_token(",") is None
+        assert p.on_llm_token("5 degrés.") == "La température du salon est de 21,5 degrés."
+
+    def test_metrics_tail_latency(self):
+        from fused_pipeline import FusedPipeline
+        p = FusedPipeline()
+        for total in [100.0] * 18 + [900.0, 1000.0]:
+            p._history.append({"total_latency_ms": total, "stt_latency_ms": 50.0,
+                               "llm_latency_ms": 0.0, "tts_first_chunk_ms": 0.0})
+        m = p.metrics()
+        assert m["p50_total_ms"] == 100.0
+        assert m["p95_total_ms"] == 1000.0
+        assert m["p95_stt_ms"] == 50.0
+        assert m["tail_alarms"] == ["total"]
+
     def test_flush_sentence_buffer(self):
         from fused_pipeline import FusedPipeline
         p = FusedPipeline()
@@ -350,6 +511,31 @@ class TestCircularAudioBuffer:
         first = buf.pop()
         assert first.data == b"b"
 
+    def test_buffered_bytes(self):
+        from tts_predictive import CircularAudioBuffer
+        buf = CircularAudioBuffer(capacity=2)
+        buf.push(b"aa")
+        buf.push(b"bbbb")
+        buf.push(b"cccccc")  # évince "aa"
+        assert buf.buffered_bytes == 10
+        buf.pop()
+        assert buf.buffered_bytes == 6
+        buf.clear()
+        assert buf.buffered_bytes == 0
+
+    def test_pop_up_to(self):
+        from tts_predictive import CircularAudioBuffer
+        buf = CircularAudioBuffer(capacity=10)
+        buf.push(b"\x01" * 4)
+        buf.push(b"\x02" * 6)
+        assert buf.pop_up_to(8) == b"\x01" * 4 + b"\x02" * 4
+        assert buf.buffered_bytes == 2 and buf.size == 1
+        assert buf.pop_up_to(8) == b"\x02" * 2
+        assert buf.empty and buf.buffered_bytes == 0
+        assert buf.pop_up_to(8) == b""
+        assert buf.metrics()["underruns"] == 1
+        assert buf.metrics()["total_popped"] == 2
+
     def test_pop_empty(self):
         from tts_predictive import CircularAudioBuffer
         buf = CircularAudioBuffer()
@@ -511,6 +697,71 @@ class TestTTSPredictive:
         assert m["total_sessions"] == 0
         assert m["avg_first_chunk_ms"] == 0.0
 
+    @pytest.mark.asyncio
+    async def test_playback_starts_on_buffered_audio(self):
+        """Un seul gros chunk (>= min_buffer_ms d'audio) suffit à lancer la lecture."""
+        from tts_predictive import TTSPredictive
+        played = []
+
+        async def synth(sentence):
+            yield b"\x00" * 24000  # 500 ms @ 24 kHz PCM16
+
+        async def play(data):
+            played.append(len(data))
+
+        tts = TTSPredictive(min_buffer_ms=250, synthesize_fn=synth, play_fn=play)
+        tts.begin_session()
+        await tts.feed_token("Bonjour tout le monde.")
+        await tts.flush()
+        await asyncio.wait_for(tts.run(), timeout=2)
+        assert played == [4800] * 5  # découpé par tranches de PLAYBACK_DRAIN_MS
+        assert tts.metrics()["avg_first_play_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_playback_groups_small_chunks(self):
+        """Les petits chunks accumulés avant lecture partent regroupés."""
+        from tts_predictive import TTSPredictive
+        played = []
+
+        async def synth(sentence):
+            for _ in range(20):
+                yield b"\x00" * 960  # 20 ms chacun
+
+        async def play(data):
+            played.append(len(data))
+
+        tts = TTSPredictive(min_buffer_ms=100, synthesize_fn=synth, play_fn=play)
+        tts.begin_session()
+        await tts.feed_token("Bonjour tout le monde.")
+        await tts.flush()
+        await asyncio.wait_for(tts.run(), timeout=2)
+        assert sum(played) == 20 * 960
+        assert len(played) < 20
+        assert tts.metrics()["buffer"]["total_popped"] == 20
+
+    @pytest.mark.asyncio
+    async def test_cancel_mid_playback_is_bounded(self):
+        """Un cancel() pendant la lecture d'un long backlog coupe en <= 100 ms d'audio."""
+        from tts_predictive import TTSPredictive, PLAYBACK_DRAIN_MS
+        played = []
+        drain_bytes = PLAYBACK_DRAIN_MS * 24000 // 1000 * 2
+
+        async def synth(sentence):
+            for _ in range(100):
+                yield b"\x00" * 960  # 2 s de backlog
+
+        async def play(data):
+            played.append(len(data))
+            if len(played) == 2:
+                tts.cancel()  # barge-in pendant le 2e play_fn
+
+        tts = TTSPredictive(min_buffer_ms=100, synthesize_fn=synth, play_fn=play)
+        tts.begin_session()
+        await tts.feed_token("Bonjour tout le monde.")
+        await tts.flush()
+        await asyncio.wait_for(tts.run(), timeout=2)
+        assert played == [drain_bytes, drain_bytes]
+
 
 # ═══════════════════════════════════════════════════════════════
 # ContextCache
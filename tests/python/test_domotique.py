@@ -198,6 +198,37 @@ class TestHomeGraphManager:
         net = self.hg.get_network_links()
         assert len(net) == 2
 
+    def _stub_ws(self, nlu: dict, domotic: dict | None) -> list[tuple[str, dict]]:
+        sent: list[tuple[str, dict]] = []
+
+        async def fake(url, msg):
+            sent.append((url, msg))
+            return nlu if url == self.hg._nlu_url else domotic
+
+        self.hg._ws_request = fake
+        return sent
+
+    @pytest.mark.asyncio
+    async def test_apply_text_intent_routes_to_domotic(self):
+        entities = {"action": "on", "verb": "allume", "device": "lumière", "room": "cuisine"}
+        sent = self._stub_ws({"intent": "home_control", "entities": entities},
+                             {"ok": True, "handled": True, "device_id": "ha:light.cuisine"})
+        result = await self.hg.apply_text_intent("allume la lumière de la cuisine")
+        assert result["handled"] is True
+        assert sent[1][1] == {"action": "apply_intent", "params": {"entities": entities}}
+
+    @pytest.mark.asyncio
+    async def test_apply_text_intent_unhandled_falls_back(self):
+        self._stub_ws({"intent": "home_control", "entities": {"action": "increase"}},
+                      {"ok": False, "handled": False})
+        assert await self.hg.apply_text_intent("monte le chauffage") is None
+
+    @pytest.mark.asyncio
+    async def test_apply_text_intent_skips_other_intents(self):
+        sent = self._stub_ws({"intent": "weather", "entities": {}}, None)
+        assert await self.hg.apply_text_intent("quel temps fait-il") is None
+        assert len(sent) == 1
+
 
 # ═══════════════════════════════════════════════════════
 #  Tests SamsungService
@@ -265,6 +296,73 @@ class TestEchoService:
         assert result["ok"] is False
 
 
+# ═══════════════════════════════════════════════════════
+#  Tests DomoticService (résolution NLU → entity_id)
+# ═══════════════════════════════════════════════════════
+
+from domotique.domotic_service import DomoticService
+
+
+class TestDomoticService:
+    def setup_method(self):
+        self.svc = DomoticService()
+        self.svc._cache = {
+            "light.cuisine_plafond": {"entity_id": "light.cuisine_plafond",
+                                      "attributes": {"friendly_name": "Plafond Cuisine"}},
+            "light.salon_1": {"entity_id": "light.salon_1",
+                              "attributes": {"friendly_name": "Lampe Salon"}},
+            "light.salon_2": {"entity_id": "light.salon_2",
+                              "attributes": {"friendly_name": "Lampadaire Salon"}},
+        }
+
+    @pytest.mark.asyncio
+    async def test_resolve_device_unique_match(self):
+        assert await self.svc.resolve_device("cuisine", "lumière") == "light.cuisine_plafond"
+
+    @pytest.mark.asyncio
+    async def test_resolve_device_ambiguous(self):
+        assert await self.svc.resolve_device("salon", "lampe") is None
+
+    @pytest.mark.asyncio
+    async def test_resolve_device_alias_wins(self):
+        self.svc._aliases = {"salon/lampe": "light.salon_2"}
+        assert await self.svc.resolve_device("salon", "lampe") == "light.salon_2"
+
+    @pytest.mark.asyncio
+    async def test_apply_intent_without_ha(self):
+        result = await self.svc.apply_intent(
+            {"action": "on", "verb": "allume", "room": "cuisine", "device": "lumière"})
+        assert result["ok"] is False
+        assert result["handled"] is True
+        assert result["device_id"] == "ha:light.cuisine_plafond"
+
+    @pytest.mark.asyncio
+    async def test_apply_intent_inflected_verb(self):
+        result = await self.svc.apply_intent(
+            {"action": "off", "verb": "éteindre", "room": "cuisine", "device": "lumière"})
+        assert result["handled"] is True
+
+    @pytest.mark.asyncio
+    async def test_apply_intent_leaves_variations_to_llm(self):
+        result = await self.svc.apply_intent(
+            {"action": "decrease", "verb": "baisse", "room": "cuisine", "device": "lumière"})
+        assert result["handled"] is False
+        assert "device_id" not in result
+
+    @pytest.mark.asyncio
+    async def test_list_devices_invalidates_resolution(self):
+        assert await self.svc.resolve_device("cuisine", "lumière") == "light.cuisine_plafond"
+        self.svc._ha_url, self.svc._ha_token = "http://ha", "t"
+
+        async def _states(endpoint):
+            return [{"entity_id": "light.cuisine_led",
+                     "attributes": {"friendly_name": "LED Cuisine"}, "state": "off"}]
+        self.svc._ha_get = _states
+        self.svc._cache.clear()
+        await self.svc.list_devices()
+        assert await self.svc.resolve_device("cuisine", "lumière") == "light.cuisine_led"
+
+
 # ═══════════════════════════════════════════════════════
 #  Tests NetworkMapService
 # ═══════════════════════════════════════════════════════
@@ -1052,6 +1150,25 @@ class TestEventManager:
         assert state is not None
         assert state["on"] is True
 
+    @pytest.mark.asyncio
+    async def test_poll_loop_wakes_on_new_interval(self):
+        polled = []
+
+        async def _poll(device_id):
+            polled.append(device_id)
+            return None
+
+        self.em.set_poll_function(_poll)
+        await self.em.start_polling()
+        await asyncio.sleep(0.01)
+        assert polled == []
+        # Aucun device : la boucle dort sans échéance, un nouvel intervalle
+        # doit la réveiller immédiatement (pas au prochain tick).
+        self.em.set_poll_interval("dev1", 30)
+        await asyncio.sleep(0.05)
+        await self.em.stop_polling()
+        assert polled == ["dev1"]
+
 
 # ═══════════════════════════════════════════════════════
 #  Tests v2 — ScenarioManager
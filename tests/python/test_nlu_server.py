@@ -121,6 +121,27 @@ class TestRegexNLUEntities:
         r = self.nlu.classify("éteins le chauffage du bureau")
         assert r["entities"].get("action") == "off"
 
+    def test_extract_action_decrease_is_not_off(self):
+        r = self.nlu.classify("baisse le chauffage de la chambre")
+        assert r["entities"].get("action") == "decrease"
+        assert r["entities"].get("verb") == "baisse"
+
+    def test_extract_action_desactive_is_off(self):
+        r = self.nlu.classify("désactive le chauffage du salon")
+        assert r["entities"].get("action") == "off"
+
+    def test_extract_action_infinitive(self):
+        r = self.nlu.classify("peux-tu allumer la lumière du salon")
+        assert r["entities"].get("action") == "on"
+        r = self.nlu.classify("éteindre la lampe de la chambre")
+        assert r["entities"].get("action") == "off"
+
+    def test_extract_action_plural_imperative(self):
+        r = self.nlu.classify("allumez la lumière de la cuisine")
+        assert r["entities"].get("action") == "on"
+        r = self.nlu.classify("fermez le volet de la chambre")
+        assert r["entities"].get("action") == "off"
+
     def test_extract_duration(self):
         # Le regex utilise \b après l'unité → singulier uniquement
         r = self.nlu.classify("mets un minuteur de 5 min")
@@ -89,3 +89,61 @@ class TestSTTConstants:
         except ImportError:
             # La constante peut être définie différemment
             pass
+
+
+class TestSTTProfileBlock:
+    """profile_block — avertissements [PERF] limités en fréquence."""
+
+    def test_warnings_throttled(self, caplog):
+        try:
+            from stt_server import profile_block
+        except ImportError:
+            pytest.skip("profile_block not available")
+
+        @profile_block("slow", threshold_ms=-1, min_interval_s=60.0)
+        def slow():
+            return 1
+
+        with caplog.at_level("WARNING", logger="exo.stt"):
+            for _ in range(10):
+                assert slow() == 1
+        perf = [r for r in caplog.records if "[PERF] slow" in r.getMessage()]
+        assert len(perf) == 1
+
+
+class TestWhisperCppKeepAlive:
+    """Connexion keep-alive vers whisper-server : reconnexion sur socket mort."""
+
+    def test_reconnects_after_connection_aborted(self, monkeypatch):
+        from stt import whisper_cpp
+
+        class _Resp:
+            status = 200
+
+            def read(self):
+                return b'{"text": "bonjour"}'
+
+        class _Conn:
+            instances = []
+
+            def __init__(self, *args, **kwargs):
+                self.closed = False
+                _Conn.instances.append(self)
+
+            def request(self, *args, **kwargs):
+                if len(_Conn.instances) == 1:
+                    # WinError 10053 : socket fermé par le serveur entre deux requêtes
+                    raise ConnectionAbortedError(10053, "aborted")
+
+            def getresponse(self):
+                return _Resp()
+
+            def close(self):
+                self.closed = True
+
+        monkeypatch.setattr(whisper_cpp.http.client, "HTTPConnection", _Conn)
+        engine = whisper_cpp.WhisperCppEngine("model.bin", server_exe="whisper-server")
+        raw = engine._post_inference(b"", {})
+        assert json.loads(raw)["text"] == "bonjour"
+        assert len(_Conn.instances) == 2
+        assert _Conn.instances[0].closed
@@ -48,6 +48,73 @@ class TestPhraseCacheImport:
         assert cache.get("d", "v", "fr") == b"4"
 
 
+class TestSharedPhraseCacheLRU:
+    """shared.cache.PhraseCache — éviction LRU (get rafraîchit l'entrée)."""
+
+    def test_get_refreshes_entry(self):
+        from shared.cache import PhraseCache
+        cache = PhraseCache(max_entries=2)
+        cache.put("ok", "v", "fr", b"1")
+        cache.put("non", "v", "fr", b"2")
+        assert cache.get("ok", "v", "fr") == b"1"
+        cache.put("oui", "v", "fr", b"3")  # évince "non", pas "ok"
+        assert cache.get("non", "v", "fr") is None
+        assert cache.get("ok", "v", "fr") == b"1"
+        assert len(cache) == 2
+
+    def test_long_text_not_cached(self):
+        from shared.cache import PhraseCache
+        cache = PhraseCache()
+        cache.put("x" * 41, "v", "fr", b"1")
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_restart(self, tmp_path):
+        from shared.cache import PhraseCache
+        await PhraseCache(cache_dir=tmp_path).aput("Ok", "v", "fr", b"\x01\x02")
+        cache = PhraseCache(cache_dir=tmp_path)
+        assert len(cache) == 0
+        assert cache.get("Ok", "v", "fr") is None  # get() ne touche pas le disque
+        assert await cache.aget("Ok", "v", "fr") == b"\x01\x02"
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_evicts_oldest_file(self, tmp_path):
+        import os
+        from shared.cache import PhraseCache
+        seed = PhraseCache(cache_dir=tmp_path)
+        await seed.aput("un", "v", "fr", b"1")
+        await seed.aput("deux", "v", "fr", b"2")
+        for i, name in enumerate(("deux", "un")):
+            path = tmp_path / f"{seed.key(name, 'v', 'fr')}.pcm"
+            os.utime(path, (1000 + i, 1000 + i))
+        # Nouveau process : l'ordre LRU initial vient des mtime du répertoire
+        cache = PhraseCache(cache_dir=tmp_path, max_files=2)
+        await cache.aput("trois", "v", "fr", b"3")
+        assert not (tmp_path / f"{cache.key('deux', 'v', 'fr')}.pcm").exists()
+        assert len(list(tmp_path.glob("*.pcm"))) == 2
+        # Une lecture remonte l'entrée : « un » survit à l'élagage suivant
+        cache._cache.clear()
+        assert await cache.aget("un", "v", "fr") == b"1"
+        await cache.aput("quatre", "v", "fr", b"4")
+        assert (tmp_path / f"{cache.key('un', 'v', 'fr')}.pcm").exists()
+        assert not (tmp_path / f"{cache.key('trois', 'v', 'fr')}.pcm").exists()
+
+    def test_client_cache_hit_skips_server(self):
+        import asyncio
+        from shared.cache import PhraseCache
+        from tts.tts_client import TTSClient
+
+        cache = PhraseCache()
+        cache.put("C'est fait", "exo_default", "fr", b"\x00\x00" * 2400)
+        cli = TTSClient(cache=cache)  # jamais connecté : un appel serveur lèverait
+        chunks: list[bytes] = []
+        result = asyncio.run(cli.synthesize("C'est fait", on_chunk=chunks.append))
+        assert result.pcm == b"\x00\x00" * 2400
+        assert result.duration_s == pytest.approx(0.1)
+        assert chunks == [result.pcm]
+
+
 class TestTTSProtocol:
     """Tests du protocole WebSocket TTS."""
 